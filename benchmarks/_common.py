@@ -0,0 +1,51 @@
+"""Helpers shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections.abc import Callable
+from typing import Any
+
+Results = dict[str, Any]
+
+
+def compile_package() -> None:
+    """Byte-compile pbs_installer so that no sample pays for compiling its sources"""
+    import pbs_installer
+
+    compileall.compile_dir(os.path.dirname(pbs_installer.__file__), quiet=1)
+
+
+def run_python(*args: str) -> str:
+    """Run a fresh interpreter with the given arguments and return its stdout"""
+    return subprocess.run(
+        [sys.executable, *args], check=True, capture_output=True, text=True
+    ).stdout
+
+
+def summarize(samples: list[float], unit: str = "ms", scale: float = 1000) -> dict[str, float]:
+    """Summarize samples measured in seconds"""
+    return {
+        f"{unit}_median": statistics.median(samples) * scale,
+        f"{unit}_min": min(samples) * scale,
+        f"{unit}_max": max(samples) * scale,
+    }
+
+
+def main(run: Callable[[int], Results], doc: str, default_runs: int = 20) -> None:
+    """Command line entry point of a single benchmark script, printing its results as JSON"""
+    parser = argparse.ArgumentParser(description=doc.splitlines()[0])
+    parser.add_argument(
+        "--runs", type=int, default=default_runs, help="Fresh interpreters per scenario"
+    )
+    args = parser.parse_args()
+
+    compile_package()
+    json.dump(run(args.runs), sys.stdout, indent=2)
+    print()
@@ -0,0 +1,38 @@
+"""Measure the wall time of `pbs-install` invocations that never hit the network.
+
+Every sample runs in a fresh interpreter, the results are printed as JSON.
+
+Usage: python benchmarks/bench_cli.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+from _common import Results, main, summarize
+
+COMMANDS = {
+    "interpreter": ["-c", "pass"],
+    "help": ["-m", "pbs_installer", "--help"],
+    "list": ["-m", "pbs_installer", "--list"],
+    "dry_run": ["-m", "pbs_installer", "3.12", "-d", "python", "--dry-run"],
+}
+
+
+def measure(args: list[str], runs: int) -> dict[str, float]:
+    times: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def run(runs: int) -> Results:
+    return {name: measure(command, runs) for name, command in COMMANDS.items()}
+
+
+if __name__ == "__main__":
+    main(run, __doc__)
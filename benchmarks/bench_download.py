@@ -0,0 +1,97 @@
+"""Measure the throughput and CPU cost of `download()` against a local HTTP server.
+
+A synthetic file is served from a separate process on 127.0.0.1, so the network is
+never the bottleneck and the results show the per-byte cost of the download loop.
+Every sample downloads it in a fresh interpreter, the results are printed as JSON.
+
+Usage: python benchmarks/bench_download.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import subprocess
+import sys
+from collections.abc import Iterator
+
+from _common import Results, main, run_python, summarize
+
+SIZE = 200 * 1024 * 1024
+
+SERVER = """
+import hashlib, http.server, os, sys
+data = os.urandom(int(sys.argv[1]))
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        view = memoryview(data)
+        for start in range(0, len(view), 1 << 20):
+            self.wfile.write(view[start : start + (1 << 20)])
+
+server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+print(server.server_address[1], hashlib.sha256(data).hexdigest(), flush=True)
+server.serve_forever()
+"""
+
+PROBE = """
+import json, os, sys, tempfile, time
+from pbs_installer import download
+url, checksum, options = sys.argv[1], sys.argv[2], json.loads(sys.argv[3])
+with tempfile.TemporaryDirectory() as tmp:
+    destination = os.path.join(tmp, "archive")
+    download((url, checksum), destination, resume=False, **options)  # warm up the connection
+    wall, cpu = time.perf_counter(), time.process_time()
+    download((url, checksum), destination, resume=False, **options)
+    print(json.dumps({"wall": time.perf_counter() - wall, "cpu": time.process_time() - cpu}))
+"""
+
+SCENARIOS = {
+    "default": {},
+    "chunk_size_8k": {"chunk_size": 8192},
+}
+
+
+@contextlib.contextmanager
+def serve(size: int) -> Iterator[tuple[str, str]]:
+    proc = subprocess.Popen(
+        [sys.executable, "-c", SERVER, str(size)], stdout=subprocess.PIPE, text=True
+    )
+    try:
+        assert proc.stdout is not None
+        port, checksum = proc.stdout.readline().split()
+        yield f"http://127.0.0.1:{port}/archive.tar.gz", checksum
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def run(runs: int) -> Results:
+    results: Results = {}
+    with serve(SIZE) as (url, checksum):
+        for name, options in SCENARIOS.items():
+            wall: list[float] = []
+            cpu: list[float] = []
+            for _ in range(runs):
+                sample = json.loads(run_python("-c", PROBE, url, checksum, json.dumps(options)))
+                wall.append(sample["wall"])
+                cpu.append(sample["cpu"])
+            results[name] = {
+                "mb_per_s": SIZE / 1e6 / min(wall),
+                "wall": summarize(wall),
+                "cpu": summarize(cpu),
+            }
+    return results
+
+
+if __name__ == "__main__":
+    main(run, __doc__, default_runs=5)
@@ -0,0 +1,140 @@
+"""Measure how fast tar archives are unpacked, and the memory it takes, against the
+stdlib `extractall`.
+
+Two synthetic archives are built: one shaped like a python-build-standalone
+install_only build (thousands of small modules in hundreds of directories, a few
+large shared libraries and some symlinks), and a larger `-full` one with a build
+tree, compressed with zstd when it is supported. They are unpacked into a
+directory next to them, so run this on the filesystem you care about, e.g. with
+TMPDIR on a network mount. Every sample unpacks in a fresh interpreter and
+reports its wall time and peak RSS, the results are printed as JSON.
+
+Usage: python benchmarks/bench_extract.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import random
+import tempfile
+
+from _common import Results, main, run_python, summarize
+
+from pbs_installer._utils import ZSTD_SUPPORT, tarfile
+
+# (files, large files, full) of each archive
+ARCHIVES = {
+    "install_only": (6000, 4, False),
+    "full": (20000, 8, True),
+}
+
+PROBE = """
+import json, shutil, sys, time
+archive, destination, method = sys.argv[1:4]
+from pbs_installer._utils import tarfile, unpack_tar
+start = time.perf_counter()
+if method == "extractall":
+    with tarfile.open(archive) as tf:
+        members = tf.getmembers()
+        for member in members:
+            member.name = "/".join(member.name.split("/")[1:])
+        tf.extractall(destination, members=[m for m in members if m.name])
+else:
+    if method.startswith("workers_"):
+        import pbs_installer._extract as extract
+        extract.EXTRACT_WORKERS = int(method[len("workers_"):])
+    unpack_tar(archive, destination, archive)
+elapsed = time.perf_counter() - start
+# ru_maxrss would include the parent process, which this one was forked from
+with open("/proc/self/status") as f:
+    peak = next(int(line.split()[1]) * 1024 for line in f if line.startswith("VmHWM:"))
+shutil.rmtree(destination)
+print(json.dumps({"wall": elapsed, "peak_rss": peak}))
+"""
+
+SCENARIOS = {
+    "install_only": ["extractall", "pbs_installer", "workers_1"],
+    "full": ["extractall", "pbs_installer"],
+}
+
+WORDS = [
+    b"def",
+    b"return",
+    b"self",
+    b"import",
+    b"class",
+    b"None",
+    b"value",
+    b"if",
+    b"else",
+    b"for",
+    b"in",
+    b"data",
+    b"    ",
+    b"\n",
+]
+
+
+def build_archive(path: str, files: int, large_files: int, full: bool) -> int:
+    """Write a synthetic archive to `path` and return its number of files"""
+    rnd = random.Random(0)
+    root = "python/install" if full else "python"
+    count = 0
+    with tarfile.open(path, "w:zst" if path.endswith(".zst") else "w:gz") as tf:
+
+        def add(name: str, data: bytes = b"", mode: int = 0o644, **attrs: object) -> None:
+            info = tarfile.TarInfo(name)
+            info.size, info.mode, info.mtime = len(data), mode, 1700000000
+            for key, value in attrs.items():
+                setattr(info, key, value)
+            tf.addfile(info, io.BytesIO(data) if data else None)
+
+        add(f"{root}/bin", mode=0o755, type=tarfile.DIRTYPE)
+        add(f"{root}/bin/python3.12", rnd.randbytes(16 * 1024), 0o755)
+        add(f"{root}/bin/python3", type=tarfile.SYMTYPE, linkname="python3.12")
+        add(f"{root}/bin/python", type=tarfile.SYMTYPE, linkname="python3.12")
+        for i in range(large_files):
+            add(f"{root}/lib/libpython3.12-{i}.so", rnd.randbytes(8 * 1024 * 1024), 0o755)
+        count += 1 + large_files
+        for i in range(files):
+            if full and i % 3 == 0:
+                name = f"python/build/Objects/dir{i % 50}/object{i}.o"
+            else:
+                name = f"{root}/lib/python3.12/pkg{i % 300}/sub{i % 7}/module{i}.py"
+            size = int(rnd.lognormvariate(8.5, 1.2))
+            add(name, b" ".join(rnd.choices(WORDS, k=size // 4)))
+            count += 1
+        if full:
+            add("python/PYTHON.json", b"{}")
+            count += 1
+    return count
+
+
+def run(runs: int) -> Results:
+    results: Results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind, (files, large_files, full) in ARCHIVES.items():
+            suffix = ".tar.zst" if full and ZSTD_SUPPORT else ".tar.gz"
+            archive = os.path.join(tmp, f"cpython-3.12.0-{kind}{suffix}")
+            count = build_archive(archive, files, large_files, full)
+            results[kind] = {}
+            for method in SCENARIOS[kind]:
+                wall: list[float] = []
+                peak: list[int] = []
+                for _ in range(runs):
+                    destination = os.path.join(tmp, "python")
+                    sample = json.loads(run_python("-c", PROBE, archive, destination, method))
+                    wall.append(sample["wall"])
+                    peak.append(sample["peak_rss"])
+                results[kind][method] = {
+                    "files_per_s": count / min(wall),
+                    "wall": summarize(wall),
+                    "peak_rss_mib": max(peak) / 1024 / 1024,
+                }
+    return results
+
+
+if __name__ == "__main__":
+    main(run, __doc__, default_runs=5)
@@ -0,0 +1,118 @@
+"""Compare the cost of loading the version table from the binary index
+against importing it as the legacy generated dict literal.
+
+Every sample runs in a fresh interpreter, the results are printed as JSON.
+
+Usage: python benchmarks/bench_index.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import os
+import py_compile
+import statistics
+import tempfile
+
+from _common import Results, main, run_python
+
+PROBE = """
+import os, sys, time
+sys.path.insert(0, {path!r})
+import pbs_installer._utils
+
+def rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+before = rss()
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, rss() - before)
+"""
+
+SCENARIOS = {
+    "legacy_module": "import legacy_versions",
+    "index_load": "from pbs_installer._index import get_index; get_index()",
+    "index_resolve": (
+        "from pbs_installer import get_download_link; get_download_link('3.12', 'x86_64', 'linux')"
+    ),
+    # Build every lookup table and decode every record, as a long-running process would
+    "index_warm": (
+        "from pbs_installer._index import get_index; from pbs_installer import VersionRequest\n"
+        "index = get_index()\n"
+        "for impl, ft, platform, arch, install_only in index.groups():\n"
+        "    index.lookup(VersionRequest(impl, 3, freethreaded=ft), platform, arch, install_only)\n"
+        "urls = [python_file for _, _, python_file in index.items()]"
+    ),
+}
+
+
+def measure_heap() -> dict[str, int]:
+    """Measure the Python heap retained by the index, against the legacy dict"""
+    import tracemalloc
+
+    from pbs_installer import VersionRequest
+    from pbs_installer._index import INDEX_FILE, VersionIndex, get_index
+
+    tracemalloc.start()
+    legacy = get_index().to_dict()
+    legacy_bytes = tracemalloc.get_traced_memory()[0]
+    del legacy
+    tracemalloc.stop()
+
+    with open(INDEX_FILE, "rb") as f:
+        data = f.read()
+    tracemalloc.start()
+    index = VersionIndex(data)
+    for impl, freethreaded, platform, arch, install_only in index.groups():
+        index.lookup(
+            VersionRequest(impl, 3, freethreaded=freethreaded), platform, arch, install_only
+        )
+    index_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {
+        "file_bytes": len(data),
+        "legacy_heap_bytes": legacy_bytes,
+        "index_heap_bytes": index_bytes,
+    }
+
+
+def write_legacy_module(directory: str) -> None:
+    """Render the table the way `_versions.py` used to ship it and byte-compile it"""
+    from pbs_installer._index import get_index
+
+    path = os.path.join(directory, "legacy_versions.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("from pbs_installer._utils import PythonVersion\n")
+        f.write("PYTHON_VERSIONS = {\n")
+        for py_ver, urls in get_index().to_dict().items():
+            f.write(f"    PythonVersion{tuple(py_ver)!r}: {urls!r},\n")
+        f.write("}\n")
+    py_compile.compile(path)
+
+
+def measure(code: str, path: str, runs: int) -> dict[str, float]:
+    times: list[float] = []
+    sizes: list[int] = []
+    for _ in range(runs):
+        elapsed, rss = run_python("-c", PROBE.format(path=path, code=code)).split()
+        times.append(float(elapsed))
+        sizes.append(int(rss))
+    return {
+        "time_ms_median": statistics.median(times) * 1000,
+        "time_ms_min": min(times) * 1000,
+        "rss_kib_median": statistics.median(sizes) / 1024,
+    }
+
+
+def run(runs: int) -> Results:
+    with tempfile.TemporaryDirectory() as tmp:
+        write_legacy_module(tmp)
+        results: Results = {name: measure(code, tmp, runs) for name, code in SCENARIOS.items()}
+    results["memory"] = measure_heap()
+    return results
+
+
+if __name__ == "__main__":
+    main(run, __doc__)
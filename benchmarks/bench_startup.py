@@ -0,0 +1,53 @@
+"""Measure the import and resolution costs paid by a short-lived process.
+
+Every sample runs in a fresh interpreter, the results are printed as JSON.
+
+Usage: python benchmarks/bench_startup.py [--runs N]
+"""
+
+from __future__ import annotations
+
+import json
+
+from _common import Results, main, run_python, summarize
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+import pbs_installer
+imported = time.perf_counter()
+pbs_installer.get_download_link("3.12", "x86_64", "linux")
+first = time.perf_counter()
+for _ in range(1000):
+    pbs_installer.get_download_link("3.12", "x86_64", "linux")
+warm = (time.perf_counter() - first) / 1000
+from pbs_installer._utils import get_available_arch_platforms
+start_platforms = time.perf_counter()
+get_available_arch_platforms()
+platforms = time.perf_counter() - start_platforms
+print(json.dumps({
+    "import": imported - start,
+    "first_get_download_link": first - imported,
+    "warm_get_download_link": warm,
+    "get_available_arch_platforms": platforms,
+}))
+"""
+
+
+def run(runs: int) -> Results:
+    samples: dict[str, list[float]] = {}
+    for _ in range(runs):
+        for name, value in json.loads(run_python("-c", PROBE)).items():
+            samples.setdefault(name, []).append(value)
+    return {
+        "import": summarize(samples["import"]),
+        "first_get_download_link": summarize(samples["first_get_download_link"]),
+        "warm_get_download_link": summarize(samples["warm_get_download_link"], "us", 1e6),
+        "get_available_arch_platforms": summarize(
+            samples["get_available_arch_platforms"], "us", 1e6
+        ),
+    }
+
+
+if __name__ == "__main__":
+    main(run, __doc__)
@@ -0,0 +1,78 @@
+"""Run the benchmark suite and write the results as JSON.
+
+Usage: python benchmarks/run.py [--runs N] [-o results.json] [--compare baseline.json] [names...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from _common import Results, compile_package
+
+BENCHMARKS = ["startup", "cli", "index", "download", "extract"]
+
+
+def flatten(results: Results, prefix: str = "") -> dict[str, float]:
+    flat: dict[str, float] = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)):
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def compare(baseline: Results, current: Results) -> None:
+    """Print the relative change of every metric found in both runs"""
+    old, new = flatten(baseline["results"]), flatten(current["results"])
+    width = max(map(len, new), default=0)
+    for key, value in new.items():
+        if key not in old:
+            continue
+        change = (value - old[key]) / old[key] * 100 if old[key] else 0.0
+        print(f"{key:<{width}}  {old[key]:>12.3f} -> {value:>12.3f}  ({change:+.1f}%)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run, from {', '.join(BENCHMARKS)}")
+    parser.add_argument("--runs", type=int, default=20, help="Fresh interpreters per scenario")
+    parser.add_argument("-o", "--output", type=Path, help="Write the results to this file")
+    parser.add_argument("--compare", type=Path, help="Compare against a previous results file")
+    args = parser.parse_args()
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    compile_package()
+    results: dict[str, Any] = {}
+    for name in args.names or BENCHMARKS:
+        print(f"Running {name}...", file=sys.stderr)
+        module = importlib.import_module(f"bench_{name}")
+        results[name] = module.run(args.runs)
+
+    report = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "runs": args.runs,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        compare(json.loads(args.compare.read_text()), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,8 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import hashlib
+import io
 import itertools
 import os
 import re
@@ -25,6 +27,9 @@ from urllib.parse import unquote
 import httpx
 from httpx import HTTPStatusError
 
+from pbs_installer._index import dump_index
+from pbs_installer._utils import PythonVersion
+
 if TYPE_CHECKING:
     from typing import Self
 
@@ -426,24 +431,63 @@ def build_map(
     return versions
 
 
-def render(downloads: list[PythonDownload], file: IO[str] | None = None):
-    """Render python versions file."""
+def to_python_versions(
+    downloads: list[PythonDownload],
+) -> dict[PythonVersion, dict[tuple[str, str, bool], tuple[str, str | None]]]:
+    return {
+        PythonVersion(impl, version.major, version.minor, version.patch, freethreaded): {
+            tuple(key): value for key, value in item.items()
+        }
+        for (impl, version, freethreaded), item in build_map(downloads).items()
+    }
+
+
+def render(
+    versions: dict[PythonVersion, dict[tuple[str, str, bool], tuple[str, str | None]]],
+    generation: str,
+    file: IO[str] | None = None,
+):
+    """Render python versions file.
+
+    The table itself lives in the binary index, the module only exposes it lazily.
+    """
 
     def write(line: str) -> None:
         print(line, file=file)
 
+    archs = sorted({arch for urls in versions.values() for _, arch, _ in urls})
+    platforms = sorted({platform for urls in versions.values() for platform, _, _ in urls})
+    implementations = sorted({version.implementation for version in versions})
+
     write("# @Generated by find_versions.py. DO NOT EDIT.")
     write("from __future__ import annotations")
-    write("from ._utils import PythonVersion")
-    write(
-        "PYTHON_VERSIONS: dict[PythonVersion, dict[tuple[str, str, bool], tuple[str, str | None]]] = {"
-    )
-
-    for key, item in build_map(downloads).items():
-        write(
-            f"    PythonVersion('{key[0]}', {key[1].major}, {key[1].minor}, {key[1].patch}, {key[2]}): {item!r},"
-        )
-    write("}")
+    write("from typing import TYPE_CHECKING, Any")
+    write("# Summary of the version table, available without loading the index")
+    write(f"ARCHS = {tuple(archs)!r}")
+    write(f"PLATFORMS = {tuple(platforms)!r}")
+    write(f"IMPLEMENTATIONS = {tuple(implementations)!r}")
+    write("# Identifies the content of the index, resolutions are cached under it")
+    write(f"GENERATION = {generation!r}")
+    write("if TYPE_CHECKING:")
+    write("    from ._install import PythonFile")
+    write("    from ._utils import PythonVersion")
+    write("    PYTHON_VERSIONS: dict[PythonVersion, dict[tuple[str, str, bool], PythonFile]]")
+    write("def __getattr__(name: str) -> Any:")
+    write("    if name == 'PYTHON_VERSIONS':")
+    write("        from ._index import get_index")
+    write("        value = get_index().to_dict()")
+    write("        globals()[name] = value")
+    write("        return value")
+    write("    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')")
+
+
+def render_index(
+    versions: dict[PythonVersion, dict[tuple[str, str, bool], tuple[str, str | None]]],
+) -> bytes:
+    """Render the binary version index."""
+    buffer = io.BytesIO()
+    dump_index(versions, buffer)
+    return buffer.getvalue()
 
 
 async def main():
@@ -475,9 +519,15 @@ async def main():
             log(f"Finding {finder.implementation} downloads...")
             downloads.extend(await finder.find())
 
+    versions = to_python_versions(downloads)
+    index = render_index(versions)
+    generation = hashlib.sha256(index).hexdigest()[:16]
     cm = open(output, "w", encoding="utf-8") if output else contextlib.nullcontext()
     with cm as file:
-        render(downloads, file)
+        render(versions, generation, file)
+    if output:
+        with open(os.path.splitext(output)[0] + ".bin", "wb") as f:
+            f.write(index)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,43 @@
 Core functions for the PBS Installer.
 """
 
-from ._install import download, get_download_link, install, install_file
-from ._utils import PythonVersion
+from ._install import (
+    DownloadMatrix,
+    ResolutionCacheInfo,
+    adownload,
+    ainstall,
+    clear_resolution_cache,
+    download,
+    get_download_link,
+    get_download_links,
+    install,
+    install_file,
+    iter_download_links,
+    resolution_cache_info,
+)
+from ._progress import ProgressEvent
+from ._retry import DownloadResult, RetryPolicy
+from ._session import Session
+from ._utils import PythonVersion, VersionRequest, VersionSpecifier
 
-__all__ = ["install", "download", "get_download_link", "install_file", "PythonVersion"]
+__all__ = [
+    "install",
+    "download",
+    "ainstall",
+    "adownload",
+    "get_download_link",
+    "get_download_links",
+    "iter_download_links",
+    "install_file",
+    "PythonVersion",
+    "VersionRequest",
+    "VersionSpecifier",
+    "DownloadMatrix",
+    "resolution_cache_info",
+    "clear_resolution_cache",
+    "ResolutionCacheInfo",
+    "Session",
+    "RetryPolicy",
+    "DownloadResult",
+    "ProgressEvent",
+]
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import logging
+import sys
 from argparse import SUPPRESS, Action, ArgumentParser, Namespace
 from collections.abc import Sequence
-from typing import Any
+from typing import TYPE_CHECKING, Any, TextIO
 
-from ._install import install
-from ._utils import get_available_arch_platforms
+from ._profiles import PROFILES
+from ._versions import ARCHS, PLATFORMS
+
+if TYPE_CHECKING:
+    from ._progress import ProgressEvent
 
 
 def _setup_logger(verbose: bool) -> None:
@@ -17,6 +21,50 @@ def _setup_logger(verbose: bool) -> None:
     logger.setLevel(logging.DEBUG if verbose else logging.WARNING)
 
 
+def _format_size(size: float) -> str:
+    return f"{size / 1024**2:.1f} MiB"
+
+
+class ProgressBar:
+    """Render the progress events of an install as a single line on a terminal."""
+
+    WIDTH = 30
+    LABELS = {
+        "resolve": "Resolving the version",
+        "connect": "Connecting",
+        "verify": "Verifying the checksum",
+        "extract": "Extracting",
+    }
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+        self._length = 0
+
+    def __call__(self, event: ProgressEvent) -> None:
+        if event.phase != "download":
+            line = f"{self.LABELS[event.phase]}..."
+        elif event.total:
+            fraction = min(event.received / event.total, 1.0)
+            filled = int(fraction * self.WIDTH)
+            line = (
+                f"[{'#' * filled}{'-' * (self.WIDTH - filled)}] {fraction:4.0%} "
+                f"{_format_size(event.received)}/{_format_size(event.total)} "
+                f"{_format_size(event.speed)}/s"
+            )
+        else:
+            line = f"Downloading {_format_size(event.received)} {_format_size(event.speed)}/s"
+        # Pad with spaces to overwrite the rest of a longer previous line
+        self.stream.write(f"\r{line:<{self._length}}")
+        self.stream.flush()
+        self._length = len(line)
+
+    def close(self) -> None:
+        if self._length:
+            self.stream.write("\n")
+            self.stream.flush()
+            self._length = 0
+
+
 class ListAction(Action):
     def __init__(
         self,
@@ -47,11 +95,11 @@ class ListAction(Action):
 
 
 def main() -> None:
-    archs, platforms = get_available_arch_platforms()
     parser = ArgumentParser("pbs-install", description="Installer for Python Build Standalone")
     install_group = parser.add_argument_group("Install Arguments")
     install_group.add_argument(
-        "version", help="The version of Python to install, e.g. 3.14, 3.10.4, pypy@3.10"
+        "version",
+        help="The version of Python to install, e.g. 3.14, 3.10.4, pypy@3.10, '>=3.10,<3.13'",
     )
     install_group.add_argument(
         "--version-dir", help="Install to a subdirectory named by the version", action="store_true"
@@ -60,29 +108,122 @@ def main() -> None:
         "--build-dir", help="Include the build directory", action="store_true"
     )
     install_group.add_argument(
-        "-d", "--destination", help="The directory to install to", required=True
+        "-d", "--destination", help="The directory to install to, required unless --dry-run"
+    )
+    install_group.add_argument("--arch", choices=ARCHS, help="Override the architecture to install")
+    install_group.add_argument(
+        "--platform", choices=PLATFORMS, help="Override the platform to install"
+    )
+    install_group.add_argument(
+        "--cache-dir",
+        help="Cache downloaded archives in this directory, defaults to $PBS_INSTALLER_CACHE_DIR",
+    )
+    install_group.add_argument(
+        "--mirror",
+        dest="mirrors",
+        action="append",
+        metavar="PREFIX=REPLACEMENT",
+        help="Download from a mirror by replacing the url prefix PREFIX with REPLACEMENT, "
+        "can be repeated, defaults to $PBS_INSTALLER_MIRRORS",
     )
-    install_group.add_argument("--arch", choices=archs, help="Override the architecture to install")
     install_group.add_argument(
-        "--platform", choices=platforms, help="Override the platform to install"
+        "--hedge-after",
+        type=float,
+        metavar="SECONDS",
+        help="Send a second request to another mirror or connection if the server hasn't "
+        "responded within SECONDS, and continue with whichever responds first",
+    )
+    install_group.add_argument(
+        "--retries",
+        type=int,
+        metavar="N",
+        help="Retry a download that fails with a temporary error up to N times per url, "
+        "defaults to 2",
+    )
+    install_group.add_argument(
+        "--stream",
+        action="store_true",
+        help="Extract the archive while it is downloaded",
+    )
+    install_group.add_argument(
+        "--profile",
+        choices=list(PROFILES),
+        default="full",
+        help="The files to install: everything (full), without the test suites and static "
+        "libraries (runtime), or also without IDLE, Tcl/Tk and the ensurepip wheels (minimal)",
+    )
+    install_group.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Install the paths matching GLOB even if the profile or --exclude skips them, "
+        "can be repeated",
+    )
+    install_group.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="GLOB",
+        help="Skip the paths matching GLOB, relative to the destination, can be repeated",
+    )
+    install_group.add_argument(
+        "--dry-run",
+        help="Only resolve and print the download URL without installing",
+        action="store_true",
     )
     parser.add_argument("-v", "--verbose", help="Enable verbose logging", action="store_true")
     parser.add_argument("-l", "--list", action=ListAction, help="List installable versions")
 
     args = parser.parse_args()
+    # Defer the heavier imports until there is something to resolve
+    from ._install import THIS_ARCH, THIS_PLATFORM, get_download_link, install
+    from ._mirrors import parse_mirrors
+    from ._retry import RetryPolicy
+    from ._utils import parse_request
+
+    if args.mirrors:
+        try:
+            parse_mirrors(args.mirrors)
+        except ValueError as e:
+            parser.error(str(e))
+    if args.retries is not None and args.retries < 0:
+        parser.error("--retries must not be negative")
+    if args.destination is None and not args.dry_run:
+        parser.error("the following arguments are required: -d/--destination")
     _setup_logger(args.verbose)
-    impl, has_amp, version = args.version.rpartition("@")
-    if not has_amp:
-        impl = "cpython"
-    install(
-        version,
-        args.destination,
-        version_dir=args.version_dir,
-        arch=args.arch,
-        platform=args.platform,
-        implementation=impl,
-        build_dir=args.build_dir,
-    )
+    request = parse_request(args.version)
+    if args.dry_run:
+        ver, (url, _) = get_download_link(
+            request,
+            arch=args.arch or THIS_ARCH,
+            platform=args.platform or THIS_PLATFORM,
+            build_dir=args.build_dir,
+        )
+        print(f"{ver}: {url}")
+        return
+    progress = ProgressBar(sys.stderr) if sys.stderr.isatty() else None
+    try:
+        install(
+            request,
+            args.destination,
+            version_dir=args.version_dir,
+            arch=args.arch,
+            platform=args.platform,
+            build_dir=args.build_dir,
+            cache_dir=args.cache_dir,
+            mirrors=args.mirrors,
+            hedge_after=args.hedge_after,
+            retry=RetryPolicy(max_attempts=args.retries + 1) if args.retries is not None else None,
+            progress=progress,
+            stream=args.stream,
+            profile=args.profile,
+            include=args.include,
+            exclude=args.exclude,
+        )
+    finally:
+        if progress is not None:
+            progress.close()
     print("Done!")
 
 
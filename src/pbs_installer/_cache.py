@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import re
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from _typeshed import StrPath
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "PBS_INSTALLER_CACHE_DIR"
+CACHE_SIZE_ENV = "PBS_INSTALLER_CACHE_SIZE"
+DEFAULT_CACHE_SIZE = 5 * 1024**3
+# Partial downloads that haven't been touched for this long are removed when pruning
+STALE_PARTIAL_AGE = 7 * 24 * 3600
+_ENTRY_RE = re.compile(r"[0-9a-f]{64}")
+_SIZE_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([KMGT]?)i?B?", re.IGNORECASE)
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_size(value: str) -> int:
+    """Parse a size like `500M` or `5GiB` into a number of bytes.
+
+    Raises:
+        ValueError: If the value is not a valid size
+    """
+    match = _SIZE_RE.fullmatch(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid size: {value!r}")
+    number, unit = match.groups()
+    return int(float(number) * _SIZE_UNITS[unit.upper()])
+
+
+class FileLock:
+    """An exclusive lock on a file across processes, released when the process dies."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fd: int | None = None
+
+    def acquire(self) -> None:
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+
+                while True:
+                    try:
+                        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                        break
+                    except OSError:
+                        time.sleep(0.1)
+            else:
+                import fcntl
+
+                fcntl.flock(fd, fcntl.LOCK_EX)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> FileLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+
+class DownloadCache:
+    """A directory of downloaded archives, each stored under its SHA-256.
+
+    The URLs of the builds are immutable, so an archive with a known checksum never
+    has to be downloaded twice. Entries are evicted in least recently used order
+    once the directory grows beyond `max_size` bytes.
+    """
+
+    def __init__(self, root: StrPath, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        self.root = os.fspath(root)
+        self.max_size = max_size
+
+    def path(self, checksum: str) -> str:
+        return os.path.join(self.root, checksum.lower())
+
+    def get(self, checksum: str) -> str | None:
+        """Return the path of the cached archive, or None if it isn't cached."""
+        path = self.path(checksum)
+        try:
+            # Access times are unreliable (noatime), the mtime tracks the last use instead
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            # e.g. a read-only cache shared between users, the archive is still usable
+            if not os.path.isfile(path):
+                return None
+            logger.debug("Can't record the use of %s: %s", path, e)
+        logger.debug("Using cached archive %s", path)
+        return path
+
+    def fetch(self, checksum: str, download: Callable[[str, bool], object]) -> str:
+        """Return the path of the cached archive, downloading it first on a miss.
+
+        Parameters:
+            checksum: The SHA-256 of the archive
+            download: Called with (destination, resume) to download and verify the
+                archive. Partial downloads are kept in the cache and resumed on the next miss.
+        """
+        cached = self.get(checksum)
+        if cached is not None:
+            return cached
+        path = self.path(checksum)
+        os.makedirs(self.root, exist_ok=True)
+        # Another process may be downloading the same archive, wait for it instead.
+        with FileLock(path + ".lock"):
+            cached = self.get(checksum)
+            if cached is not None:
+                return cached
+            download(path, True)
+        self.prune(keep=path)
+        return path
+
+    async def afetch(
+        self, checksum: str, download: Callable[[str, bool], Awaitable[object]]
+    ) -> str:
+        """The asynchronous version of `fetch`, waiting for the lock in the default executor."""
+        import asyncio
+
+        cached = self.get(checksum)
+        if cached is not None:
+            return cached
+        path = self.path(checksum)
+        os.makedirs(self.root, exist_ok=True)
+        lock = FileLock(path + ".lock")
+        acquiring = asyncio.get_running_loop().run_in_executor(None, lock.acquire)
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The executor can't be interrupted, release the lock once it is acquired
+            acquiring.add_done_callback(lambda _: lock.release())
+            raise
+        try:
+            cached = self.get(checksum)
+            if cached is not None:
+                return cached
+            await download(path, True)
+        finally:
+            lock.release()
+        self.prune(keep=path)
+        return path
+
+    def prune(self, keep: str | None = None) -> None:
+        """Evict the least recently used archives until the cache fits in `max_size`.
+
+        Lock files are neither counted nor removed, another process may be waiting
+        on the lock of an evicted archive to download it again."""
+        entries: list[tuple[float, int, str]] = []
+        now = time.time()
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.name.endswith(".lock"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if _ENTRY_RE.fullmatch(entry.name):
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                elif entry.name.endswith(".part") and now - stat.st_mtime > STALE_PARTIAL_AGE:
+                    logger.debug("Removing stale partial download %s", entry.path)
+                    with contextlib.suppress(OSError):
+                        os.remove(entry.path)
+                        os.remove(entry.path + ".json")
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            if path == keep:
+                continue
+            logger.debug("Evicting %s from the download cache", path)
+            with contextlib.suppress(OSError):
+                os.remove(path)
+                total -= size
+
+
+def get_cache(cache_dir: StrPath | None = None) -> DownloadCache | None:
+    """The download cache to use, if any.
+
+    Without `cache_dir`, the `PBS_INSTALLER_CACHE_DIR` environment variable is used.
+    The size limit is read from `PBS_INSTALLER_CACHE_SIZE`, e.g. `10G`.
+    """
+    if cache_dir is None:
+        cache_dir = os.getenv(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    max_size = os.getenv(CACHE_SIZE_ENV)
+    return DownloadCache(
+        os.path.expanduser(cache_dir), parse_size(max_size) if max_size else DEFAULT_CACHE_SIZE
+    )
@@ -0,0 +1,1130 @@
+"""The streaming part of `download`, kept apart from the public API so that
+importing `pbs_installer` doesn't pay for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, BinaryIO, Union
+
+from ._progress import PROGRESS_INTERVAL, ProgressTracker
+from ._retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from concurrent.futures import Future
+
+    import httpx
+    from _typeshed import StrPath
+
+    # A buffer to hash and the buffer to recycle afterwards, a checkpoint, or the end
+    _HashItem = Union[tuple[Union[bytes, memoryview], Union[bytearray, None]], int, None]
+    # Receives every piece of the file with its offset, as it is written
+    Tee = Callable[[int, Union[bytes, memoryview]], object]
+
+logger = logging.getLogger(__name__)
+
+# The size of the buffer the received data is gathered in before it is hashed and written
+CHUNK_SIZE = 1024 * 1024
+# How many bytes may be received between two checkpoints of the partial file
+CHECKPOINT_INTERVAL = 4 * 1024 * 1024
+# How many buffers may wait for the hashing thread
+HASH_QUEUE_DEPTH = 4
+# Segmented downloads: a range is only split when both halves get at least this much
+MIN_SEGMENT_SIZE = 1024 * 1024
+# How often the throughput is sampled to decide whether to open another connection
+SAMPLE_INTERVAL = 0.5
+# The relative throughput gain an extra connection must bring to keep growing
+SEGMENT_GAIN = 0.1
+# How long a download may take to get up to speed before its speed is checked
+SLOW_DOWNLOAD_GRACE = 10.0
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".part.json"
+
+
+class ChecksumMismatch(RuntimeError):
+    """The downloaded data doesn't match the expected SHA-256"""
+
+
+class SlowDownload(Exception):
+    """The server sends the data slower than `SLOW_MIRROR_SPEED`"""
+
+
+def _hash_file(f: BinaryIO, start: int, end: int, hasher: hashlib._Hash) -> None:
+    f.seek(start)
+    remaining = end - start
+    while remaining:
+        chunk = f.read(min(remaining, CHECKPOINT_INTERVAL))
+        if not chunk:
+            break
+        hasher.update(chunk)
+        remaining -= len(chunk)
+
+
+def _preallocate(f: BinaryIO, size: int) -> None:
+    f.flush()
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+            return
+        except OSError:  # not supported by the filesystem
+            pass
+    f.truncate(size)
+
+
+class _SpeedWatchdog:
+    """Raise `SlowDownload` when the average speed falls below `min_speed` after the grace period."""
+
+    def __init__(self, min_speed: float) -> None:
+        self.min_speed = min_speed
+        self.received = 0
+        self.started = time.monotonic()
+        self._check_at = self.started + SLOW_DOWNLOAD_GRACE
+
+    def update(self, size: int) -> None:
+        self.received += size
+        now = time.monotonic()
+        if now >= self._check_at:
+            speed = self.received / (now - self.started)
+            if speed < self.min_speed:
+                raise SlowDownload(f"Receiving only {speed / 1024:.0f} KiB/s")
+            self._check_at = now + 1.0
+
+
+class PartialDownload:
+    """A `<destination>.part` file together with the sidecar that describes it.
+
+    The sidecar records the url, the expected checksum, the number of bytes
+    received, the SHA-256 of those bytes and the validator (ETag or Last-Modified)
+    of the response they came from. The file is only trusted up to the last
+    checkpoint: anything written after it is truncated away when the download is
+    resumed. Data with a known checksum can be resumed from another url, e.g. a
+    mirror, since the checksum is verified at the end anyway.
+    """
+
+    def __init__(self, destination: StrPath, url: str, checksum: str | None = None) -> None:
+        self.destination = os.fspath(destination)
+        self.url = url
+        self.checksum = checksum
+        self.path = self.destination + PART_SUFFIX
+        self.state_path = self.destination + STATE_SUFFIX
+
+    def restore(self) -> tuple[int, hashlib._Hash, str | None]:
+        """Return the (offset, hasher, validator) to continue the download from.
+
+        A partial file that doesn't match its sidecar is discarded and the
+        download starts over from the first byte.
+        """
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+            received = int(state["received"])
+            validator = state.get("validator")
+            if state["url"] != self.url:
+                if not self.checksum or state.get("checksum") != self.checksum:
+                    raise ValueError("stale partial download")
+                # The validator belongs to the other url
+                validator = None
+            if os.path.getsize(self.path) < received:
+                raise ValueError("truncated partial download")
+            # hashlib objects can't be persisted, so the prefix is hashed again.
+            hasher = hashlib.sha256()
+            with open(self.path, "r+b") as f:
+                f.truncate(received)
+                _hash_file(f, 0, received, hasher)
+            if hasher.hexdigest() != state["sha256"]:
+                raise ValueError("corrupted partial download")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            if os.path.exists(self.path) or os.path.exists(self.state_path):
+                logger.debug("Discarding partial download %s: %s", self.path, e)
+            self.discard()
+            return 0, hashlib.sha256(), None
+        logger.debug("Resuming %s from byte %d", self.url, received)
+        return received, hasher, validator
+
+    def checkpoint(self, received: int, hasher: hashlib._Hash, validator: str | None) -> None:
+        """Record that the first `received` bytes of the partial file are final."""
+        state = {
+            "url": self.url,
+            "checksum": self.checksum,
+            "received": received,
+            "sha256": hasher.copy().hexdigest(),
+            "validator": validator,
+        }
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+    def discard(self) -> None:
+        for path in (self.path, self.state_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def commit(self) -> None:
+        """Move the completed file to the destination and drop the sidecar."""
+        os.replace(self.path, self.destination)
+        try:
+            os.remove(self.state_path)
+        except FileNotFoundError:
+            pass
+
+
+def _validator(resp: httpx.Response) -> str | None:
+    # If-Range only accepts strong validators
+    etag: str | None = resp.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    last_modified: str | None = resp.headers.get("Last-Modified")
+    return last_modified
+
+
+def _range_total(resp: httpx.Response) -> int | None:
+    """The full size of the resource if `resp` is a partial response, otherwise None."""
+    if resp.status_code != 206:
+        return None
+    content_range: str = resp.headers.get("Content-Range", "")
+    _, _, total = content_range.rpartition("/")
+    return int(total) if total.isdigit() else None
+
+
+class _Sink:
+    """Write the body of a response and hash it on a dedicated thread.
+
+    The network delivers the body in small pieces, they are gathered in buffers of
+    `buffer_size` bytes. Every full buffer is written by the calling thread and then
+    queued for the hashing thread, so SHA-256 runs alongside the network reads. At most
+    `HASH_QUEUE_DEPTH` buffers wait for the hasher, which bounds the memory used.
+    Checkpoints of the partial file go through the same queue, so the recorded digest
+    always matches the recorded size. Each written piece is also passed to `tee`.
+    """
+
+    def __init__(
+        self,
+        f: BinaryIO,
+        hasher: hashlib._Hash,
+        received: int,
+        part: PartialDownload | None,
+        validator: str | None,
+        buffer_size: int = CHUNK_SIZE,
+        tee: Tee | None = None,
+    ) -> None:
+        self.f = f
+        self.hasher = hasher
+        self.received = self._checkpointed = received
+        self.part = part
+        self.validator = validator
+        self.tee = tee
+        self._buffer_size = buffer_size
+        self._allocated = 0
+        self._free: queue.SimpleQueue[bytearray] = queue.SimpleQueue()
+        self._queue: queue.Queue[_HashItem] = queue.Queue(HASH_QUEUE_DEPTH)
+        self._error: BaseException | None = None
+        self._buffer = self._take_buffer()
+        self._filled = 0
+        if part is not None:
+            part.checkpoint(received, hasher, validator)
+        self._thread: threading.Thread | None = None
+        # On a single core the thread has nothing to overlap with, only overhead
+        if (os.cpu_count() or 1) > 1:
+            self._thread = threading.Thread(
+                target=self._hash, name="pbs-installer-hash", daemon=True
+            )
+            self._thread.start()
+
+    def _take_buffer(self) -> bytearray:
+        try:
+            return self._free.get_nowait()
+        except queue.Empty:
+            pass
+        # One buffer is being filled while the others wait in the queue
+        if self._allocated <= HASH_QUEUE_DEPTH:
+            self._allocated += 1
+            return bytearray(self._buffer_size)
+        return self._free.get()
+
+    def _hash(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            self._process(item)
+
+    def _process(self, item: _HashItem) -> None:
+        if self._error is None:
+            try:
+                if isinstance(item, int):
+                    assert self.part is not None
+                    self.part.checkpoint(item, self.hasher, self.validator)
+                elif item is not None:
+                    self.hasher.update(item[0])
+            except BaseException as e:
+                self._error = e
+        if isinstance(item, tuple) and item[1] is not None:
+            self._free.put(item[1])
+
+    def _submit(self, item: _HashItem) -> None:
+        if self._thread is None:
+            self._process(item)
+        else:
+            self._queue.put(item)
+
+    def write(self, data: bytes) -> None:
+        size = len(data)
+        filled = self._filled
+        if filled + size <= self._buffer_size:
+            self._buffer[filled : filled + size] = data
+            self._filled = filled + size
+            return
+        self.flush()
+        if size < self._buffer_size:
+            self._buffer[:size] = data
+            self._filled = size
+        else:
+            self._consume(data, None)
+
+    def flush(self) -> None:
+        filled, self._filled = self._filled, 0
+        if filled:
+            buffer = self._buffer
+            self._consume(memoryview(buffer)[:filled], buffer)
+            self._buffer = self._take_buffer()
+
+    def _consume(self, data: bytes | memoryview, buffer: bytearray | None) -> None:
+        self.f.write(data)
+        if self.tee is not None:
+            self.tee(self.received, data)
+        self.received += len(data)
+        self._submit((data, buffer))
+        if self.part is not None and self.received - self._checkpointed >= CHECKPOINT_INTERVAL:
+            self.checkpoint()
+
+    def checkpoint(self) -> None:
+        self.flush()
+        if self.part is not None:
+            self.f.flush()
+            self._submit(self.received)
+            self._checkpointed = self.received
+
+    def close(self) -> None:
+        """Wait for the hashing thread to catch up, raising the error it ran into if any."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def abort(self) -> None:
+        """Checkpoint what was received so far and stop, when the download failed."""
+        with contextlib.suppress(Exception):
+            self.checkpoint()
+            self.close()
+
+
+def _content_length(resp: httpx.Response) -> int | None:
+    """The number of bytes the body will have on disk, if the response tells."""
+    length: str = resp.headers.get("Content-Length", "")
+    if not length.isdigit() or resp.headers.get("Content-Encoding", "identity") != "identity":
+        return None
+    return int(length)
+
+
+def _file_size(resp: httpx.Response) -> int | None:
+    """The full size of the resource `resp` is (part of), if known."""
+    if resp.status_code == 206:
+        return _range_total(resp)
+    return _content_length(resp)
+
+
+def _open_target(target: str, offset: int) -> BinaryIO:
+    f = open(target, "r+b" if offset else "w+b")
+    f.seek(offset)
+    f.truncate()
+    return f
+
+
+def _prepare(
+    url: str, checksum: str | None, destination: StrPath, resume: bool
+) -> tuple[PartialDownload | None, int, hashlib._Hash, str | None]:
+    part = PartialDownload(destination, url, checksum) if resume else None
+    if part is not None:
+        return (part, *part.restore())
+    return None, 0, hashlib.sha256(), None
+
+
+def _request_headers(
+    headers: dict[str, str] | None, offset: int, validator: str | None, ranged: bool = False
+) -> dict[str, str]:
+    request_headers = dict(headers or {})
+    if offset or ranged:
+        request_headers["Range"] = f"bytes={offset}-"
+        if offset and validator:
+            request_headers["If-Range"] = validator
+    return request_headers
+
+
+def _finish(part: PartialDownload | None, hasher: hashlib._Hash, checksum: str | None) -> None:
+    if checksum and hasher.hexdigest() != checksum:
+        if part is not None:
+            part.discard()
+        raise ChecksumMismatch(f"Checksum mismatch. Expected {checksum}, got {hasher.hexdigest()}")
+    if part is not None:
+        part.commit()
+
+
+def _usable(resp: httpx.Response) -> bool:
+    return resp.status_code < 400 or resp.status_code == 416
+
+
+def _close_response(future: Future[httpx.Response]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _send_hedged(
+    client: httpx.Client,
+    request: httpx.Request,
+    alternate: httpx.Request | None,
+    hedge_after: float | None,
+) -> tuple[httpx.Response, httpx.Request]:
+    """Send `request`, and `alternate` as well if no response arrives within
+    `hedge_after` seconds. Return the first usable response and the request it answers.
+
+    A blocking send can't be interrupted, so the slower response is closed as soon
+    as it arrives.
+    """
+    if alternate is None or hedge_after is None:
+        return client.send(request, stream=True), request
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    executor = ThreadPoolExecutor(2, thread_name_prefix="pbs-installer-hedge")
+    futures = {executor.submit(client.send, request, stream=True): request}
+    chosen: Future[httpx.Response] | None = None
+    try:
+        (first,) = futures
+        if wait(futures, timeout=hedge_after).done:
+            chosen = first
+        else:
+            logger.info(
+                "No response from %s after %.1fs, also trying %s",
+                request.url,
+                hedge_after,
+                alternate.url,
+            )
+            futures[executor.submit(client.send, alternate, stream=True)] = alternate
+            pending = set(futures)
+            while pending and chosen is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None and _usable(future.result()):
+                        chosen = future
+                        break
+            if chosen is None:
+                # Neither is usable, report the outcome of the original request
+                chosen = first
+        return chosen.result(), futures[chosen]
+    finally:
+        for future in futures:
+            if future is not chosen:
+                future.add_done_callback(_close_response)
+        executor.shutdown(wait=False)
+
+
+async def _asend_hedged(
+    client: httpx.AsyncClient,
+    request: httpx.Request,
+    alternate: httpx.Request | None,
+    hedge_after: float | None,
+) -> tuple[httpx.Response, httpx.Request]:
+    """The asynchronous version of `_send_hedged`, cancelling the slower request."""
+    if alternate is None or hedge_after is None:
+        return await client.send(request, stream=True), request
+    tasks = {asyncio.ensure_future(client.send(request, stream=True)): request}
+    chosen: asyncio.Task[httpx.Response] | None = None
+    try:
+        (first,) = tasks
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if done:
+            chosen = first
+        else:
+            logger.info(
+                "No response from %s after %.1fs, also trying %s",
+                request.url,
+                hedge_after,
+                alternate.url,
+            )
+            tasks[asyncio.ensure_future(client.send(alternate, stream=True))] = alternate
+            pending = set(tasks)
+            while pending and chosen is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and _usable(task.result()):
+                        chosen = task
+                        break
+            if chosen is None:
+                chosen = first
+        return chosen.result(), tasks[chosen]
+    finally:
+        for task in tasks:
+            if task is chosen:
+                continue
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is None:
+                await task.result().aclose()
+
+
+def _hedge_target(
+    url: str,
+    headers: dict[str, str] | None,
+    alternate: tuple[str, dict[str, str] | None] | None,
+    checksum: str | None,
+    offset: int,
+) -> tuple[str, dict[str, str] | None]:
+    # Data from another url can only be continued when the checksum verifies it in the end
+    if alternate is None or (offset and not checksum):
+        return url, headers
+    return alternate
+
+
+class _Segment:
+    """The byte range [start, end) of a segmented download.
+
+    `reserved` is the next byte the owning worker will write, `written` is the
+    end of the data that actually reached the file. `end` shrinks when another
+    worker takes over the second half of the range.
+    """
+
+    __slots__ = ("start", "reserved", "written", "end")
+
+    def __init__(self, start: int, end: int) -> None:
+        self.start = self.reserved = self.written = start
+        self.end = end
+
+
+class SegmentedFetch:
+    """Fetch one file over several concurrent range requests.
+
+    The download starts with a single connection. Every `SAMPLE_INTERVAL`, another
+    one is opened as long as the previous addition raised the total throughput by
+    at least `SEGMENT_GAIN`, up to `max_segments`. A new connection takes over the
+    second half of the largest remaining range, and a worker that finishes its range
+    steals from the others in the same way, so all connections stay busy until the end.
+    """
+
+    def __init__(
+        self,
+        client: httpx.Client,
+        url: str,
+        path: str,
+        headers: dict[str, str],
+        validator: str | None,
+        total: int,
+        max_segments: int,
+        progress: ProgressTracker | None = None,
+    ) -> None:
+        self.client = client
+        self.url = url
+        self.path = path
+        self.headers = headers
+        self.validator = validator
+        self.total = total
+        self.max_segments = max_segments
+        self.progress = progress
+        self.segments: list[_Segment] = []
+        self.received = 0
+        self.errors: list[BaseException] = []
+        self.cancelled = False
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+
+    def _split(self) -> _Segment | None:
+        """Take over the second half of the largest remaining range, if it is worth it."""
+        with self._lock:
+            victim = max(self.segments, key=lambda s: s.end - s.reserved, default=None)
+            if victim is None or victim.end - victim.reserved < 2 * MIN_SEGMENT_SIZE:
+                return None
+            middle = victim.reserved + (victim.end - victim.reserved) // 2
+            segment = _Segment(middle, victim.end)
+            victim.end = middle
+            self.segments.append(segment)
+            return segment
+
+    def _open(self, segment: _Segment) -> httpx.Response:
+        headers = dict(self.headers)
+        headers["Range"] = f"bytes={segment.reserved}-{segment.end - 1}"
+        if self.validator:
+            headers["If-Range"] = self.validator
+        resp = self.client.send(
+            self.client.build_request("GET", self.url, headers=headers), stream=True
+        )
+        if _range_total(resp) != self.total:
+            resp.close()
+            resp.raise_for_status()
+            import httpx
+
+            # Retried as a single stream from the data received so far
+            raise httpx.RemoteProtocolError(
+                f"The server stopped honoring range requests for {self.url}",
+                request=resp.request,
+            )
+        return resp
+
+    def _work(self, segment: _Segment | None, resp: httpx.Response | None) -> None:
+        try:
+            with open(self.path, "r+b") as f:
+                while segment is not None and not self.cancelled:
+                    if resp is None:
+                        resp = self._open(segment)
+                    try:
+                        f.seek(segment.reserved)
+                        for chunk in resp.iter_bytes():
+                            with self._lock:
+                                size = min(len(chunk), segment.end - segment.reserved)
+                                segment.reserved += size
+                            f.write(chunk[:size] if size < len(chunk) else chunk)
+                            with self._lock:
+                                segment.written += size
+                                self.received += size
+                            if segment.reserved >= segment.end or self.cancelled:
+                                break
+                    finally:
+                        resp.close()
+                    if segment.written < segment.end and not self.cancelled:
+                        import httpx
+
+                        raise httpx.RemoteProtocolError(
+                            f"Incomplete range response from {self.url}", request=resp.request
+                        )
+                    resp = None
+                    segment = self._split()
+        except BaseException as e:
+            self.errors.append(e)
+        finally:
+            self._changed.set()
+
+    def _spawn(
+        self, workers: list[threading.Thread], segment: _Segment, resp: httpx.Response | None
+    ) -> None:
+        worker = threading.Thread(target=self._work, args=(segment, resp), daemon=True)
+        workers.append(worker)
+        worker.start()
+
+    def run(self, resp: httpx.Response, offset: int) -> None:
+        """Download [offset, total) into the file, continuing the already opened `resp`."""
+        first = _Segment(offset, self.total)
+        self.segments.append(first)
+        workers: list[threading.Thread] = []
+        self._spawn(workers, first, resp)
+        growing = True
+        warming_up = False
+        best_rate = 0.0
+        last_received, last_time = 0, time.monotonic()
+        reported = 0
+        interval = SAMPLE_INTERVAL if self.progress is None else PROGRESS_INTERVAL
+        try:
+            while any(w.is_alive() for w in workers):
+                self._changed.wait(interval)
+                self._changed.clear()
+                if self.errors:
+                    break
+                if self.progress is not None:
+                    # Reported from this thread, so the callback never runs concurrently
+                    received = self.received
+                    self.progress.advance(received - reported)
+                    reported = received
+                now = time.monotonic()
+                if not growing or now - last_time < SAMPLE_INTERVAL:
+                    continue
+                rate = (self.received - last_received) / (now - last_time)
+                last_received, last_time = self.received, now
+                if warming_up:
+                    # Leave the newest connection one interval to get up to speed
+                    warming_up = False
+                    continue
+                alive = sum(w.is_alive() for w in workers)
+                if rate < best_rate * (1 + SEGMENT_GAIN) or alive >= self.max_segments:
+                    growing = False
+                    continue
+                best_rate = rate
+                segment = self._split()
+                if segment is None:
+                    growing = False
+                    continue
+                logger.debug("Opening connection #%d at %.1f MB/s", alive + 1, rate / 1e6)
+                self._spawn(workers, segment, None)
+                warming_up = True
+        finally:
+            if self.errors or any(w.is_alive() for w in workers):
+                self.cancelled = True
+            for worker in workers:
+                worker.join()
+        if self.errors:
+            raise self.errors[0]
+        if self.progress is not None:
+            self.progress.advance(self.received - reported)
+
+    def watermark(self) -> int:
+        """The end of the contiguous data written from the start of the range."""
+        with self._lock:
+            segments = sorted(self.segments, key=lambda s: s.start)
+        position = segments[0].start
+        for segment in segments:
+            position = segment.written
+            if segment.written < segment.end:
+                break
+        return position
+
+
+def fetch(
+    client: httpx.Client,
+    url: str,
+    checksum: str | None,
+    destination: StrPath,
+    headers: dict[str, str] | None = None,
+    resume: bool = True,
+    segments: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+    min_speed: float | None = None,
+    hedge_after: float | None = None,
+    alternate: tuple[str, dict[str, str] | None] | None = None,
+    progress: ProgressTracker | None = None,
+    tee: Tee | None = None,
+) -> str:
+    """Stream `url` into `destination` and verify its checksum.
+
+    With `resume`, the data is written to a `.part` file that survives
+    interruptions, and the next call continues it with a Range request.
+    With `segments` > 1, servers that support range requests are downloaded
+    over up to that many connections, see `SegmentedFetch`.
+    The data is hashed and written in pieces of `chunk_size` bytes.
+    With `min_speed`, a download slower than that many bytes per second is
+    aborted with `SlowDownload`.
+    With `hedge_after`, a second request is sent if no response arrives within that
+    many seconds, to the (url, headers) of `alternate` or to `url` over another
+    connection. The download continues with whichever responds first, and the
+    url it came from is returned. The steps and the received bytes are reported
+    to `progress`, and the data is passed to `tee` in order, which rules out segments.
+    """
+    part, offset, hasher, validator = _prepare(url, checksum, destination, resume)
+    target = part.path if part is not None else os.fspath(destination)
+    ranged = segments > 1
+    request = client.build_request(
+        "GET", url, headers=_request_headers(headers, offset, validator, ranged)
+    )
+    hedge: httpx.Request | None = None
+    if hedge_after is not None:
+        hedge_url, hedge_headers = _hedge_target(url, headers, alternate, checksum, offset)
+        hedge = client.build_request(
+            "GET",
+            hedge_url,
+            headers=_request_headers(
+                hedge_headers, offset, validator if hedge_url == url else None, ranged
+            ),
+        )
+    if progress is not None:
+        progress.connect(url, offset)
+    resp, sent = _send_hedged(client, request, hedge, hedge_after)
+    if sent is not request:
+        url, headers = hedge_url, hedge_headers
+        if part is not None:
+            part.url = url
+
+    with contextlib.closing(resp):
+        if resp.status_code == 416 and offset:
+            # The partial file doesn't fit the remote one anymore, start over.
+            assert part is not None
+            part.discard()
+            resp.close()
+            return fetch(
+                client,
+                url,
+                checksum,
+                destination,
+                headers,
+                resume,
+                segments,
+                chunk_size,
+                min_speed,
+                hedge_after,
+                alternate,
+                progress,
+                tee,
+            )
+        resp.raise_for_status()
+        # A partial response may not tell the full size, which only segments need
+        total = _range_total(resp)
+        if offset and resp.status_code != 206:
+            logger.debug("Server ignored the range request, restarting %s", url)
+            offset, hasher = 0, hashlib.sha256()
+        validator = _validator(resp)
+        if progress is not None:
+            progress.start(url, _file_size(resp), offset)
+
+        with _open_target(target, offset) as f:
+            sink = _Sink(f, hasher, offset, part, validator, chunk_size, tee)
+            try:
+                if (
+                    segments > 1
+                    and tee is None
+                    and total is not None
+                    and total - offset >= 2 * MIN_SEGMENT_SIZE
+                ):
+                    _preallocate(f, total)
+                    fetcher = SegmentedFetch(
+                        client,
+                        url,
+                        target,
+                        dict(headers or {}),
+                        validator,
+                        total,
+                        segments,
+                        progress,
+                    )
+                    try:
+                        fetcher.run(resp, offset)
+                    except BaseException:
+                        if part is not None:
+                            # Only the data up to the first gap can be resumed
+                            sink.received = fetcher.watermark()
+                            _hash_file(f, offset, sink.received, hasher)
+                            f.truncate(sink.received)
+                        raise
+                    if progress is not None:
+                        progress.enter("verify")
+                    # The segments arrive out of order, so the file is hashed at the end.
+                    _hash_file(f, offset, total, hasher)
+                else:
+                    length = _content_length(resp)
+                    if length is not None:
+                        _preallocate(f, offset + length)
+                    watchdog = _SpeedWatchdog(min_speed) if min_speed else None
+                    # Without a chunk size, httpx yields the data as it comes off the socket
+                    for chunk in resp.iter_bytes():
+                        sink.write(chunk)
+                        if watchdog is not None:
+                            watchdog.update(len(chunk))
+                        if progress is not None:
+                            progress.advance(len(chunk))
+                    sink.flush()
+                    if progress is not None:
+                        progress.enter("verify")
+            except BaseException:
+                sink.abort()
+                raise
+            sink.close()
+
+    _finish(part, hasher, checksum)
+    return url
+
+
+async def afetch(
+    client: httpx.AsyncClient,
+    url: str,
+    checksum: str | None,
+    destination: StrPath,
+    headers: dict[str, str] | None = None,
+    resume: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+    min_speed: float | None = None,
+    hedge_after: float | None = None,
+    alternate: tuple[str, dict[str, str] | None] | None = None,
+    progress: ProgressTracker | None = None,
+    tee: Tee | None = None,
+) -> str:
+    """The asynchronous version of `fetch`.
+
+    The body is received on the event loop, while writing and hashing run in the
+    default executor, one batch of `chunk_size` bytes at a time, as does any other
+    file access. On cancellation, a download without `resume` removes its unfinished file.
+    """
+    from ._install import _run_in_executor
+
+    loop = asyncio.get_running_loop()
+    part, offset, hasher, validator = await loop.run_in_executor(
+        None, _prepare, url, checksum, destination, resume
+    )
+    target = part.path if part is not None else os.fspath(destination)
+    request = client.build_request("GET", url, headers=_request_headers(headers, offset, validator))
+    hedge: httpx.Request | None = None
+    if hedge_after is not None:
+        hedge_url, hedge_headers = _hedge_target(url, headers, alternate, checksum, offset)
+        hedge = client.build_request(
+            "GET",
+            hedge_url,
+            headers=_request_headers(
+                hedge_headers, offset, validator if hedge_url == url else None
+            ),
+        )
+    if progress is not None:
+        progress.connect(url, offset)
+    resp, sent = await _asend_hedged(client, request, hedge, hedge_after)
+    if sent is not request:
+        url, headers = hedge_url, hedge_headers
+        if part is not None:
+            part.url = url
+
+    try:
+        if resp.status_code == 416 and offset:
+            assert part is not None
+            await _run_in_executor(part.discard)
+            await resp.aclose()
+            return await afetch(
+                client,
+                url,
+                checksum,
+                destination,
+                headers,
+                resume,
+                chunk_size,
+                min_speed,
+                hedge_after,
+                alternate,
+                progress,
+                tee,
+            )
+        resp.raise_for_status()
+        if offset and resp.status_code != 206:
+            logger.debug("Server ignored the range request, restarting %s", url)
+            offset, hasher = 0, hashlib.sha256()
+        validator = _validator(resp)
+        if progress is not None:
+            progress.start(url, _file_size(resp), offset)
+
+        f = await _run_in_executor(_open_target, target, offset)
+        try:
+            # The sink writes the first checkpoint of the partial file
+            sink = await _run_in_executor(
+                _Sink, f, hasher, offset, part, validator, chunk_size, tee
+            )
+        except BaseException:
+            f.close()
+            raise
+        pending: asyncio.Future[None] | None = None
+        try:
+            length = _content_length(resp)
+            if length is not None:
+                await loop.run_in_executor(None, _preallocate, f, offset + length)
+            watchdog = _SpeedWatchdog(min_speed) if min_speed else None
+            batch = bytearray()
+            async for chunk in resp.aiter_bytes():
+                if watchdog is not None:
+                    watchdog.update(len(chunk))
+                if progress is not None:
+                    progress.advance(len(chunk))
+                batch += chunk
+                if len(batch) >= chunk_size:
+                    if pending is not None:
+                        await pending
+                    pending = loop.run_in_executor(None, sink.write, bytes(batch))
+                    batch.clear()
+            if pending is not None:
+                await pending
+            pending = loop.run_in_executor(None, sink.write, bytes(batch))
+            await pending
+            if progress is not None:
+                progress.enter("verify")
+            pending = loop.run_in_executor(None, sink.flush)
+            await pending
+            pending = loop.run_in_executor(None, sink.close)
+            await pending
+        except BaseException as e:
+            # The file must not be closed under a write that is still running
+            if pending is not None and not pending.done():
+                await asyncio.wait([pending])
+            remove = part is None and isinstance(e, asyncio.CancelledError)
+            await _run_in_executor(_abort, sink, f, target if remove else None)
+            raise
+        else:
+            f.close()
+    finally:
+        await resp.aclose()
+
+    await loop.run_in_executor(None, _finish, part, hasher, checksum)
+    return url
+
+
+def _abort(sink: _Sink, f: BinaryIO, remove: str | None) -> None:
+    """Stop writing a failed download, removing the file at `remove` if given."""
+    sink.abort()
+    f.close()
+    if remove is not None:
+        os.remove(remove)
+
+
+def _failover_errors() -> tuple[type[BaseException], ...]:
+    import httpx
+
+    return (httpx.HTTPError, ChecksumMismatch, SlowDownload)
+
+
+def _describe(error: BaseException) -> str:
+    import httpx
+
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"HTTP {error.response.status_code} {error.response.reason_phrase}"
+    return str(error) or type(error).__name__
+
+
+def _retry_delay(
+    retry: RetryPolicy,
+    urls: Sequence[str],
+    index: int,
+    attempt: int,
+    error: BaseException,
+    failures: list[tuple[str, str]],
+) -> float | None:
+    """Record a failed attempt and return the seconds to wait before retrying the url,
+    or None to move on to the next url."""
+    url, description = urls[index], _describe(error)
+    failures.append((url, description))
+    delay = retry.delay(attempt, error)
+    if delay is not None:
+        logger.warning(
+            "Downloading from %s failed: %s, retrying in %.1fs (attempt %d of %d)",
+            url,
+            description,
+            delay,
+            attempt + 1,
+            retry.max_attempts,
+        )
+    elif index + 1 < len(urls):
+        logger.warning(
+            "Downloading from %s failed: %s, trying %s", url, description, urls[index + 1]
+        )
+    return delay
+
+
+def fetch_any(
+    client: httpx.Client,
+    urls: Sequence[str],
+    origin: str,
+    checksum: str | None,
+    destination: StrPath,
+    headers: dict[str, str] | None = None,
+    resume: bool = True,
+    segments: int = 1,
+    chunk_size: int = CHUNK_SIZE,
+    min_speed: float | None = None,
+    hedge_after: float | None = None,
+    retry: RetryPolicy | None = None,
+    progress: ProgressTracker | None = None,
+    tee: Tee | None = None,
+) -> tuple[str, list[tuple[str, str]]]:
+    """Download from the first of `urls` that delivers the file.
+
+    A url that fails, is slower than `min_speed` or serves data that doesn't match
+    the checksum is abandoned for the next one, after retrying temporary failures
+    according to `retry`. The data received so far is kept when resuming, as long
+    as the checksum is known. `headers` are only sent to the `origin` url, never to
+    mirrors. With `hedge_after`, a url that doesn't respond in time is raced against
+    the next one, see `fetch`.
+
+    Returns:
+        The url the file was downloaded from and the (url, error) of each failed attempt
+    """
+    if retry is None:
+        retry = RetryPolicy()
+    errors = _failover_errors()
+    failures: list[tuple[str, str]] = []
+    for index, url in enumerate(urls):
+        has_next = index + 1 < len(urls)
+        alternate = None
+        if has_next:
+            next_url = urls[index + 1]
+            alternate = (next_url, headers if next_url == origin else None)
+        attempt = 1
+        while True:
+            try:
+                used = fetch(
+                    client,
+                    url,
+                    checksum,
+                    destination,
+                    headers if url == origin else None,
+                    resume=resume,
+                    segments=segments,
+                    chunk_size=chunk_size,
+                    min_speed=min_speed if has_next else None,
+                    hedge_after=hedge_after,
+                    alternate=alternate,
+                    progress=progress,
+                    tee=tee,
+                )
+            except errors as e:
+                delay = _retry_delay(retry, urls, index, attempt, e, failures)
+                if delay is None:
+                    if not has_next:
+                        raise
+                    break
+                time.sleep(delay)
+                attempt += 1
+            else:
+                return used, failures
+    raise AssertionError("unreachable")
+
+
+async def afetch_any(
+    client: httpx.AsyncClient,
+    urls: Sequence[str],
+    origin: str,
+    checksum: str | None,
+    destination: StrPath,
+    headers: dict[str, str] | None = None,
+    resume: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+    min_speed: float | None = None,
+    hedge_after: float | None = None,
+    retry: RetryPolicy | None = None,
+    progress: ProgressTracker | None = None,
+    tee: Tee | None = None,
+) -> tuple[str, list[tuple[str, str]]]:
+    """The asynchronous version of `fetch_any`."""
+    if retry is None:
+        retry = RetryPolicy()
+    errors = _failover_errors()
+    failures: list[tuple[str, str]] = []
+    for index, url in enumerate(urls):
+        has_next = index + 1 < len(urls)
+        alternate = None
+        if has_next:
+            next_url = urls[index + 1]
+            alternate = (next_url, headers if next_url == origin else None)
+        attempt = 1
+        while True:
+            try:
+                used = await afetch(
+                    client,
+                    url,
+                    checksum,
+                    destination,
+                    headers if url == origin else None,
+                    resume=resume,
+                    chunk_size=chunk_size,
+                    min_speed=min_speed if has_next else None,
+                    hedge_after=hedge_after,
+                    alternate=alternate,
+                    progress=progress,
+                    tee=tee,
+                )
+            except errors as e:
+                delay = _retry_delay(retry, urls, index, attempt, e, failures)
+                if delay is None:
+                    if not has_next:
+                        raise
+                    break
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                return used, failures
+    raise AssertionError("unreachable")
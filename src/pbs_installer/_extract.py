@@ -0,0 +1,260 @@
+"""Materialize the members of a tar archive with a pool of writer threads."""
+
+from __future__ import annotations
+
+import collections
+import copy
+import logging
+import os
+import posixpath
+import shutil
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import IO
+
+    from _typeshed import StrPath
+
+    # The module `_utils` unpacks with
+    if sys.version_info >= (3, 14):
+        import tarfile
+    else:
+        from backports.zstd import tarfile
+
+logger = logging.getLogger(__name__)
+
+# Threads creating and writing files, most of their time is spent waiting in syscalls
+EXTRACT_WORKERS = 16
+# Larger files are copied from the archive by the reading thread, instead of being held in memory
+INLINE_FILE_SIZE = 1024 * 1024
+# Small files are handed to the writers in batches of up to this many files or bytes
+WRITE_BATCH_FILES = 64
+WRITE_BATCH_BYTES = 1024 * 1024
+# The most bytes of file bodies read from the archive and waiting for the writers
+MAX_PENDING_BYTES = 32 * 1024 * 1024
+
+_OPEN_FLAGS = (
+    os.O_WRONLY
+    | os.O_CREAT
+    | os.O_TRUNC
+    | getattr(os, "O_BINARY", 0)
+    | getattr(os, "O_NOFOLLOW", 0)
+)
+
+# (path, mode, mtime)
+_Metadata = tuple[str, int, float]
+
+
+class UnsafeMemberError(ValueError):
+    """A member of the archive would be written outside of the destination."""
+
+
+def _target(root: str, name: str) -> str:
+    normalized = posixpath.normpath(name)
+    if (
+        posixpath.isabs(normalized)
+        or normalized == ".."
+        or normalized.startswith("../")
+        or os.path.splitdrive(normalized)[0]
+    ):
+        raise UnsafeMemberError(f"Refusing to extract {name!r} outside of {root}")
+    return os.path.join(root, *normalized.split("/"))
+
+
+def _open(path: str) -> int:
+    try:
+        return os.open(path, _OPEN_FLAGS, 0o600)
+    except OSError:
+        # A symlink, or another file that can't be opened for writing, is replaced
+        if not os.path.islink(path) and not os.path.isfile(path):
+            raise
+        os.unlink(path)
+        return os.open(path, _OPEN_FLAGS, 0o600)
+
+
+def _data_filter(member: tarfile.TarInfo, root: str) -> tarfile.TarInfo:
+    """Check and sanitize `member` like `tarfile.data_filter`: it must stay inside `root`,
+    also through symlinks already extracted, and loses the high bits and the write
+    permission of group and others from its mode."""
+    import tarfile as stdlib_tarfile
+
+    data_filter = getattr(stdlib_tarfile, "data_filter", None)
+    if data_filter is not None:
+        try:
+            result: tarfile.TarInfo = data_filter(member, root)
+        except stdlib_tarfile.TarError as e:
+            raise UnsafeMemberError(f"Refusing to extract {member.name!r}: {e}") from e
+        return result
+
+    # Pythons older than 3.9.17, 3.10.12 and 3.11.4
+    real_root = os.path.realpath(root)
+
+    def check(path: str, reason: str) -> None:
+        real_path = os.path.realpath(os.path.join(real_root, path))
+        if os.path.isabs(path) or os.path.commonpath([real_path, real_root]) != real_root:
+            raise UnsafeMemberError(f"Refusing to extract {member.name!r}, {reason} {root}")
+
+    name = member.name.lstrip("/" + os.sep)
+    check(name, "it is outside of")
+    if member.islnk() or member.issym():
+        base = os.path.dirname(name) if member.issym() else ""
+        check(os.path.join(base, member.linkname), "it links outside of")
+    member = copy.copy(member)
+    member.name = name
+    if member.isreg() or member.islnk():
+        mode = member.mode & 0o755
+        if not mode & 0o100:
+            mode &= ~0o111
+        member.mode = mode | 0o600
+    return member
+
+
+def _set_metadata(path: str, mode: int, mtime: float) -> None:
+    os.chmod(path, mode)
+    os.utime(path, (mtime, mtime))
+
+
+def _write_files(batch: list[tuple[_Metadata, bytes]]) -> None:
+    for metadata, data in batch:
+        fd = _open(metadata[0])
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        _set_metadata(*metadata)
+
+
+def _copy_file(metadata: _Metadata, source: IO[bytes]) -> None:
+    with open(_open(metadata[0]), "wb") as f:
+        shutil.copyfileobj(source, f, INLINE_FILE_SIZE)
+    _set_metadata(*metadata)
+
+
+class TarWriter:
+    """Write the members of a tar archive into `destination`.
+
+    The archive is read, and decompressed, by the calling thread, which also
+    creates every directory once and the links, in archive order. The bodies of
+    regular files are handed in batches to a pool of `workers` threads
+    (`EXTRACT_WORKERS` by default) that create and write them and set their
+    permissions and modification time, so that the latency of these syscalls
+    overlaps on slow filesystems. Files over `INLINE_FILE_SIZE` are copied by the
+    reading thread. Only the metadata of directories is kept until the end, when
+    their children are in place. Owners are not changed.
+
+    Every member goes through `tarfile.data_filter` first: those that would end
+    up outside of `destination`, through their path, a symlink or a link target,
+    raise `UnsafeMemberError`, and file modes are stripped of setuid, setgid,
+    sticky and group or other write bits. Directories keep their default mode.
+    """
+
+    def __init__(self, destination: StrPath, workers: int | None = None) -> None:
+        self.root = os.path.abspath(destination)
+        self.workers = workers or EXTRACT_WORKERS
+        self._directories = {self.root}
+        self._directory_times: list[tuple[str, float]] = []
+        self._fallback_links: list[tuple[str, str]] = []
+        self._pool: ThreadPoolExecutor | None = None
+        self._batch: list[tuple[_Metadata, bytes]] = []
+        self._batch_bytes = 0
+        self._pending: collections.deque[tuple[Future[None], int]] = collections.deque()
+        self._pending_bytes = 0
+
+    def _makedirs(self, path: str) -> None:
+        if path in self._directories:
+            return
+        parent = os.path.dirname(path)
+        if parent not in self._directories:
+            self._makedirs(parent)
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            if not os.path.isdir(path):
+                raise
+        self._directories.add(path)
+
+    def _hardlink(self, source: str, path: str) -> None:
+        # The target may still be waiting for a writer
+        self._submit()
+        self._wait(0)
+        if os.path.lexists(path):
+            os.unlink(path)
+        os.link(source, path)
+
+    def _symlink(self, member: tarfile.TarInfo, path: str) -> None:
+        try:
+            os.symlink(member.linkname, path)
+        except FileExistsError:
+            os.unlink(path)
+            os.symlink(member.linkname, path)
+        except OSError as e:
+            # Symlinks may need extra privileges on Windows, a copy is made instead
+            logger.debug("Can't create symlink %s, copying its target: %s", path, e)
+            link = posixpath.join(posixpath.dirname(member.name), member.linkname)
+            self._fallback_links.append((_target(self.root, link), path))
+
+    def extract(self, tf: tarfile.TarFile, members: Iterable[tarfile.TarInfo]) -> None:
+        """Write `members`, read in order from `tf`, which may be a stream."""
+        os.makedirs(self.root, exist_ok=True)
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="pbs-installer-write") as pool:
+            self._pool = pool
+            for member in members:
+                if not (member.isreg() or member.isdir() or member.issym() or member.islnk()):
+                    logger.debug("Skipping %s, an unsupported member type", member.name)
+                    continue
+                # Symlinks are created as they come, so the checks see those before
+                member = _data_filter(member, self.root)
+                path = _target(self.root, member.name)
+                if member.isdir():
+                    self._makedirs(path)
+                    self._directory_times.append((path, member.mtime))
+                    continue
+                self._makedirs(os.path.dirname(path))
+                if member.isreg():
+                    source = tf.extractfile(member)
+                    assert source is not None
+                    if member.size > INLINE_FILE_SIZE:
+                        _copy_file((path, member.mode, member.mtime), source)
+                    else:
+                        self._write((path, member.mode, member.mtime), source.read())
+                elif member.issym():
+                    self._symlink(member, path)
+                else:
+                    self._hardlink(_target(self.root, member.linkname), path)
+            self._submit()
+            self._wait(0)
+
+            for target, path in self._fallback_links:
+                if os.path.isfile(target):
+                    shutil.copy2(target, path)
+            # Children are in place, so setting the times of directories is final
+            for path, mtime in self._directory_times:
+                os.utime(path, (mtime, mtime))
+
+    def _write(self, metadata: _Metadata, data: bytes) -> None:
+        self._batch.append((metadata, data))
+        self._batch_bytes += len(data)
+        if len(self._batch) >= WRITE_BATCH_FILES or self._batch_bytes >= WRITE_BATCH_BYTES:
+            self._submit()
+            self._wait(2 * self.workers)
+
+    def _submit(self) -> None:
+        if self._batch:
+            assert self._pool is not None
+            future = self._pool.submit(_write_files, self._batch)
+            self._pending.append((future, self._batch_bytes))
+            self._pending_bytes += self._batch_bytes
+            self._batch, self._batch_bytes = [], 0
+
+    def _wait(self, max_batches: int) -> None:
+        """Wait for the oldest batches, raising their errors, until at most `max_batches`
+        holding at most `MAX_PENDING_BYTES` are left."""
+        while len(self._pending) > max_batches or self._pending_bytes > MAX_PENDING_BYTES:
+            future, size = self._pending.popleft()
+            future.result()
+            self._pending_bytes -= size
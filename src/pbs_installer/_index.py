@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import bisect
+import functools
+import heapq
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from typing import IO, TYPE_CHECKING
+
+from ._utils import PythonVersion, VersionRequest, VersionSpecifier
+
+if TYPE_CHECKING:
+    from typing import Literal
+
+    from ._install import PythonFile
+
+    Buffer = bytes | mmap.mmap
+    Match = tuple[PythonVersion, PythonFile]
+    # (implementation, freethreaded, platform, arch, install_only)
+    GroupKey = tuple[str, bool, str, str, bool]
+    # (major, minor, micro), where minor and micro are None for the newest release of a prefix
+    PrefixKey = tuple[int, int | None, int | None]
+    VersionTuple = tuple[int, int, int]
+    TypeCode = Literal["B", "H", "I"]
+
+INDEX_FILE = os.path.join(os.path.dirname(__file__), "_versions.bin")
+MAGIC = b"PBSI"
+FORMAT_VERSION = 2
+
+# The file layout is: header, groups, then one array per column below, then string data.
+# Every array starts on a 4-byte boundary and is stored little-endian.
+# magic, format version, number of strings, number of groups, number of records
+_HEADER = struct.Struct("<4sHxxIII")
+# implementation, platform and arch string ids, flags, first record, end record
+_GROUP = struct.Struct("<HHHBxII")
+_FREETHREADED = 1
+_INSTALL_ONLY = 2
+# Per-record columns. A URL is split at its last slash into the release prefix, which is
+# shared by all assets of a release, and the filename. Both are ids into the string table.
+_COLUMNS: tuple[tuple[str, TypeCode], ...] = (
+    ("major", "B"),
+    ("minor", "B"),
+    ("micro", "B"),
+    ("prefix", "H"),
+    ("filename", "H"),
+)
+# Raw SHA-256 digests, all zeros if the checksum is unknown
+_DIGEST_SIZE = 32
+_NO_DIGEST = bytes(_DIGEST_SIZE)
+
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+class VersionIndex:
+    """A read-only view over the binary version index.
+
+    Records are grouped by (implementation, freethreaded, platform, arch, install_only)
+    and sorted by version within each group. Only the small group table is read on load,
+    a hash table mapping version prefixes to the newest release is built for a group
+    the first time it is queried. The record columns are views over the buffer, URLs and
+    hex digests are only built when a record is returned.
+    """
+
+    def __init__(self, buffer: Buffer, generation: str = "") -> None:
+        magic, fmt, n_strings, n_groups, n_records = _HEADER.unpack_from(buffer)
+        if magic != MAGIC or fmt != FORMAT_VERSION:
+            raise ValueError(f"Unsupported version index format: {magic!r} v{fmt}")
+        self._buffer = buffer
+        self._n_records: int = n_records
+        #: Identifies the content of the index, see `GENERATION` in `_versions.py`
+        self.generation = generation
+        offset = _HEADER.size
+        groups = _GROUP.iter_unpack(buffer[offset : offset + n_groups * _GROUP.size])
+        offset = _align(offset + n_groups * _GROUP.size)
+
+        self._columns: dict[str, Sequence[int]] = {}
+        for name, typecode in _COLUMNS:
+            self._columns[name], offset = self._column(offset, typecode, n_records)
+        self._string_offsets, offset = self._column(offset, "I", n_strings + 1)
+        self._digests = memoryview(buffer)[offset : offset + n_records * _DIGEST_SIZE]
+        self._data_at = offset + n_records * _DIGEST_SIZE
+
+        self._groups: dict[GroupKey, tuple[int, int]] = {}
+        for impl, platform, arch, flags, start, end in groups:
+            key = (
+                self._string(impl),
+                bool(flags & _FREETHREADED),
+                self._string(platform),
+                self._string(arch),
+                bool(flags & _INSTALL_ONLY),
+            )
+            self._groups[key] = (start, end)
+        self._prefixes: dict[GroupKey, dict[PrefixKey, int]] = {}
+        self._versions: dict[GroupKey, list[VersionTuple]] = {}
+
+    def __len__(self) -> int:
+        return self._n_records
+
+    def _column(self, offset: int, typecode: TypeCode, count: int) -> tuple[Sequence[int], int]:
+        end = offset + count * array(typecode).itemsize
+        view = memoryview(self._buffer)[offset:end].cast(typecode)
+        if sys.byteorder == "big":
+            values = array(typecode, view.tobytes())
+            values.byteswap()
+            return values, _align(end)
+        return view, _align(end)
+
+    def _string(self, sid: int) -> str:
+        start, end = self._string_offsets[sid], self._string_offsets[sid + 1]
+        return self._buffer[self._data_at + start : self._data_at + end].decode("utf-8")
+
+    def _record(self, group: GroupKey, pos: int) -> Match:
+        columns = self._columns
+        py_ver = PythonVersion(
+            group[0], columns["major"][pos], columns["minor"][pos], columns["micro"][pos], group[1]
+        )
+        url = self._string(columns["prefix"][pos]) + self._string(columns["filename"][pos])
+        digest = self._digests[pos * _DIGEST_SIZE : (pos + 1) * _DIGEST_SIZE]
+        return py_ver, (url, None if digest == _NO_DIGEST else digest.hex())
+
+    def _group_prefixes(self, group: GroupKey) -> dict[PrefixKey, int]:
+        prefixes = self._prefixes.get(group)
+        if prefixes is None:
+            prefixes = self._prefixes[group] = {}
+            start, end = self._groups[group]
+            majors, minors, micros = (self._columns[name] for name in ("major", "minor", "micro"))
+            # Records are sorted by version, so later ones are newer and win
+            for pos in range(start, end):
+                major, minor = majors[pos], minors[pos]
+                prefixes[(major, minor, micros[pos])] = pos
+                prefixes[(major, minor, None)] = pos
+                prefixes[(major, None, None)] = pos
+        return prefixes
+
+    def _group_versions(self, group: GroupKey) -> list[VersionTuple]:
+        versions = self._versions.get(group)
+        if versions is None:
+            start, end = self._groups[group]
+            majors, minors, micros = (self._columns[name] for name in ("major", "minor", "micro"))
+            versions = self._versions[group] = [
+                (majors[pos], minors[pos], micros[pos]) for pos in range(start, end)
+            ]
+        return versions
+
+    def _iter_group(
+        self,
+        group: GroupKey,
+        bounds: tuple[VersionTuple, VersionTuple],
+        priority: int,
+        newest_first: bool,
+    ) -> Iterator[tuple[VersionTuple, int, int]]:
+        """Yield (version, priority, position) for the records within bounds, by bisection"""
+        if group not in self._groups:
+            return
+        versions = self._group_versions(group)
+        start = self._groups[group][0]
+        low, high = bisect.bisect_left(versions, bounds[0]), bisect.bisect_left(versions, bounds[1])
+        positions = range(low, high)
+        for i in reversed(positions) if newest_first else positions:
+            yield versions[i], priority, start + i
+
+    def groups(self) -> Iterator[GroupKey]:
+        """Iterate over the (implementation, freethreaded, platform, arch, install_only) groups"""
+        return iter(self._groups)
+
+    def items(self) -> Iterator[tuple[PythonVersion, tuple[str, str, bool], PythonFile]]:
+        """Iterate over all (version, (platform, arch, install_only), file) records"""
+        for group, (start, end) in self._groups.items():
+            for pos in range(start, end):
+                py_ver, python_file = self._record(group, pos)
+                yield py_ver, (group[2], group[3], group[4]), python_file
+
+    def lookup(
+        self, request: VersionRequest, platform: str, arch: str, install_only: bool
+    ) -> Match | None:
+        """Find the newest release matching the request"""
+        group = (request.implementation, request.freethreaded, platform, arch, install_only)
+        if group not in self._groups:
+            return None
+        pos = self._group_prefixes(group).get((request.major, request.minor, request.micro))
+        return None if pos is None else self._record(group, pos)
+
+    def iter_resolve(
+        self,
+        request: VersionRequest | VersionSpecifier,
+        platform: str,
+        arch: str,
+        build_dir: bool = False,
+        newest_first: bool = True,
+    ) -> Iterator[Match]:
+        """Lazily yield the best download of every release matching the request.
+
+        The candidate range is found by bisecting the sorted versions of the group,
+        then filtered by the request. For each release the install-only flavor is
+        preferred unless `build_dir` is requested.
+        """
+        bounds = request.bounds()
+        # On equal versions, the merged order puts the preferred flavor first
+        preferred, fallback = (1, 0) if newest_first else (0, 1)
+        candidates = [
+            self._iter_group(
+                (request.implementation, request.freethreaded, platform, arch, not build_dir),
+                bounds,
+                preferred,
+                newest_first,
+            )
+        ]
+        if not build_dir:
+            candidates.append(
+                self._iter_group(
+                    (request.implementation, request.freethreaded, platform, arch, False),
+                    bounds,
+                    fallback,
+                    newest_first,
+                )
+            )
+        last: VersionTuple | None = None
+        for version, priority, pos in heapq.merge(*candidates, reverse=newest_first):
+            if version == last:
+                continue
+            last = version
+            install_only = not build_dir and priority == preferred
+            group = (request.implementation, request.freethreaded, platform, arch, install_only)
+            matched = self._record(group, pos)
+            if request.contains(matched[0]):
+                yield matched
+
+    def resolve(
+        self,
+        request: VersionRequest | VersionSpecifier,
+        platform: str,
+        arch: str,
+        build_dir: bool = False,
+    ) -> Match | None:
+        """Find the best download of the newest release matching the request.
+
+        The install-only flavor is preferred unless `build_dir` is requested,
+        falling back to the full build if it belongs to a newer release.
+        """
+        if isinstance(request, VersionSpecifier):
+            return next(self.iter_resolve(request, platform, arch, build_dir), None)
+        matched = self.lookup(request, platform, arch, not build_dir)
+        if not build_dir:
+            full = self.lookup(request, platform, arch, False)
+            if full is not None and (matched is None or matched[0] < full[0]):
+                matched = full
+        return matched
+
+    def to_dict(self) -> dict[PythonVersion, dict[tuple[str, str, bool], PythonFile]]:
+        """Materialize the whole table in the legacy `PYTHON_VERSIONS` shape,
+        ordered by implementation and newest version first, with the
+        free-threaded build of a version before the regular one.
+        """
+        result: dict[PythonVersion, dict[tuple[str, str, bool], PythonFile]] = {}
+        for py_ver, key, python_file in self.items():
+            result.setdefault(py_ver, {})[key] = python_file
+        return dict(
+            sorted(
+                result.items(),
+                key=lambda item: (
+                    item[0].implementation,
+                    [-v for v in item[0][1:4]],
+                    not item[0].freethreaded,
+                ),
+            )
+        )
+
+
+def dump_index(
+    versions: Mapping[PythonVersion, Mapping[tuple[str, str, bool], PythonFile]],
+    fp: IO[bytes],
+) -> None:
+    """Write the version table to `fp` in the binary index format"""
+    strings: dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        return strings.setdefault(value, len(strings))
+
+    grouped: dict[GroupKey, list[tuple[tuple[int, int, int], PythonFile]]] = {}
+    for py_ver, urls in versions.items():
+        for (platform, arch, install_only), python_file in urls.items():
+            group = (py_ver.implementation, py_ver.freethreaded, platform, arch, install_only)
+            grouped.setdefault(group, []).append((py_ver[1:4], python_file))
+
+    groups = bytearray()
+    columns = {name: array(typecode) for name, typecode in _COLUMNS}
+    digests = bytearray()
+    for group in sorted(grouped):
+        impl, freethreaded, platform, arch, install_only = group
+        flags = (_FREETHREADED if freethreaded else 0) | (_INSTALL_ONLY if install_only else 0)
+        items = sorted(grouped[group])
+        start = len(digests) // _DIGEST_SIZE
+        groups += _GROUP.pack(
+            intern(impl), intern(platform), intern(arch), flags, start, start + len(items)
+        )
+        for (major, minor, micro), (url, checksum) in items:
+            prefix, _, filename = url.rpartition("/")
+            columns["major"].append(major)
+            columns["minor"].append(minor)
+            columns["micro"].append(micro)
+            columns["prefix"].append(intern(prefix + "/"))
+            columns["filename"].append(intern(filename))
+            digests += _NO_DIGEST if checksum is None else bytes.fromhex(checksum)
+
+    string_offsets = array("I", [0])
+    data = bytearray()
+    for value in strings:
+        data += value.encode("utf-8")
+        string_offsets.append(len(data))
+
+    def write(chunk: bytes | bytearray | array[int]) -> None:
+        if isinstance(chunk, array) and sys.byteorder == "big":
+            chunk = array(chunk.typecode, chunk)
+            chunk.byteswap()
+        size = fp.write(chunk)
+        fp.write(bytes(_align(size) - size))
+
+    fp.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(strings), len(grouped), len(columns["major"])))
+    write(groups)
+    for name, _ in _COLUMNS:
+        write(columns[name])
+    write(string_offsets)
+    fp.write(digests)
+    fp.write(data)
+
+
+@functools.cache
+def get_index() -> VersionIndex:
+    """Memory-map the bundled version index, once per process.
+
+    When the package isn't installed as regular files, e.g. imported from a zip,
+    the index is read into memory instead.
+    """
+    from ._versions import GENERATION
+
+    if not os.path.isfile(INDEX_FILE):
+        from importlib.resources import files
+
+        data = files(__package__).joinpath("_versions.bin").read_bytes()
+        return VersionIndex(data, GENERATION)
+    with open(INDEX_FILE, "rb") as f:
+        return VersionIndex(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), GENERATION)
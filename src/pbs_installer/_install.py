@@ -1,13 +1,24 @@
 from __future__ import annotations
 
-import hashlib
+import contextlib
+import functools
 import logging
 import os
+import shutil
 import tempfile
-from typing import TYPE_CHECKING, Optional, Tuple, cast
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Tuple, TypeVar, Union, cast
 from urllib.parse import unquote
 
-from ._utils import PythonVersion, get_arch_platform
+from ._progress import ProgressTracker
+from ._retry import DownloadResult, RetryPolicy
+from ._utils import (
+    PythonVersion,
+    VersionRequest,
+    VersionSpecifier,
+    get_arch_platform,
+    parse_request,
+)
 
 if TYPE_CHECKING:
     from typing import Literal
@@ -15,11 +26,41 @@ if TYPE_CHECKING:
     import httpx
     from _typeshed import StrPath
 
+    from ._cache import DownloadCache
+    from ._download import Tee
+    from ._profiles import ExtractFilter, Profile
+    from ._progress import ProgressEvent
+    from ._stream import StreamingExtractor
+
     PythonImplementation = Literal["cpython", "pypy"]
+    ResolveOrder = Literal["newest", "oldest"]
 
 logger = logging.getLogger(__name__)
+T = TypeVar("T")
 THIS_ARCH, THIS_PLATFORM = get_arch_platform()
+RESOLUTION_CACHE_SIZE = 1024
 PythonFile = Tuple[str, Optional[str]]
+# (request, platform, arch)
+MatrixCell = Tuple[Union[str, VersionRequest, VersionSpecifier], str, str]
+
+
+class DownloadMatrix(NamedTuple):
+    """The downloads resolved for a version x platform matrix"""
+
+    resolved: dict[MatrixCell, tuple[PythonVersion, PythonFile]]
+    """The resolved cells, keyed by (request, platform, arch)"""
+    missing: list[MatrixCell]
+    """The cells that no download matches, in the order they were requested"""
+
+
+class ResolutionCacheInfo(NamedTuple):
+    """Statistics of the resolution cache, see `resolution_cache_info`"""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    generation: str
 
 
 def _get_headers() -> dict[str, str] | None:
@@ -33,22 +74,27 @@ def _get_headers() -> dict[str, str] | None:
 
 
 def get_download_link(
-    request: str,
+    request: str | VersionRequest | VersionSpecifier,
     arch: str = THIS_ARCH,
     platform: str = THIS_PLATFORM,
     implementation: PythonImplementation = "cpython",
     build_dir: bool = False,
     free_threaded: bool = False,
+    order: ResolveOrder = "newest",
 ) -> tuple[PythonVersion, PythonFile]:
     """Get the download URL matching the given requested version.
 
     Parameters:
-        request: The version of Python to install, e.g. 3.14, 3.10.4, pypy@3.10
+        request: The version of Python to install, e.g. 3.14, 3.10.4, pypy@3.10, >=3.10,<3.13,
+            or a [`VersionRequest`][pbs_installer.VersionRequest] or
+            [`VersionSpecifier`][pbs_installer.VersionSpecifier] parsed beforehand
         arch: The architecture to install, e.g. x86_64, arm64
         platform: The platform to install, e.g. linux, macos
-        implementation: The implementation of Python to install, allowed values are 'cpython' and 'pypy'
+        implementation: The implementation of Python to install, allowed values are 'cpython' and 'pypy'.
+            Ignored if the request specifies the implementation.
         build_dir: Whether to include the `build/` directory from indygreg builds
         free_threaded: Whether to install the freethreaded version of Python
+        order: Whether to pick the newest or the oldest release matching the request
 
     Returns:
         A tuple of the PythonVersion and the download URL
@@ -58,28 +104,162 @@ def get_download_link(
         (PythonVersion(kind='cpython', major=3, minor=10, micro=13),
         'https://github.com/indygreg/python-build-standalone/releases/download/20240224/cpython-3.10.13%2B20240224-x86_64-unknown-linux-gnu-pgo%2Blto-full.tar.zst')
     """
-    from ._versions import PYTHON_VERSIONS
+    from ._index import get_index
 
-    if free_threaded and not request.endswith("t"):
-        request += "t"
+    matched = _resolve(
+        get_index().generation,
+        request,
+        arch,
+        platform,
+        implementation,
+        build_dir,
+        free_threaded,
+        order,
+    )
+    if matched is not None:
+        return matched
+    request = _compile_request(request, implementation, free_threaded)
+    raise ValueError(
+        f"Could not find a version matching version={request.version!r}, "
+        f"implementation={request.implementation}"
+    )
 
-    for py_ver, urls in PYTHON_VERSIONS.items():
-        if not py_ver.matches(request, implementation):
-            continue
 
-        matched = urls.get((platform, arch, not build_dir))
-        if matched is not None:
-            return py_ver, matched
-        if not build_dir and (matched := urls.get((platform, arch, False))) is not None:
-            return py_ver, matched
-    raise ValueError(
-        f"Could not find a version matching version={request!r}, implementation={implementation}"
+@functools.lru_cache(maxsize=RESOLUTION_CACHE_SIZE)
+def _resolve(
+    generation: str,
+    request: str | VersionRequest | VersionSpecifier,
+    arch: str,
+    platform: str,
+    implementation: str,
+    build_dir: bool,
+    free_threaded: bool,
+    order: ResolveOrder,
+) -> tuple[PythonVersion, PythonFile] | None:
+    # The generation is only part of the cache key, so that results
+    # resolved against a different version table are never reused
+    from ._index import get_index
+
+    request = _compile_request(request, implementation, free_threaded)
+    index = get_index()
+    if order == "newest":
+        return index.resolve(request, platform, arch, build_dir)
+    return next(index.iter_resolve(request, platform, arch, build_dir, False), None)
+
+
+def resolution_cache_info() -> ResolutionCacheInfo:
+    """Get the statistics of the `get_download_link` resolution cache.
+
+    Returns:
+        A ResolutionCacheInfo with the hits, misses, current and maximum size of the cache
+        and the generation of the version index it is tied to
+    """
+    from ._index import get_index
+
+    info = _resolve.cache_info()
+    return ResolutionCacheInfo(
+        info.hits, info.misses, info.currsize, RESOLUTION_CACHE_SIZE, get_index().generation
     )
 
 
+def clear_resolution_cache() -> None:
+    """Empty the `get_download_link` resolution cache and reset its statistics"""
+    _resolve.cache_clear()
+
+
+def iter_download_links(
+    request: str | VersionRequest | VersionSpecifier,
+    arch: str = THIS_ARCH,
+    platform: str = THIS_PLATFORM,
+    implementation: PythonImplementation = "cpython",
+    build_dir: bool = False,
+    free_threaded: bool = False,
+    order: ResolveOrder = "newest",
+) -> Iterator[tuple[PythonVersion, PythonFile]]:
+    """Lazily iterate over the downloads of all releases matching the given request.
+
+    The parameters are the same as [`get_download_link`][pbs_installer.get_download_link],
+    but no error is raised if nothing matches.
+
+    Examples:
+        >>> [str(ver) for ver, _ in iter_download_links(">=3.12.10,<3.13,!=3.12.11", "x86_64", "linux")]
+        ['cpython@3.12.13', 'cpython@3.12.12', 'cpython@3.12.10']
+    """
+    from ._index import get_index
+
+    request = _compile_request(request, implementation, free_threaded)
+    return get_index().iter_resolve(request, platform, arch, build_dir, order == "newest")
+
+
+def get_download_links(
+    requests: Iterable[str | VersionRequest | VersionSpecifier],
+    targets: Iterable[tuple[str, str]],
+    implementation: PythonImplementation = "cpython",
+    build_dir: bool = False,
+    free_threaded: bool = False,
+) -> DownloadMatrix:
+    """Resolve the download URLs for every combination of the requested versions and targets.
+
+    Unlike [`get_download_link`][pbs_installer.get_download_link], a cell that can't
+    be resolved doesn't raise but is reported in `DownloadMatrix.missing`.
+
+    Parameters:
+        requests: The versions of Python to resolve, see `get_download_link`
+        targets: The (platform, arch) pairs to resolve for, e.g. ("linux", "x86_64")
+        implementation: The implementation of Python to install, allowed values are 'cpython' and 'pypy'.
+            Ignored if a request specifies the implementation.
+        build_dir: Whether to include the `build/` directory from indygreg builds
+        free_threaded: Whether to install the freethreaded version of Python
+
+    Returns:
+        A DownloadMatrix with the resolved and missing cells
+
+    Examples:
+        >>> matrix = get_download_links(["3.12", "3.13"], [("linux", "x86_64"), ("macos", "aarch64")])
+        >>> matrix.resolved["3.12", "macos", "aarch64"]
+        (PythonVersion(implementation='cpython', major=3, minor=12, micro=13, freethreaded=False),
+        ('https://github.com/astral-sh/python-build-standalone/releases/download/...', '...'))
+    """
+    from ._index import get_index
+
+    index = get_index()
+    compiled = [
+        (request, _compile_request(request, implementation, free_threaded)) for request in requests
+    ]
+    result = DownloadMatrix({}, [])
+    for platform, arch in targets:
+        for request, version_request in compiled:
+            matched = index.resolve(version_request, platform, arch, build_dir)
+            if matched is None:
+                result.missing.append((request, platform, arch))
+            else:
+                result.resolved[(request, platform, arch)] = matched
+    return result
+
+
+def _compile_request(
+    request: str | VersionRequest | VersionSpecifier, implementation: str, free_threaded: bool
+) -> VersionRequest | VersionSpecifier:
+    if isinstance(request, str):
+        request = parse_request(request, implementation)
+    if free_threaded and not request.freethreaded:
+        request = request._replace(freethreaded=True)
+    return request
+
+
 def download(
-    python_file: PythonFile, destination: StrPath, client: httpx.Client | None = None
-) -> str:
+    python_file: PythonFile,
+    destination: StrPath,
+    client: httpx.Client | None = None,
+    resume: bool = True,
+    segments: int = 1,
+    cache_dir: StrPath | None = None,
+    chunk_size: int | None = None,
+    mirrors: Sequence[str] | None = None,
+    hedge_after: float | None = None,
+    retry: RetryPolicy | None = None,
+    progress: Callable[[ProgressEvent], object] | None = None,
+) -> DownloadResult:
     """Download the given url to the destination.
 
     Note: Extras required
@@ -88,37 +268,146 @@ def download(
     Parameters:
         python_file: The (url, checksum) tuple to download
         destination: The file path to download to
-        client: A http.Client to use for downloading, or None to create a new one
+        client: A httpx.Client to use for downloading, e.g. the `client` of a
+            [`Session`][pbs_installer.Session]. Defaults to a client shared by all calls
+        resume: Keep the received data in `<destination>.part` so that an interrupted
+            download continues where it stopped on the next call
+        segments: The maximum number of connections to download the file over. With more
+            than one, the file is split into byte ranges that are fetched concurrently and
+            connections are added while they raise the throughput. Servers that don't
+            support range requests are downloaded over a single connection.
+        cache_dir: The directory to cache downloaded archives in, keyed by their checksum.
+            Defaults to the `PBS_INSTALLER_CACHE_DIR` environment variable, an empty
+            string disables the cache. A cached archive is copied without any network access.
+        chunk_size: The number of bytes to gather before hashing and writing them, 1 MiB by default
+        mirrors: Mirrors as `PREFIX=REPLACEMENT` entries, a url starting with `PREFIX` is
+            rewritten to start with `REPLACEMENT` instead. Defaults to the whitespace separated
+            entries of the `PBS_INSTALLER_MIRRORS` environment variable. The mirrors and the
+            original url are probed and tried from the fastest, moving on to the next one
+            when a download fails, stalls or doesn't match the checksum.
+        hedge_after: Send a second request if the first one hasn't been answered within this
+            many seconds, to the next mirror or over another connection, and continue with
+            whichever responds first. This cuts the time lost to slow servers and CDN edges.
+        retry: How connection errors, timeouts and temporary HTTP errors are retried,
+            3 attempts per url with exponential backoff by default. With `resume`, a
+            retry continues from the last verified byte.
+        progress: Called with a [`ProgressEvent`][pbs_installer.ProgressEvent] when the
+            download moves to another phase and about 10 times per second while receiving,
+            with the bytes received, the total size, the throughput and the time to first
+            byte. Raising an exception from it aborts the download.
 
     Returns:
-        The original filename of the downloaded file
+        The original filename of the downloaded file, as a
+        [`DownloadResult`][pbs_installer.DownloadResult] that also tells the url it
+        came from and the failed attempts
     """
+    return _download(
+        python_file,
+        destination,
+        client,
+        resume=resume,
+        segments=segments,
+        cache_dir=cache_dir,
+        chunk_size=chunk_size,
+        mirrors=mirrors,
+        hedge_after=hedge_after,
+        retry=retry,
+        progress=progress,
+    )
+
+
+def _download(
+    python_file: PythonFile,
+    destination: StrPath,
+    client: httpx.Client | None,
+    *,
+    resume: bool = True,
+    segments: int = 1,
+    cache_dir: StrPath | None = None,
+    chunk_size: int | None = None,
+    mirrors: Sequence[str] | None = None,
+    hedge_after: float | None = None,
+    retry: RetryPolicy | None = None,
+    progress: Callable[[ProgressEvent], object] | None = None,
+    tee: Tee | None = None,
+) -> DownloadResult:
+    """`download`, passing the data to `tee` as it is written, see `fetch`."""
+    from ._cache import get_cache
+
     url, checksum = python_file
+    cache = get_cache(cache_dir)
+    if cache is not None and checksum:
+        cached, result = _cached_download(
+            cache,
+            python_file,
+            client,
+            segments=segments,
+            chunk_size=chunk_size,
+            mirrors=mirrors,
+            hedge_after=hedge_after,
+            retry=retry,
+            progress=progress,
+            tee=tee,
+        )
+        shutil.copyfile(cached, destination)
+        return result
+
     logger.debug("Downloading url %s to %s", url, destination)
-    try:
-        import httpx
-    except ModuleNotFoundError:
-        raise RuntimeError("You must install httpx to use this function") from None
+    from ._download import CHUNK_SIZE, fetch_any
+    from ._mirrors import SLOW_MIRROR_SPEED, candidate_urls, get_mirrors, rank
 
     if client is None:
-        client = httpx.Client(trust_env=True, follow_redirects=True)
+        from ._session import get_session
+
+        client = get_session().client
 
-    filename = unquote(url.rsplit("/")[-1])
-    hasher = hashlib.sha256()
     if not checksum:
         logger.warning("No checksum found for %s, this would be insecure", url)
 
-    with open(destination, "wb") as f:
-        with client.stream("GET", url, headers=_get_headers()) as resp:
-            resp.raise_for_status()
-            for chunk in resp.iter_bytes(chunk_size=8192):
-                if checksum:
-                    hasher.update(chunk)
-                f.write(chunk)
+    urls = rank(client, candidate_urls(url, get_mirrors(mirrors)))
+    used, failures = fetch_any(
+        client,
+        urls,
+        url,
+        checksum,
+        destination,
+        _get_headers(),
+        resume=resume,
+        segments=segments,
+        chunk_size=chunk_size or CHUNK_SIZE,
+        min_speed=SLOW_MIRROR_SPEED,
+        hedge_after=hedge_after,
+        retry=retry,
+        progress=ProgressTracker(progress) if progress is not None else None,
+        tee=tee,
+    )
+    return DownloadResult(_original_filename(url), used, len(failures) + 1, tuple(failures))
+
 
-    if checksum and hasher.hexdigest() != checksum:
-        raise RuntimeError(f"Checksum mismatch. Expected {checksum}, got {hasher.hexdigest()}")
-    return filename
+def _original_filename(url: str) -> str:
+    return unquote(url.rsplit("/")[-1])
+
+
+def _cached_download(
+    cache: DownloadCache, python_file: PythonFile, client: httpx.Client | None, **options: Any
+) -> tuple[str, DownloadResult]:
+    """Return the path of the archive in the cache, downloading it with `options` on a miss."""
+    url, checksum = python_file
+    assert checksum
+    results: list[DownloadResult] = []
+    path = cache.fetch(
+        checksum,
+        lambda path, resume: results.append(
+            _download(python_file, path, client, resume=resume, cache_dir="", **options)
+        ),
+    )
+    return path, _cache_result(url, results)
+
+
+def _cache_result(url: str, results: list[DownloadResult]) -> DownloadResult:
+    if results:
+        return results[0]
+    return DownloadResult(_original_filename(url), url, attempts=0)
 
 
 def install_file(
@@ -126,6 +415,9 @@ def install_file(
     destination: StrPath,
     original_filename: str | None = None,
     build_dir: bool = False,
+    profile: Profile = "full",
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
 ) -> None:
     """Unpack the downloaded file to the destination.
 
@@ -136,11 +428,26 @@ def install_file(
         filename: The file to unpack
         destination: The directory to unpack to
         original_filename: The original filename of the file, if it was renamed
-        build_dir: Whether to include the `build/` directory from indygreg builds
+        build_dir: Whether to include the `build/` directory from indygreg builds. Without
+            it, only the `install/` directory of a `-full` archive is unpacked, as the
+            root of the destination
+        profile: Which files to install, `full`, `runtime` (without the test suites and
+            static libraries) or `minimal` (also without IDLE, tkinter, Tcl/Tk and the wheels
+            of `ensurepip`). Unless everything is installed, the profile is recorded in
+            `PBS_INSTALLER_PROFILE.json` in the installed tree
+        include: Globs of paths in the installed tree to install even if the profile or
+            `exclude` skips them, e.g. `lib/python3.*/idlelib`
+        exclude: Globs of paths in the installed tree to skip, e.g. `share/man`. `*` doesn't
+            match `/`, and a glob that matches a directory skips everything below it
+
+    Raises:
+        ValueError: If the profile is unknown
     """
 
+    from ._profiles import ExtractFilter
     from ._utils import unpack_tar, unpack_zip
 
+    extract_filter = ExtractFilter.create(profile, include, exclude)
     if original_filename is None:
         original_filename = str(filename)
     logger.debug(
@@ -151,13 +458,35 @@ def install_file(
     )
     filename = cast(str, filename)
     if original_filename.endswith(".zip"):
-        unpack_zip(filename, destination)
+        unpack_zip(filename, destination, extract_filter.skips)
     else:
-        unpack_tar(filename, destination, original_filename)
+        unpack_tar(
+            filename,
+            destination,
+            original_filename,
+            _subdir(original_filename, build_dir),
+            _skip(original_filename, build_dir, extract_filter),
+        )
+    extract_filter.record(destination)
+
+
+def _subdir(original_filename: str, build_dir: bool) -> str:
+    """The directory of the archive to unpack, "" for all of it."""
+    return "" if build_dir or "-full" not in original_filename else "install"
+
+
+def _skip(
+    original_filename: str, build_dir: bool, extract_filter: ExtractFilter
+) -> Callable[[str], bool]:
+    """Whether a member is skipped, given its path relative to the destination."""
+    if build_dir and "-full" in original_filename:
+        # The installed tree is unpacked in install/, next to build/
+        return extract_filter.skips_below("install")
+    return extract_filter.skips
 
 
 def install(
-    request: str,
+    request: str | VersionRequest | VersionSpecifier,
     destination: StrPath,
     version_dir: bool = False,
     client: httpx.Client | None = None,
@@ -166,6 +495,16 @@ def install(
     implementation: PythonImplementation = "cpython",
     build_dir: bool = False,
     free_threaded: bool = False,
+    segments: int = 1,
+    cache_dir: StrPath | None = None,
+    mirrors: Sequence[str] | None = None,
+    hedge_after: float | None = None,
+    retry: RetryPolicy | None = None,
+    progress: Callable[[ProgressEvent], object] | None = None,
+    stream: bool = False,
+    profile: Profile = "full",
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
 ) -> None:
     """Download and install the requested python version.
 
@@ -173,21 +512,108 @@ def install(
         `pbs-installer[all]` must be installed to use this function.
 
     Parameters:
-        request: The version of Python to install, e.g. 3.8,3.10.4
+        request: The version of Python to install, e.g. 3.8,3.10.4, >=3.10,<3.13,
+            or a [`VersionRequest`][pbs_installer.VersionRequest] or
+            [`VersionSpecifier`][pbs_installer.VersionSpecifier] parsed beforehand
         destination: The directory to install to
         version_dir: Whether to install to a subdirectory named with the python version
-        client: A httpx.Client to use for downloading
+        client: A httpx.Client to use for downloading, defaults to a client shared by all calls
         arch: The architecture to install, e.g. x86_64, arm64
         platform: The platform to install, e.g. linux, macos
         implementation: The implementation of Python to install, allowed values are 'cpython' and 'pypy'
         build_dir: Whether to include the `build/` directory from indygreg builds
         free_threaded: Whether to install the freethreaded version of Python
+        segments: The maximum number of connections to download the archive over,
+            see [`download`][pbs_installer.download]
+        cache_dir: The directory to cache downloaded archives in, defaults to the
+            `PBS_INSTALLER_CACHE_DIR` environment variable
+        mirrors: Mirrors as `PREFIX=REPLACEMENT` entries, see [`download`][pbs_installer.download]
+        hedge_after: The seconds to wait for a response before sending a second request,
+            see [`download`][pbs_installer.download]
+        retry: How failed requests are retried, see [`download`][pbs_installer.download]
+        progress: Called with a [`ProgressEvent`][pbs_installer.ProgressEvent] as the install
+            advances, from resolving the version through downloading to extracting the archive
+        stream: Extract tar archives while they are downloaded, into a staging directory that
+            is moved into place once the checksum matches. The download then uses a single
+            connection. Without a checksum, or if the stream is disrupted, the archive is
+            extracted after the download as usual.
+        profile: Which files to install, `full`, `runtime` (without the test suites and
+            static libraries) or `minimal` (also without IDLE, tkinter, Tcl/Tk and the wheels
+            of `ensurepip`). Unless everything is installed, the profile is recorded in
+            `PBS_INSTALLER_PROFILE.json` in the installed tree
+        include: Globs of paths in the installed tree to install even if the profile or
+            `exclude` skips them, e.g. `lib/python3.*/idlelib`
+        exclude: Globs of paths in the installed tree to skip, e.g. `share/man`. `*` doesn't
+            match `/`, and a glob that matches a directory skips everything below it
+
+    Raises:
+        ValueError: If the profile is unknown
+
     Examples:
         >>> install("3.10", "./python")
         Installing cpython@3.10.4 to ./python
         >>> install("3.10", "./python", version_dir=True)
         Installing cpython@3.10.4 to ./python/cpython@3.10.4
     """
+    from ._cache import get_cache
+    from ._profiles import ExtractFilter
+
+    extract_filter = ExtractFilter.create(profile, include, exclude)
+    tracker = ProgressTracker(progress) if progress is not None else None
+    if tracker is not None:
+        tracker.enter("resolve")
+    destination, python_file = _resolve_install(
+        request, destination, version_dir, arch, platform, implementation, build_dir, free_threaded
+    )
+    original_filename = _original_filename(python_file[0])
+    extractor = (
+        _streaming_extractor(destination, python_file, build_dir, extract_filter)
+        if stream
+        else None
+    )
+    options: dict[str, Any] = {
+        "segments": segments,
+        "mirrors": mirrors,
+        "hedge_after": hedge_after,
+        "retry": retry,
+        "progress": progress,
+        "tee": extractor.feed if extractor is not None else None,
+    }
+    try:
+        cache = get_cache(cache_dir)
+        if cache is not None and python_file[1]:
+            archive, _ = _cached_download(cache, python_file, client, **options)
+            _extract(
+                archive,
+                destination,
+                original_filename,
+                build_dir,
+                extract_filter,
+                extractor,
+                tracker,
+            )
+            return
+        with _temporary_path() as path:
+            _download(python_file, path, client, cache_dir="", **options)
+            _extract(
+                path, destination, original_filename, build_dir, extract_filter, extractor, tracker
+            )
+    finally:
+        if extractor is not None:
+            extractor.discard()
+
+
+def _resolve_install(
+    request: str | VersionRequest | VersionSpecifier,
+    destination: StrPath,
+    version_dir: bool,
+    arch: str | None,
+    platform: str | None,
+    implementation: PythonImplementation,
+    build_dir: bool,
+    free_threaded: bool,
+) -> tuple[str, PythonFile]:
+    """Resolve the download for `install` and create the directory to install to."""
     if platform is None:
         platform = THIS_PLATFORM
     if arch is None:
@@ -205,7 +631,345 @@ def install(
         destination = os.path.join(destination, str(ver))
     logger.debug("Installing %s to %s", ver, destination)
     os.makedirs(destination, exist_ok=True)
-    with tempfile.NamedTemporaryFile() as tf:
-        tf.close()
-        original_filename = download(python_file, tf.name, client)
-        install_file(tf.name, destination, original_filename, build_dir)
+    return os.fspath(destination), python_file
+
+
+def _streaming_extractor(
+    destination: str, python_file: PythonFile, build_dir: bool, extract_filter: ExtractFilter
+) -> StreamingExtractor | None:
+    """An extractor for `install(stream=True)`, if the archive can be extracted as a stream."""
+    from ._stream import StreamingExtractor
+
+    url, checksum = python_file
+    original_filename = _original_filename(url)
+    # The extracted data is only trusted if it matches the checksum, zip needs random access
+    if not checksum or original_filename.endswith(".zip"):
+        return None
+    return StreamingExtractor(
+        destination,
+        checksum,
+        _subdir(original_filename, build_dir),
+        _skip(original_filename, build_dir, extract_filter),
+    )
+
+
+def _extract(
+    archive: str,
+    destination: str,
+    original_filename: str,
+    build_dir: bool,
+    extract_filter: ExtractFilter,
+    extractor: StreamingExtractor | None,
+    tracker: ProgressTracker | None,
+) -> None:
+    """Publish what `extractor` extracted while downloading, or extract `archive`."""
+    if tracker is not None:
+        tracker.enter("extract")
+    if extractor is not None:
+        if extractor.finish():
+            extractor.publish()
+            extract_filter.record(destination)
+            return
+        extractor.discard()
+    install_file(
+        archive,
+        destination,
+        original_filename,
+        build_dir,
+        extract_filter.profile,
+        extract_filter.include,
+        extract_filter.exclude,
+    )
+
+
+@contextlib.contextmanager
+def _temporary_path() -> Iterator[str]:
+    from ._download import PART_SUFFIX, STATE_SUFFIX
+
+    fd, path = tempfile.mkstemp(prefix="pbs-installer-")
+    os.close(fd)
+    try:
+        yield path
+    finally:
+        # The download is resumable so that retries continue, remove what it left behind
+        for leftover in (path, path + PART_SUFFIX, path + STATE_SUFFIX):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(leftover)
+
+
+async def _run_in_executor(func: Callable[..., T], *args: Any) -> T:
+    """Run `func` in the default executor, waiting for it to finish even when cancelled."""
+    import asyncio
+
+    future = asyncio.get_running_loop().run_in_executor(None, func, *args)
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # The worker thread can't be interrupted, let it finish before cleaning up
+        await asyncio.wait([future])
+        raise
+
+
+async def _acached_download(
+    cache: DownloadCache,
+    python_file: PythonFile,
+    client: httpx.AsyncClient | None,
+    **options: Any,
+) -> tuple[str, DownloadResult]:
+    url, checksum = python_file
+    assert checksum
+    results: list[DownloadResult] = []
+
+    async def fetch(path: str, resume: bool) -> None:
+        results.append(
+            await _adownload(python_file, path, client, resume=resume, cache_dir="", **options)
+        )
+
+    return await cache.afetch(checksum, fetch), _cache_result(url, results)
+
+
+async def adownload(
+    python_file: PythonFile,
+    destination: StrPath,
+    client: httpx.AsyncClient | None = None,
+    resume: bool = True,
+    cache_dir: StrPath | None = None,
+    chunk_size: int | None = None,
+    mirrors: Sequence[str] | None = None,
+    hedge_after: float | None = None,
+    retry: RetryPolicy | None = None,
+    progress: Callable[[ProgressEvent], object] | None = None,
+) -> DownloadResult:
+    """Download the given url to the destination without blocking the event loop.
+
+    The body is streamed on the event loop, writing and hashing run in the default
+    executor. If the task is cancelled, an unfinished download without `resume` is
+    removed, while a resumable one is checkpointed to continue later.
+
+    Note: Extras required
+        `pbs-installer[download]` must be installed to use this function.
+
+    Parameters:
+        python_file: The (url, checksum) tuple to download
+        destination: The file path to download to
+        client: A httpx.AsyncClient to use for downloading, e.g. the `async_client` of a
+            [`Session`][pbs_installer.Session], or None to use a temporary one
+        resume: Whether to keep the received data in `<destination>.part`,
+            see [`download`][pbs_installer.download]
+        cache_dir: The directory to cache downloaded archives in,
+            see [`download`][pbs_installer.download]
+        chunk_size: The number of bytes to gather before hashing and writing them, 1 MiB by default
+        mirrors: Mirrors as `PREFIX=REPLACEMENT` entries, see [`download`][pbs_installer.download]
+        hedge_after: The seconds to wait for a response before sending a second request,
+            see [`download`][pbs_installer.download]
+        retry: How failed requests are retried, see [`download`][pbs_installer.download]
+        progress: Called with a [`ProgressEvent`][pbs_installer.ProgressEvent] as the
+            download advances, see [`download`][pbs_installer.download]
+
+    Returns:
+        The original filename of the downloaded file, as a
+        [`DownloadResult`][pbs_installer.DownloadResult]
+    """
+    return await _adownload(
+        python_file,
+        destination,
+        client,
+        resume=resume,
+        cache_dir=cache_dir,
+        chunk_size=chunk_size,
+        mirrors=mirrors,
+        hedge_after=hedge_after,
+        retry=retry,
+        progress=progress,
+    )
+
+
+async def _adownload(
+    python_file: PythonFile,
+    destination: StrPath,
+    client: httpx.AsyncClient | None,
+    *,
+    resume: bool = True,
+    cache_dir: StrPath | None = None,
+    chunk_size: int | None = None,
+    mirrors: Sequence[str] | None = None,
+    hedge_after: float | None = None,
+    retry: RetryPolicy | None = None,
+    progress: Callable[[ProgressEvent], object] | None = None,
+    tee: Tee | None = None,
+) -> DownloadResult:
+    """`adownload`, passing the data to `tee` as it is written, see `fetch`."""
+    from ._cache import get_cache
+
+    url, checksum = python_file
+    cache = get_cache(cache_dir)
+    if cache is not None and checksum:
+        cached, result = await _acached_download(
+            cache,
+            python_file,
+            client,
+            chunk_size=chunk_size,
+            mirrors=mirrors,
+            hedge_after=hedge_after,
+            retry=retry,
+            progress=progress,
+            tee=tee,
+        )
+        await _run_in_executor(shutil.copyfile, cached, destination)
+        return result
+
+    logger.debug("Downloading url %s to %s", url, destination)
+    from ._download import CHUNK_SIZE, afetch_any
+    from ._mirrors import SLOW_MIRROR_SPEED, arank, candidate_urls, get_mirrors
+
+    if not checksum:
+        logger.warning("No checksum found for %s, this would be insecure", url)
+
+    async def fetch(client: httpx.AsyncClient) -> tuple[str, list[tuple[str, str]]]:
+        urls = await arank(client, candidate_urls(url, get_mirrors(mirrors)))
+        return await afetch_any(
+            client,
+            urls,
+            url,
+            checksum,
+            destination,
+            _get_headers(),
+            resume=resume,
+            chunk_size=chunk_size or CHUNK_SIZE,
+            min_speed=SLOW_MIRROR_SPEED,
+            hedge_after=hedge_after,
+            retry=retry,
+            progress=ProgressTracker(progress) if progress is not None else None,
+            tee=tee,
+        )
+
+    if client is None:
+        from ._session import Session
+
+        # The async client is bound to the running loop, so it can't be shared globally
+        async with Session() as session:
+            used, failures = await fetch(session.async_client)
+    else:
+        used, failures = await fetch(client)
+    return DownloadResult(_original_filename(url), used, len(failures) + 1, tuple(failures))
+
+
+async def ainstall(
+    request: str | VersionRequest | VersionSpecifier,
+    destination: StrPath,
+    version_dir: bool = False,
+    client: httpx.AsyncClient | None = None,
+    arch: str | None = None,
+    platform: str | None = None,
+    implementation: PythonImplementation = "cpython",
+    build_dir: bool = False,
+    free_threaded: bool = False,
+    cache_dir: StrPath | None = None,
+    mirrors: Sequence[str] | None = None,
+    hedge_after: float | None = None,
+    retry: RetryPolicy | None = None,
+    progress: Callable[[ProgressEvent], object] | None = None,
+    stream: bool = False,
+    profile: Profile = "full",
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+) -> None:
+    """Download and install the requested python version without blocking the event loop.
+
+    The archive is extracted in the default executor. Cancelling the task removes the
+    temporary archive, once an extraction that is already running has finished.
+
+    Note: Extras required
+        `pbs-installer[all]` must be installed to use this function.
+
+    Parameters:
+        request: The version of Python to install, see [`install`][pbs_installer.install]
+        destination: The directory to install to
+        version_dir: Whether to install to a subdirectory named with the python version
+        client: A httpx.AsyncClient to use for downloading
+        arch: The architecture to install, e.g. x86_64, arm64
+        platform: The platform to install, e.g. linux, macos
+        implementation: The implementation of Python to install, allowed values are 'cpython' and 'pypy'
+        build_dir: Whether to include the `build/` directory from indygreg builds
+        free_threaded: Whether to install the freethreaded version of Python
+        cache_dir: The directory to cache downloaded archives in, defaults to the
+            `PBS_INSTALLER_CACHE_DIR` environment variable
+        mirrors: Mirrors as `PREFIX=REPLACEMENT` entries, see [`download`][pbs_installer.download]
+        hedge_after: The seconds to wait for a response before sending a second request,
+            see [`download`][pbs_installer.download]
+        retry: How failed requests are retried, see [`download`][pbs_installer.download]
+        progress: Called with a [`ProgressEvent`][pbs_installer.ProgressEvent] as the install
+            advances, from resolving the version through downloading to extracting the archive
+        stream: Extract tar archives while they are downloaded, into a staging directory that
+            is moved into place once the checksum matches. The download then uses a single
+            connection. Without a checksum, or if the stream is disrupted, the archive is
+            extracted after the download as usual.
+        profile: Which files to install, `full`, `runtime` (without the test suites and
+            static libraries) or `minimal` (also without IDLE, tkinter, Tcl/Tk and the wheels
+            of `ensurepip`). Unless everything is installed, the profile is recorded in
+            `PBS_INSTALLER_PROFILE.json` in the installed tree
+        include: Globs of paths in the installed tree to install even if the profile or
+            `exclude` skips them, e.g. `lib/python3.*/idlelib`
+        exclude: Globs of paths in the installed tree to skip, e.g. `share/man`. `*` doesn't
+            match `/`, and a glob that matches a directory skips everything below it
+
+    Raises:
+        ValueError: If the profile is unknown
+
+    Examples:
+        >>> await ainstall("3.10", "./python")
+        Installing cpython@3.10.4 to ./python
+    """
+    from ._cache import get_cache
+    from ._profiles import ExtractFilter
+
+    extract_filter = ExtractFilter.create(profile, include, exclude)
+    tracker = ProgressTracker(progress) if progress is not None else None
+    if tracker is not None:
+        tracker.enter("resolve")
+    destination, python_file = _resolve_install(
+        request, destination, version_dir, arch, platform, implementation, build_dir, free_threaded
+    )
+    original_filename = _original_filename(python_file[0])
+    extractor = (
+        _streaming_extractor(destination, python_file, build_dir, extract_filter)
+        if stream
+        else None
+    )
+    options: dict[str, Any] = {
+        "mirrors": mirrors,
+        "hedge_after": hedge_after,
+        "retry": retry,
+        "progress": progress,
+        "tee": extractor.feed if extractor is not None else None,
+    }
+    try:
+        cache = get_cache(cache_dir)
+        if cache is not None and python_file[1]:
+            archive, _ = await _acached_download(cache, python_file, client, **options)
+            await _run_in_executor(
+                _extract,
+                archive,
+                destination,
+                original_filename,
+                build_dir,
+                extract_filter,
+                extractor,
+                tracker,
+            )
+            return
+        with _temporary_path() as path:
+            await _adownload(python_file, path, client, cache_dir="", **options)
+            await _run_in_executor(
+                _extract,
+                path,
+                destination,
+                original_filename,
+                build_dir,
+                extract_filter,
+                extractor,
+                tracker,
+            )
+    finally:
+        if extractor is not None:
+            await _run_in_executor(extractor.discard)
@@ -0,0 +1,161 @@
+"""Rewrite download URLs to mirrors and rank them by latency."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+MIRRORS_ENV = "PBS_INSTALLER_MIRRORS"
+PROBE_TIMEOUT = 3.0
+# How long a measured latency is trusted before the host is probed again
+PROBE_TTL = 600.0
+# A mirror that sends fewer bytes per second is abandoned for the next one
+SLOW_MIRROR_SPEED = 256 * 1024
+
+# host -> (latency or None if unreachable, time measured)
+_latencies: dict[str, tuple[float | None, float]] = {}
+_lock = threading.Lock()
+
+
+def parse_mirrors(entries: Sequence[str]) -> list[tuple[str, str]]:
+    """Parse `prefix=replacement` entries into (prefix, replacement) pairs.
+
+    Raises:
+        ValueError: If an entry has no `=`
+    """
+    result: list[tuple[str, str]] = []
+    for entry in entries:
+        prefix, sep, replacement = entry.partition("=")
+        if not sep or not prefix or not replacement:
+            raise ValueError(f"Invalid mirror {entry!r}, expected PREFIX=REPLACEMENT")
+        result.append((prefix, replacement))
+    return result
+
+
+def get_mirrors(mirrors: Sequence[str] | None = None) -> list[tuple[str, str]]:
+    """The mirrors to use, from the argument or the `PBS_INSTALLER_MIRRORS`
+    environment variable, whose entries are separated by whitespace."""
+    if mirrors is None:
+        mirrors = os.getenv(MIRRORS_ENV, "").split()
+    return parse_mirrors(mirrors)
+
+
+def candidate_urls(url: str, mirrors: Sequence[tuple[str, str]]) -> list[str]:
+    """The mirrored URLs of `url` in the configured order, followed by `url` itself."""
+    urls = [
+        replacement + url[len(prefix) :]
+        for prefix, replacement in mirrors
+        if url.startswith(prefix)
+    ]
+    urls.append(url)
+    return list(dict.fromkeys(urls))
+
+
+def _host(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _probe(client: httpx.Client, url: str) -> float | None:
+    start = time.monotonic()
+    try:
+        resp = client.head(url, timeout=PROBE_TIMEOUT)
+    except Exception as e:  # any failure means the host is unusable for now
+        logger.debug("Probing %s failed: %s", url, e)
+        return None
+    # A client error is about the url, the host itself answered
+    if resp.status_code >= 500:
+        logger.debug("Probing %s failed: HTTP %d", url, resp.status_code)
+        return None
+    return time.monotonic() - start
+
+
+def _stale(urls: list[str]) -> list[str]:
+    now = time.monotonic()
+    with _lock:
+        return [
+            url
+            for url in urls
+            if _host(url) not in _latencies or now - _latencies[_host(url)][1] > PROBE_TTL
+        ]
+
+
+def _record(urls: list[str], latencies: list[float | None]) -> None:
+    now = time.monotonic()
+    with _lock:
+        for url, latency in zip(urls, latencies):
+            _latencies[_host(url)] = (latency, now)
+
+
+def _ranked(urls: list[str]) -> list[str]:
+    with _lock:
+        latencies = {url: _latencies[_host(url)][0] for url in urls}
+    ranked = sorted(urls, key=lambda url: (latencies[url] is None, latencies[url] or 0.0))
+    if logger.isEnabledFor(logging.DEBUG):
+        described = []
+        for url in ranked:
+            latency = latencies[url]
+            described.append(
+                f"{_host(url)}: {'unreachable' if latency is None else f'{latency * 1000:.0f}ms'}"
+            )
+        logger.debug("Mirror latencies: %s", ", ".join(described))
+    return ranked
+
+
+def rank(client: httpx.Client, urls: list[str]) -> list[str]:
+    """Order `urls` by the latency of their hosts, fastest first.
+
+    Hosts without a recent measurement are probed concurrently with a HEAD request.
+    Hosts that can't be connected to or answer with a server error are unreachable,
+    they keep their relative order at the end of the list.
+    """
+    if len(urls) < 2:
+        return urls
+    stale = _stale(urls)
+    if stale:
+        with ThreadPoolExecutor(len(stale)) as executor:
+            _record(stale, list(executor.map(lambda url: _probe(client, url), stale)))
+    return _ranked(urls)
+
+
+async def _aprobe(client: httpx.AsyncClient, url: str) -> float | None:
+    start = time.monotonic()
+    try:
+        resp = await client.head(url, timeout=PROBE_TIMEOUT)
+    except Exception as e:  # any failure means the host is unusable for now
+        logger.debug("Probing %s failed: %s", url, e)
+        return None
+    # A client error is about the url, the host itself answered
+    if resp.status_code >= 500:
+        logger.debug("Probing %s failed: HTTP %d", url, resp.status_code)
+        return None
+    return time.monotonic() - start
+
+
+async def arank(client: httpx.AsyncClient, urls: list[str]) -> list[str]:
+    """The asynchronous version of `rank`."""
+    import asyncio
+
+    if len(urls) < 2:
+        return urls
+    stale = _stale(urls)
+    if stale:
+        _record(stale, list(await asyncio.gather(*(_aprobe(client, url) for url in stale))))
+    return _ranked(urls)
+
+
+def reset_latencies() -> None:
+    """Forget the measured latencies, so that the next download probes again."""
+    with _lock:
+        _latencies.clear()
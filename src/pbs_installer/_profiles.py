@@ -0,0 +1,173 @@
+"""Choose which files of an archive are installed."""
+
+from __future__ import annotations
+
+import functools
+import os
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Callable
+    from typing import Literal
+
+    from _typeshed import StrPath
+
+    Profile = Literal["full", "runtime", "minimal"]
+
+# Written to the root of the installed tree
+PROFILE_FILE = "PBS_INSTALLER_PROFILE.json"
+
+# Paths relative to the installed tree, in the layouts of unix and Windows builds,
+# starting with the standard library of CPython and PyPy
+_STDLIBS = ("lib/python3.*", "Lib", "lib/pypy3.*", "lib-python/3")
+_TESTS = tuple(
+    f"{stdlib}/{path}"
+    for stdlib in _STDLIBS
+    for path in ("test", "*/test", "*/tests", "idlelib/idle_test")
+)
+_STATIC_LIBRARIES = ("lib/libpython3*.a", "lib/python3.*/config-*/*.a")
+_TK = tuple(
+    f"{stdlib}/{path}" for stdlib in _STDLIBS for path in ("idlelib", "tkinter", "turtledemo")
+) + (
+    "bin/idle3*",
+    "lib/python3.*/lib-dynload/_tkinter*",
+    "lib/pypy3.*/_tkinter",
+    "lib_pypy/_tkinter",
+    "lib/tcl[89]*",
+    "lib/tk[89]*",
+    "lib/itcl*",
+    "lib/thread[23]*",
+    "lib/libtcl*",
+    "lib/libtk*",
+    "DLLs/_tkinter.pyd",
+    "DLLs/tcl*.dll",
+    "DLLs/tk*.dll",
+    "tcl",
+)
+_ENSUREPIP_WHEELS = tuple(f"{stdlib}/ensurepip/_bundled" for stdlib in _STDLIBS)
+
+PROFILES: dict[str, tuple[str, ...]] = {
+    "full": (),
+    "runtime": _TESTS + _STATIC_LIBRARIES,
+    "minimal": _TESTS + _STATIC_LIBRARIES + _TK + _ENSUREPIP_WHEELS,
+}
+
+
+def _translate(glob: str) -> str:
+    """A regular expression for `glob`, like `fnmatch.translate` but with `*` and `?`
+    matching within a single path segment."""
+    import re
+
+    result = []
+    i, n = 0, len(glob)
+    while i < n:
+        c = glob[i]
+        i += 1
+        if c == "*":
+            result.append("[^/]*")
+        elif c == "?":
+            result.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and glob[j] == "!":
+                j += 1
+            if j < n and glob[j] == "]":
+                j += 1
+            while j < n and glob[j] != "]":
+                j += 1
+            if j >= n:
+                result.append("\\[")
+                continue
+            chars = glob[i:j].replace("\\", "\\\\")
+            i = j + 1
+            if chars[0] == "!":
+                chars = "^" + chars[1:]
+            elif chars[0] in "^[":
+                chars = "\\" + chars
+            result.append(f"[{chars}]")
+        else:
+            result.append(re.escape(c))
+    return "".join(result)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile(globs: tuple[str, ...]) -> re.Pattern[str] | None:
+    """A pattern matching the paths matched by `globs` and everything below them."""
+    import re
+
+    if not globs:
+        return None
+    alternatives = [f"(?:{_translate(glob)})(?:/.*)?" for glob in globs]
+    return re.compile(f"(?s:{'|'.join(alternatives)})\\Z")
+
+
+class ExtractFilter(NamedTuple):
+    """Which members of an archive are unpacked.
+
+    Members matching the `exclude` globs of the profile or of the user are
+    skipped, unless they match one of the `include` globs. Globs are matched like
+    `fnmatch` against paths relative to the installed tree, e.g. `lib/python3.*/test`,
+    except that `*` and `?` don't match `/`. A glob matching a directory matches
+    everything below it.
+    """
+
+    profile: Profile = "full"
+    """`full` installs everything. `runtime` skips test suites and static libraries.
+    `minimal` also skips IDLE, tkinter with Tcl/Tk, and the wheels `ensurepip` needs,
+    so virtual environments must be created `--without-pip`"""
+    include: tuple[str, ...] = ()
+    """Globs of paths to install even if they are excluded"""
+    exclude: tuple[str, ...] = ()
+    """Globs of paths to skip, in addition to those of the profile"""
+
+    @classmethod
+    def create(
+        cls, profile: str = "full", include: Sequence[str] = (), exclude: Sequence[str] = ()
+    ) -> ExtractFilter:
+        """Build a filter, validating the profile name.
+
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown profile {profile!r}, expected one of {', '.join(PROFILES)}")
+        return cls(cast("Profile", profile), tuple(include), tuple(exclude))
+
+    def skips(self, name: str) -> bool:
+        """Whether the member at `name`, relative to the installed tree, is skipped"""
+        excluded = _compile(PROFILES[self.profile] + self.exclude)
+        if excluded is None or not excluded.match(name):
+            return False
+        included = _compile(self.include)
+        return included is None or not included.match(name)
+
+    def skips_below(self, prefix: str) -> Callable[[str], bool]:
+        """`skips` for an archive whose installed tree is in the directory `prefix`,
+        e.g. `install` of a `-full` build unpacked with its build directory. Paths
+        outside of it are never skipped."""
+        start = f"{prefix}/"
+
+        def skips(name: str) -> bool:
+            return name.startswith(start) and self.skips(name[len(start) :])
+
+        return skips
+
+    def record(self, destination: StrPath) -> None:
+        """Write the filter to `PROFILE_FILE` in the installed tree, unless it installs
+        everything, which removes the file left by an earlier install instead."""
+        import json
+
+        path = os.path.join(destination, PROFILE_FILE)
+        if self == ExtractFilter():
+            if os.path.exists(path):
+                os.unlink(path)
+            return
+        with open(path, "w") as f:
+            json.dump(
+                {"profile": self.profile, "include": self.include, "exclude": self.exclude},
+                f,
+                indent=2,
+            )
+            f.write("\n")
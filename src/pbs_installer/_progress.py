@@ -0,0 +1,109 @@
+"""Report the progress of downloads and installs to a callback."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from typing import Literal
+
+    Phase = Literal["resolve", "connect", "download", "verify", "extract"]
+
+# The minimum seconds between two events of the download phase
+PROGRESS_INTERVAL = 0.1
+
+
+class ProgressEvent(NamedTuple):
+    """A snapshot of a download or install, passed to the `progress` callback.
+
+    The phases are `resolve` (finding the build to install), `connect` (waiting for
+    the response), `download`, `verify` (checking the SHA-256) and `extract`. A
+    retried or failed over download goes back to `connect`.
+    """
+
+    phase: Phase
+    """The current step"""
+    url: str | None = None
+    """The url being downloaded, a mirror or the original url"""
+    total: int | None = None
+    """The size of the file in bytes, if the server sent a Content-Length"""
+    received: int = 0
+    """The bytes received so far, including those of a resumed partial download"""
+    speed: float = 0.0
+    """The bytes per second since the previous event"""
+    average_speed: float = 0.0
+    """The bytes per second since the response started"""
+    ttfb: float | None = None
+    """The seconds between sending the request and receiving the response headers"""
+
+
+class ProgressTracker:
+    """Turn the steps of a download into `ProgressEvent`s.
+
+    Events of the download phase are sent at most every `PROGRESS_INTERVAL`
+    seconds, and once more when the last byte arrives. The callback runs in the
+    downloading thread, an exception it raises aborts the download.
+    """
+
+    def __init__(self, callback: Callable[[ProgressEvent], object]) -> None:
+        self.callback = callback
+        self.phase: Phase = "resolve"
+        self.url: str | None = None
+        self.total: int | None = None
+        self.received = 0
+        self.speed = 0.0
+        self.ttfb: float | None = None
+        self._sent = self._started = self._last_time = time.monotonic()
+        self._base = self._last_received = 0
+        self._next = 0.0
+
+    def _emit(self, now: float) -> None:
+        elapsed = now - self._started
+        self.callback(
+            ProgressEvent(
+                self.phase,
+                self.url,
+                self.total,
+                self.received,
+                self.speed,
+                (self.received - self._base) / elapsed if elapsed > 0 else 0.0,
+                self.ttfb,
+            )
+        )
+
+    def enter(self, phase: Phase) -> None:
+        self.phase = phase
+        self._emit(time.monotonic())
+
+    def connect(self, url: str, received: int) -> None:
+        """A request for `url` is sent, to continue from byte `received`."""
+        self.url = url
+        self.total = self.ttfb = None
+        self.received = received
+        self.speed = 0.0
+        self._sent = time.monotonic()
+        self.enter("connect")
+
+    def start(self, url: str, total: int | None, received: int) -> None:
+        """The response headers arrived, the body follows from byte `received`."""
+        now = time.monotonic()
+        self.url = url
+        self.total = total
+        self.received = self._base = self._last_received = received
+        self.ttfb = now - self._sent
+        self._started = self._last_time = now
+        self._next = now + PROGRESS_INTERVAL
+        self.phase = "download"
+        self._emit(now)
+
+    def advance(self, size: int) -> None:
+        """`size` more bytes were received."""
+        self.received += size
+        now = time.monotonic()
+        if now >= self._next or self.received == self.total:
+            self.speed = (self.received - self._last_received) / max(now - self._last_time, 1e-9)
+            self._last_received, self._last_time = self.received, now
+            self._next = now + PROGRESS_INTERVAL
+            self._emit(now)
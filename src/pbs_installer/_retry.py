@@ -0,0 +1,111 @@
+"""Decide whether and when a failed download is retried."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import NamedTuple
+
+# Statuses that say the server is temporarily unable to respond, anything else is final
+RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class RetryPolicy(NamedTuple):
+    """How failed downloads are retried.
+
+    A request that fails with a connection error, a timeout or one of the
+    `retry_statuses` is sent again after an exponential backoff, up to
+    `max_attempts` times per url. Other failures, e.g. 404 or a checksum mismatch,
+    move on to the next mirror right away. Resumable downloads continue from the
+    last verified byte instead of starting over.
+
+    Examples:
+        >>> download(python_file, "python.tar.gz", retry=RetryPolicy(max_attempts=5))
+        >>> install("3.12", "./python", retry=RetryPolicy(max_attempts=1))  # never retry
+    """
+
+    max_attempts: int = 3
+    """The number of attempts per url, including the first one"""
+    backoff: float = 1.0
+    """The delay in seconds before the first retry, doubled for each following one"""
+    max_backoff: float = 30.0
+    """The longest delay in seconds. A server that asks for a longer one in its
+    `Retry-After` header is not retried"""
+    jitter: float = 0.5
+    """The fraction of each delay that is randomized, so that clients don't retry in lockstep"""
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    """The HTTP statuses that are retried"""
+
+    def retryable(self, error: BaseException) -> bool:
+        """Whether the request that raised `error` may succeed when sent again."""
+        import httpx
+
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return isinstance(
+            error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+        )
+
+    def delay(self, attempt: int, error: BaseException) -> float | None:
+        """The seconds to wait before attempt number `attempt + 1`, or None to give up."""
+        if attempt >= self.max_attempts or not self.retryable(error):
+            return None
+        retry_after = _retry_after(error)
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+        delay = min(self.max_backoff, self.backoff * 2.0 ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+
+def _retry_after(error: BaseException) -> float | None:
+    import httpx
+
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    value = error.response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    import email.utils
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, date.timestamp() - time.time())
+
+
+class DownloadResult(str):
+    """The original filename of a downloaded file, along with how it was obtained.
+
+    It is returned by [`download`][pbs_installer.download] and compares equal
+    to the plain filename.
+    """
+
+    url: str
+    """The url the file was downloaded from, a mirror or the original url"""
+    attempts: int
+    """The number of requests it took, 0 if the file came from the cache"""
+    errors: tuple[tuple[str, str], ...]
+    """The (url, error) of each failed attempt, in order"""
+
+    def __new__(
+        cls,
+        filename: str,
+        url: str,
+        attempts: int = 1,
+        errors: tuple[tuple[str, str], ...] = (),
+    ) -> DownloadResult:
+        result = super().__new__(cls, filename)
+        result.url = url
+        result.attempts = attempts
+        result.errors = errors
+        return result
+
+    def __reduce__(
+        self,
+    ) -> tuple[type[DownloadResult], tuple[str, str, int, tuple[tuple[str, str], ...]]]:
+        return DownloadResult, (str(self), self.url, self.attempts, self.errors)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class Session:
+    """A pair of pooled HTTP clients shared by downloads and installs.
+
+    Connections are kept alive between calls, so installing several versions only
+    pays for the DNS lookups and TLS handshakes once. The clients are created on
+    first use, once even when several threads ask for them, and closed with the session.
+
+    Note: Extras required
+        `pbs-installer[download]` must be installed to use this class, and
+        `pbs-installer[http2]` to enable HTTP/2.
+
+    Parameters:
+        http2: Whether to enable HTTP/2, multiplexing the requests to a host over one connection
+        timeout: The timeout in seconds for connecting and for each read or write,
+            or a `httpx.Timeout` to set them separately
+        max_connections: The maximum number of connections in the pool
+        max_keepalive_connections: The maximum number of idle connections kept alive
+        trust_env: Whether to read proxies and certificates from the environment
+
+    Examples:
+        >>> with Session(http2=True) as session:
+        ...     for version in ["3.11", "3.12", "3.13"]:
+        ...         install(version, f"./python{version}", client=session.client)
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = False,
+        timeout: float | httpx.Timeout | None = DEFAULT_TIMEOUT,
+        max_connections: int | None = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int | None = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        trust_env: bool = True,
+    ) -> None:
+        self.http2 = http2
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.trust_env = trust_env
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._lock = threading.Lock()
+
+    def _client_options(self) -> dict[str, Any]:
+        try:
+            import httpx
+        except ModuleNotFoundError:
+            raise RuntimeError("You must install httpx to use this function") from None
+
+        return {
+            "http2": self.http2,
+            "timeout": self.timeout,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            "trust_env": self.trust_env,
+            "follow_redirects": True,
+        }
+
+    @property
+    def client(self) -> httpx.Client:
+        """The `httpx.Client` to pass to [`download`][pbs_installer.download] and
+        [`install`][pbs_installer.install]"""
+        client = self._client
+        if client is None:
+            with self._lock:
+                client = self._client
+                if client is None:
+                    import httpx
+
+                    client = self._client = httpx.Client(**self._client_options())
+        return client
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        """The `httpx.AsyncClient` to pass to [`adownload`][pbs_installer.adownload] and
+        [`ainstall`][pbs_installer.ainstall]. It is bound to the event loop it is first used in."""
+        client = self._async_client
+        if client is None:
+            with self._lock:
+                client = self._async_client
+                if client is None:
+                    import httpx
+
+                    client = self._async_client = httpx.AsyncClient(**self._client_options())
+        return client
+
+    def close(self) -> None:
+        """Close the synchronous client."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close both clients."""
+        self.close()
+        with self._lock:
+            client, self._async_client = self._async_client, None
+        if client is not None:
+            await client.aclose()
+
+    def __enter__(self) -> Session:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Session:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+
+_session: Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> Session:
+    """The session used by `download` and `install` when no client is given."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = Session()
+            atexit.register(_session.close)
+        return _session
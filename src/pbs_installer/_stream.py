@@ -0,0 +1,167 @@
+"""Extract a tar archive while it is being downloaded."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import queue
+import shutil
+import tempfile
+import threading
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+# The number of pieces, of up to one download chunk each, waiting for the extractor
+STREAM_QUEUE_DEPTH = 16
+
+
+# The staging directories in the destination start with it
+STAGING_PREFIX = ".pbs-installer-"
+
+
+def _merge_tree(source: str, destination: str) -> None:
+    """Move the contents of `source` into `destination`, replacing existing files,
+    and directories with files or the reverse."""
+    with os.scandir(source) as it:
+        entries = list(it)
+    for entry in entries:
+        target = os.path.join(destination, entry.name)
+        is_dir = os.path.isdir(target) and not os.path.islink(target)
+        if entry.is_dir(follow_symlinks=False):
+            if is_dir:
+                _merge_tree(entry.path, target)
+                continue
+            if os.path.lexists(target):
+                os.unlink(target)
+        elif is_dir:
+            shutil.rmtree(target)
+        os.replace(entry.path, target)
+    os.rmdir(source)
+
+
+def _remove_stale_staging(destination: str) -> None:
+    """Remove the staging directories left in `destination` by interrupted installs."""
+    with os.scandir(destination) as it:
+        stale = [entry.path for entry in it if entry.name.startswith(STAGING_PREFIX)]
+    for path in stale:
+        logger.debug("Removing the stale staging directory %s", path)
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class StreamingExtractor:
+    """Extract a tar archive on a worker thread from the pieces a download feeds it.
+
+    The download passes every piece with its offset as it is written, see `_Sink`.
+    Pieces that were fed before, e.g. when a retry continues from a checkpoint or
+    a mirror starts over, are skipped. The archive is unpacked into a staging
+    directory inside the destination, replacing those an interrupted install
+    left behind, and the bytes the extractor consumed are
+    hashed. `finish` tells whether they match the checksum, and only then is
+    the tree moved into place by `publish`. `subdir` and `skip` select the
+    members to extract, see `_unpack_tar`.
+    """
+
+    def __init__(
+        self,
+        destination: str,
+        checksum: str,
+        subdir: str = "",
+        skip: Callable[[str], bool] | None = None,
+    ) -> None:
+        self.destination = destination
+        self.checksum = checksum
+        self.subdir = subdir
+        self.skip = skip
+        self.staging: str | None = None
+        self.error: BaseException | None = None
+        self._fed = 0
+        self._broken = False
+        self._hasher = hashlib.sha256()
+        self._queue: queue.Queue[bytes | None] = queue.Queue(STREAM_QUEUE_DEPTH)
+        self._chunk = b""
+        self._position = 0
+        self._eof = False
+        self._thread: threading.Thread | None = None
+
+    def feed(self, offset: int, data: bytes | memoryview) -> None:
+        end = offset + len(data)
+        if end <= self._fed or self._broken:
+            return
+        if offset > self._fed:
+            # Data is missing in between, only the downloaded file can be trusted now
+            self._broken = True
+            return
+        if self._thread is None:
+            _remove_stale_staging(self.destination)
+            self.staging = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=self.destination)
+            self._thread = threading.Thread(
+                target=self._run, name="pbs-installer-extract", daemon=True
+            )
+            self._thread.start()
+        # The buffer behind `data` is reused once this returns
+        self._queue.put(bytes(data[self._fed - offset :]))
+        self._fed = end
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the fed data for `tarfile`, blocking until the download delivers it."""
+        while self._position >= len(self._chunk):
+            if self._eof:
+                return b""
+            chunk = self._queue.get()
+            if chunk is None:
+                self._eof = True
+                return b""
+            self._chunk, self._position = chunk, 0
+        end = len(self._chunk) if size < 0 else self._position + size
+        data = self._chunk[self._position : end]
+        self._position += len(data)
+        self._hasher.update(data)
+        return data
+
+    def _run(self) -> None:
+        from ._utils import unpack_tar_stream
+
+        assert self.staging is not None
+        try:
+            # tarfile only calls read() on a stream
+            unpack_tar_stream(cast("BinaryIO", self), self.staging, self.subdir, self.skip)
+        except BaseException as e:
+            self.error = e
+        # Consume the rest, so that the download never blocks and all of it is hashed
+        while self.read(1 << 20):
+            pass
+
+    def finish(self) -> bool:
+        """Wait for the extraction to end and tell whether it can be published."""
+        if self._thread is None:
+            return False
+        self._queue.put(None)
+        self._thread.join()
+        if self.error is not None:
+            logger.debug("Extracting while downloading failed: %s", self.error)
+            return False
+        if self._broken or self._hasher.hexdigest() != self.checksum:
+            logger.debug("The extracted data doesn't match the checksum")
+            return False
+        return True
+
+    def publish(self) -> None:
+        """Move the extracted tree into the destination."""
+        assert self.staging is not None
+        _merge_tree(self.staging, self.destination)
+        self.staging = None
+
+    def discard(self) -> None:
+        """Stop extracting and remove the staging directory, if it wasn't published."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self.staging is not None:
+            shutil.rmtree(self.staging, ignore_errors=True)
+            self.staging = None
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import functools
+import operator
+import re
 import sys
 from typing import TYPE_CHECKING, NamedTuple
 
@@ -18,8 +21,13 @@ else:
         ZSTD_SUPPORT = False
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from typing import BinaryIO
+
     from _typeshed import StrPath
 
+    VersionTuple = tuple[int, int, int]
+
 ARCH_MAPPING = {
     "arm64": "aarch64",
     "amd64": "x86_64",
@@ -38,29 +46,223 @@ class PythonVersion(NamedTuple):
     def __str__(self) -> str:
         return f"{self.implementation}@{self.major}.{self.minor}.{self.micro}{'t' if self.freethreaded else ''}"
 
-    def matches(self, request: str, implementation: str) -> bool:
-        if implementation != self.implementation:
+    def matches(
+        self, request: str | VersionRequest | VersionSpecifier, implementation: str
+    ) -> bool:
+        if isinstance(request, str):
+            request = parse_request(request, implementation)
+        elif implementation != request.implementation:
             return False
-        if self.freethreaded != request.endswith("t"):
-            return False
-        try:
-            parts = tuple(int(v) for v in request.rstrip("t").split("."))
-        except ValueError:
-            raise ValueError(
-                f"Invalid version: {request!r}, each part must be an integer"
-            ) from None
+        return request.contains(self)
 
-        if len(parts) < 1:
-            raise ValueError("Version must have at least one part")
 
-        if parts[0] != self.major:
-            return False
-        if len(parts) > 1 and parts[1] != self.minor:
-            return False
-        if len(parts) > 2 and parts[2] != self.micro:
+class VersionRequest(NamedTuple):
+    """A compiled version request, matching every release that starts with the given parts.
+
+    Instances are hashable and can be reused across resolutions, use
+    [`VersionRequest.parse`][pbs_installer.VersionRequest.parse] to build one from a string.
+    """
+
+    implementation: str
+    major: int
+    minor: int | None = None
+    micro: int | None = None
+    freethreaded: bool = False
+
+    @classmethod
+    def parse(cls, request: str, implementation: str = "cpython") -> VersionRequest:
+        """Parse a version request string.
+
+        Parameters:
+            request: The requested version, e.g. 3.12, 3.13.1t, pypy@3.10
+            implementation: The implementation to use if the request doesn't specify one
+
+        Examples:
+            >>> VersionRequest.parse("pypy@3.10")
+            VersionRequest(implementation='pypy', major=3, minor=10, micro=None, freethreaded=False)
+        """
+        return _parse_request(request, implementation)
+
+    @property
+    def version(self) -> str:
+        parts = [str(part) for part in (self.major, self.minor, self.micro) if part is not None]
+        return ".".join(parts) + ("t" if self.freethreaded else "")
+
+    def __str__(self) -> str:
+        return f"{self.implementation}@{self.version}"
+
+    def contains(self, version: PythonVersion) -> bool:
+        """Check if the given version satisfies this request"""
+        return (
+            version.implementation == self.implementation
+            and version.freethreaded == self.freethreaded
+            and version.major == self.major
+            and (self.minor is None or version.minor == self.minor)
+            and (self.micro is None or version.micro == self.micro)
+        )
+
+    def bounds(self) -> tuple[VersionTuple, VersionTuple]:
+        """The half-open range [lower, upper) of (major, minor, micro) versions
+        that can satisfy this request
+        """
+        parts = tuple(part for part in (self.major, self.minor, self.micro) if part is not None)
+        return _pad(parts), _bump(parts)
+
+
+class VersionSpecifier(NamedTuple):
+    """A compiled PEP 440-style version range, e.g. >=3.10,<3.13 or ~=3.12.2.
+
+    The supported operators are `==`, `!=`, `<`, `<=`, `>`, `>=` and `~=`, `==` and `!=`
+    also accept a trailing `.*` wildcard. Like [`VersionRequest`][pbs_installer.VersionRequest],
+    instances are hashable and can be reused across resolutions.
+    """
+
+    implementation: str
+    clauses: tuple[tuple[str, tuple[int, ...], bool], ...]
+    """The (operator, version parts, wildcard) clauses that must all be satisfied"""
+    freethreaded: bool = False
+
+    @classmethod
+    def parse(cls, request: str, implementation: str = "cpython") -> VersionSpecifier:
+        """Parse a comma-separated version specifier string.
+
+        Parameters:
+            request: The requested range, e.g. >=3.10,<3.13, pypy@~=3.10, >=3.13t
+            implementation: The implementation to use if the request doesn't specify one
+
+        Examples:
+            >>> VersionSpecifier.parse(">=3.10,!=3.11.*")
+            VersionSpecifier(implementation='cpython', clauses=(('>=', (3, 10), False), ('!=', (3, 11), True)), freethreaded=False)
+        """
+        return _parse_specifier(request, implementation)
+
+    @property
+    def version(self) -> str:
+        clauses = (
+            op + ".".join(map(str, parts)) + (".*" if wildcard else "")
+            for op, parts, wildcard in self.clauses
+        )
+        return ",".join(clauses) + ("t" if self.freethreaded else "")
+
+    def __str__(self) -> str:
+        return f"{self.implementation}@{self.version}"
+
+    def contains(self, version: PythonVersion) -> bool:
+        """Check if the given version satisfies all clauses of this specifier"""
+        if (
+            version.implementation != self.implementation
+            or version.freethreaded != self.freethreaded
+        ):
             return False
+        release = (version.major, version.minor, version.micro)
+        for op, parts, wildcard in self.clauses:
+            if op == "==" or op == "!=":
+                equal = release[: len(parts)] == parts if wildcard else release == _pad(parts)
+                if equal != (op == "=="):
+                    return False
+            elif op == "~=":
+                if release < _pad(parts) or release[: len(parts) - 1] != parts[:-1]:
+                    return False
+            elif not _COMPARATORS[op](release, _pad(parts)):
+                return False
         return True
 
+    def bounds(self) -> tuple[VersionTuple, VersionTuple]:
+        """The half-open range [lower, upper) of (major, minor, micro) versions
+        that can satisfy this specifier, `!=` clauses are not taken into account
+        """
+        lower, upper = _MIN_VERSION, _MAX_VERSION
+        for op, parts, wildcard in self.clauses:
+            if op == "==":
+                lower = max(lower, _pad(parts))
+                upper = min(upper, _bump(parts if wildcard else _pad(parts)))
+            elif op == "~=":
+                lower = max(lower, _pad(parts))
+                upper = min(upper, _bump(parts[:-1]))
+            elif op == ">=":
+                lower = max(lower, _pad(parts))
+            elif op == ">":
+                lower = max(lower, _bump(_pad(parts)))
+            elif op == "<=":
+                upper = min(upper, _bump(_pad(parts)))
+            elif op == "<":
+                upper = min(upper, _pad(parts))
+        return lower, upper
+
+
+_MIN_VERSION: VersionTuple = (0, 0, 0)
+_MAX_VERSION: VersionTuple = (sys.maxsize, 0, 0)
+_COMPARATORS: dict[str, Callable[[VersionTuple, VersionTuple], bool]] = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+_SPECIFIER_RE = re.compile(r"(~=|==|!=|<=|>=|<|>)\s*(\d+(?:\.\d+){0,2})(\.\*)?")
+
+
+def _pad(parts: tuple[int, ...]) -> VersionTuple:
+    major, minor, micro = parts + (0,) * (3 - len(parts))
+    return major, minor, micro
+
+
+def _bump(parts: tuple[int, ...]) -> VersionTuple:
+    """The first version that doesn't start with the given parts"""
+    return _pad(parts[:-1] + (parts[-1] + 1,))
+
+
+def parse_request(
+    request: str, implementation: str = "cpython"
+) -> VersionRequest | VersionSpecifier:
+    """Parse a version request, which is a version specifier if it contains an operator"""
+    if any(char in request for char in "<>=!~"):
+        return VersionSpecifier.parse(request, implementation)
+    return VersionRequest.parse(request, implementation)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_request(request: str, implementation: str) -> VersionRequest:
+    impl, has_amp, version = request.rpartition("@")
+    if has_amp:
+        implementation = impl
+    freethreaded = version.endswith("t")
+    try:
+        parts = [int(v) for v in version.rstrip("t").split(".")]
+    except ValueError:
+        raise ValueError(f"Invalid version: {request!r}, each part must be an integer") from None
+
+    if len(parts) < 1:
+        raise ValueError("Version must have at least one part")
+    if len(parts) > 3:
+        raise ValueError(f"Invalid version: {request!r}, at most three parts are allowed")
+    return VersionRequest(
+        implementation,
+        parts[0],
+        parts[1] if len(parts) > 1 else None,
+        parts[2] if len(parts) > 2 else None,
+        freethreaded,
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_specifier(request: str, implementation: str) -> VersionSpecifier:
+    impl, has_amp, version = request.rpartition("@")
+    if has_amp:
+        implementation = impl
+    freethreaded = version.endswith("t")
+    clauses: list[tuple[str, tuple[int, ...], bool]] = []
+    for clause in version.rstrip("t").split(","):
+        match = _SPECIFIER_RE.fullmatch(clause.strip())
+        if match is None:
+            raise ValueError(f"Invalid version specifier: {request!r}")
+        op, parts, wildcard = match.group(1), match.group(2), bool(match.group(3))
+        if wildcard and op not in ("==", "!="):
+            raise ValueError(f"Invalid version specifier: {request!r}, {op} can't use a wildcard")
+        if op == "~=" and "." not in parts:
+            raise ValueError(f"Invalid version specifier: {request!r}, ~= needs two parts")
+        clauses.append((op, tuple(int(part) for part in parts.split(".")), wildcard))
+    return VersionSpecifier(implementation, tuple(clauses), freethreaded)
+
 
 def get_arch_platform() -> tuple[str, str]:
     import platform
@@ -70,27 +272,95 @@ def get_arch_platform() -> tuple[str, str]:
     return ARCH_MAPPING.get(arch, arch), PLATFORM_MAPPING.get(plat, plat)
 
 
-def _unpack_tar(tf: tarfile.TarFile, destination: StrPath) -> None:
-    """Unpack the tarfile to the destination, with the first skip_parts parts of the path removed"""
-    members: list[tarfile.TarInfo] = []
-    for member in tf.getmembers():
-        parts = member.name.lstrip("/").split("/")
-        member.name = "/".join(parts[1:])
-        if member.name:
-            members.append(member)
-    tf.extractall(destination, members=members)
+def _unpack_tar(
+    tf: tarfile.TarFile,
+    destination: StrPath,
+    subdir: str = "",
+    skip: Callable[[str], bool] | None = None,
+) -> None:
+    """Unpack the tarfile to the destination, with the first part of the paths removed.
+
+    With `subdir`, only the members under that directory of the archive root are
+    unpacked, re-rooted at the destination. Members whose path in the destination
+    `skip` returns True for are left out as well, without being written.
+    The members are extracted in a single pass as they are read, so `tf` may be
+    a stream (`r|*`), and forgotten once written. A hardlink to a file that was
+    left out becomes a copy of it, read again from the archive, which a stream
+    can't do: it raises `tarfile.StreamError`.
+    """
+    import copy
+
+    from ._extract import TarWriter
+
+    prefix = f"{subdir}/" if subdir else ""
+    # The regular files left out, by their name in the archive, in case a link needs them
+    left_out: dict[str, tarfile.TarInfo] = {}
 
+    def members() -> Iterator[tarfile.TarInfo]:
+        while True:
+            member = tf.next()
+            if member is None:
+                return
+            # TarFile.next() keeps every member it returns, which isn't needed here
+            tf.members.clear()  # type: ignore[attr-defined,unused-ignore]
+            original_name = member.name
+            member.name = _reroot(member.name, prefix)
+            if not member.name or (skip is not None and skip(member.name)):
+                if member.isreg():
+                    left_out[original_name] = member
+                continue
+            if member.islnk():
+                target = left_out.get(member.linkname)
+                linkname = _reroot(member.linkname, prefix)
+                if target is not None:
+                    # Read the data of the target instead, under the name of the link
+                    target = copy.copy(target)
+                    target.name = member.name
+                    member = target
+                elif not linkname:
+                    continue
+                else:
+                    member.linkname = linkname
+            yield member
 
-def unpack_tar(filename: str, destination: StrPath, original_filename: str) -> None:
-    """Unpack the tarfile to the destination"""
+    TarWriter(destination).extract(tf, members())
+
+
+def _reroot(name: str, prefix: str) -> str:
+    """The path of `name` without its first part and `prefix`, or "" if it is outside `prefix`"""
+    name = "/".join(name.lstrip("/").split("/")[1:])
+    return name[len(prefix) :] if name.startswith(prefix) else ""
+
+
+def unpack_tar(
+    filename: str,
+    destination: StrPath,
+    original_filename: str,
+    subdir: str = "",
+    skip: Callable[[str], bool] | None = None,
+) -> None:
+    """Unpack the tarfile to the destination, see `_unpack_tar` for `subdir` and `skip`"""
     if not ZSTD_SUPPORT and original_filename.endswith(".zstd"):
         raise ModuleNotFoundError("backports.zstd is required to unpack .zst files")
     with tarfile.open(filename) as z:
-        _unpack_tar(z, destination)
+        _unpack_tar(z, destination, subdir, skip)
 
 
-def unpack_zip(filename: str, destination: StrPath) -> None:
-    """Unpack the zip file to the destination"""
+def unpack_tar_stream(
+    fileobj: BinaryIO,
+    destination: StrPath,
+    subdir: str = "",
+    skip: Callable[[str], bool] | None = None,
+) -> None:
+    """Unpack a tar archive read sequentially from `fileobj`, in any supported compression"""
+    with tarfile.open(fileobj=fileobj, mode="r|*") as tf:
+        _unpack_tar(tf, destination, subdir, skip)
+
+
+def unpack_zip(
+    filename: str, destination: StrPath, skip: Callable[[str], bool] | None = None
+) -> None:
+    """Unpack the zip file to the destination, leaving out the paths `skip` returns True for"""
     import zipfile
 
     with zipfile.ZipFile(filename) as z:
@@ -98,19 +368,13 @@ def unpack_zip(filename: str, destination: StrPath) -> None:
         for member in z.infolist():
             parts = member.filename.lstrip("/").split("/")
             member.filename = "/".join(parts[1:])
-            if member.filename:
+            if member.filename and (skip is None or not skip(member.filename.rstrip("/"))):
                 members.append(member)
 
         z.extractall(destination, members=members)
 
 
 def get_available_arch_platforms() -> tuple[list[str], list[str]]:
-    from ._versions import PYTHON_VERSIONS
-
-    archs: set[str] = set()
-    platforms: set[str] = set()
-    for items in PYTHON_VERSIONS.values():
-        for item in items:
-            platforms.add(item[0])
-            archs.add(item[1])
-    return sorted(archs), sorted(platforms)
+    from ._versions import ARCHS, PLATFORMS
+
+    return list(ARCHS), list(PLATFORMS)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import http.server
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+import pytest
+
+
+class FileServer:
+    """Serve `data` at every path from a local HTTP server, with faults to inject.
+
+    The lists are consumed one item per GET request, in order: `delays` holds the
+    seconds to wait before answering, `statuses` the status to answer with instead
+    of the data and `drops` the number of body bytes to send before the connection
+    is dropped, None for the whole body. `range_requests` limits how many range
+    requests are honored, and `rate` how many bytes per second a response sends.
+    With `unknown_total`, partial responses don't tell the full size (`bytes N-M/*`).
+    HEAD requests are answered with `head_status` instead, if set.
+    """
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.etag: str | None = '"' + hashlib.sha256(data).hexdigest()[:16] + '"'
+        self.ranges = True
+        self.range_requests: int | None = None
+        self.rate: float | None = None
+        self.unknown_total = False
+        self.head_delay = 0.0
+        self.head_status: int | None = None
+        self.delays: list[float] = []
+        self.statuses: list[int] = []
+        self.drops: list[int | None] = []
+        # (method, path, headers) of each request, with lowercase header names
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        # The paths of the GET requests the client gave up on while they were delayed
+        self.abandoned: list[str] = []
+        self._server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def replace(self, data: bytes, etag: bool = True) -> None:
+        """Serve other data, with a new ETag or none at all."""
+        self.data = data
+        self.etag = '"' + hashlib.sha256(data).hexdigest()[:16] + '"' if etag else None
+
+    def gets(self) -> list[dict[str, str]]:
+        """The headers of the GET requests received so far."""
+        return [headers for method, _, headers in self.requests if method == "GET"]
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self) -> type[http.server.BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _record(self, method: str) -> None:
+                headers = {name.lower(): value for name, value in self.headers.items()}
+                server.requests.append((method, self.path, headers))
+
+            def do_HEAD(self) -> None:
+                self._record("HEAD")
+                time.sleep(server.head_delay)
+                if server.head_status is not None:
+                    self.send_response(server.head_status)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self._respond(head=True)
+
+            def do_GET(self) -> None:
+                self._record("GET")
+                if server.delays:
+                    time.sleep(server.delays.pop(0))
+                    if self._hung_up():
+                        server.abandoned.append(self.path)
+                        self.close_connection = True
+                        return
+                self._respond(head=False)
+
+            def _hung_up(self) -> bool:
+                connection: socket.socket = self.connection
+                timeout = connection.gettimeout()
+                connection.setblocking(False)
+                try:
+                    return connection.recv(1, socket.MSG_PEEK) == b""
+                except BlockingIOError:
+                    return False
+                except OSError:
+                    return True
+                finally:
+                    connection.settimeout(timeout)
+
+            def _respond(self, head: bool) -> None:
+                if not head and server.statuses:
+                    self.send_response(server.statuses.pop(0))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                data = server.data
+                start, end = 0, len(data) - 1
+                requested = self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                partial = False
+                if (
+                    requested
+                    and server.ranges
+                    and server.range_requests != 0
+                    and (if_range is None or if_range == server.etag)
+                ):
+                    if server.range_requests is not None:
+                        server.range_requests -= 1
+                    first, _, last = requested.partition("=")[2].partition("-")
+                    start = int(first)
+                    if last:
+                        end = min(int(last), len(data) - 1)
+                    if start >= len(data):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(data)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    partial = True
+                body = data[start : end + 1]
+                self.send_response(206 if partial else 200)
+                if partial:
+                    total = "*" if server.unknown_total else len(data)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{total}")
+                if server.ranges:
+                    self.send_header("Accept-Ranges", "bytes")
+                if server.etag is not None:
+                    self.send_header("ETag", server.etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if head:
+                    return
+                drop = server.drops.pop(0) if server.drops else None
+                try:
+                    if drop is not None and drop < len(body):
+                        self.wfile.write(body[:drop])
+                        self.wfile.flush()
+                        self.close_connection = True
+                        self.connection.shutdown(socket.SHUT_RDWR)
+                    elif server.rate is None:
+                        self.wfile.write(body)
+                    else:
+                        start_time = time.monotonic()
+                        for sent in range(0, len(body), 64 * 1024):
+                            self.wfile.write(body[sent : sent + 64 * 1024])
+                            ahead = sent / server.rate - (time.monotonic() - start_time)
+                            if ahead > 0:
+                                time.sleep(ahead)
+                except OSError:
+                    self.close_connection = True
+
+        return Handler
+
+
+@pytest.fixture
+def file_server() -> Iterator[Callable[[bytes], FileServer]]:
+    """Start local servers of the given data, shut down after the test."""
+    servers: list[FileServer] = []
+
+    def serve(data: bytes) -> FileServer:
+        server = FileServer(data)
+        servers.append(server)
+        return server
+
+    yield serve
+    for server in servers:
+        server.close()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_latencies() -> Iterator[None]:
+    from pbs_installer._mirrors import reset_latencies
+
+    reset_latencies()
+    yield
+    reset_latencies()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from pbs_installer._cache import DownloadCache
+
+
+def _entry(cache: DownloadCache, char: str, size: int, mtime: float) -> Path:
+    path = Path(cache.path(char * 64))
+    path.write_bytes(b"x" * size)
+    Path(f"{path}.lock").touch()
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_prune_keeps_lock_files(tmp_path: Path) -> None:
+    cache = DownloadCache(tmp_path, max_size=250)
+    old = _entry(cache, "a", 100, 1000)
+    middle = _entry(cache, "b", 100, 2000)
+    new = _entry(cache, "c", 100, 3000)
+    # Lock files don't count towards the size
+    Path(f"{new}.lock").write_bytes(b"x" * 1000)
+    cache.prune(keep=str(new))
+    # Another process may be waiting on the lock of the evicted archive
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        [f"{old.name}.lock", middle.name, f"{middle.name}.lock", new.name, f"{new.name}.lock"]
+    )
+
+
+def test_get_read_only_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = DownloadCache(tmp_path)
+    path = _entry(cache, "a", 10, 1000)
+
+    def utime(*args: object) -> None:
+        raise PermissionError("read-only file system")
+
+    monkeypatch.setattr(os, "utime", utime)
+    assert cache.get("a" * 64) == str(path)
+    assert cache.get("b" * 64) is None
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import io
+import os
+import stat
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from pbs_installer._extract import UnsafeMemberError
+from pbs_installer._utils import unpack_tar
+
+
+def _archive(path: Path, *members: tuple[str, bytes, dict[str, object]]) -> str:
+    """Write a tar archive with `members` under a `python/` root, like the builds"""
+    with tarfile.open(path, "w") as tf:
+        for name, data, attrs in members:
+            info = tarfile.TarInfo(f"python/{name}")
+            info.size = len(data)
+            for key, value in attrs.items():
+                setattr(info, key, value)
+            tf.addfile(info, io.BytesIO(data) if data else None)
+    return str(path)
+
+
+@pytest.fixture(params=["data_filter", "fallback"])
+def filter_kind(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "fallback":
+        # The checks of Pythons before 3.9.17, 3.10.12 and 3.11.4
+        monkeypatch.delattr("tarfile.data_filter", raising=False)
+    return str(request.param)
+
+
+def test_symlink_through_symlink_escape(tmp_path: Path, filter_kind: str) -> None:
+    archive = _archive(
+        tmp_path / "escape.tar",
+        ("sub", b"", {"type": tarfile.DIRTYPE, "mode": 0o755}),
+        ("sub/l2", b"", {"type": tarfile.SYMTYPE, "linkname": ".."}),
+        ("l1", b"", {"type": tarfile.SYMTYPE, "linkname": "sub/l2/.."}),
+    )
+    destination = tmp_path / "python"
+    with pytest.raises(UnsafeMemberError):
+        unpack_tar(archive, destination, archive)
+    assert not (destination / "l1").is_symlink()
+
+
+def test_modes_are_masked(tmp_path: Path, filter_kind: str) -> None:
+    archive = _archive(
+        tmp_path / "modes.tar",
+        ("bin/setuid", b"#!/bin/sh\n", {"mode": 0o104777}),
+        ("lib/shared", b"data", {"mode": 0o666}),
+        ("lib/readonly", b"data", {"mode": 0o444}),
+    )
+    destination = tmp_path / "python"
+    unpack_tar(archive, destination, archive)
+    assert stat.S_IMODE(os.stat(destination / "bin/setuid").st_mode) == 0o755
+    assert stat.S_IMODE(os.stat(destination / "lib/shared").st_mode) == 0o644
+    assert stat.S_IMODE(os.stat(destination / "lib/readonly").st_mode) == 0o644
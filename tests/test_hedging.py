@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pbs_installer import _download, adownload, download
+
+from .conftest import FileServer
+
+DATA = os.urandom(256 * 1024)
+CHECKSUM = hashlib.sha256(DATA).hexdigest()
+FILENAME = "cpython-3.12.0-x86_64-unknown-linux-gnu-install_only.tar.gz"
+HEDGE_AFTER = 0.2
+
+
+def _servers(
+    file_server: Callable[[bytes], FileServer], primary_delay: float, hedge_delay: float
+) -> tuple[FileServer, FileServer, list[str]]:
+    """A primary server and a mirror that the hedged request goes to."""
+    primary, hedge = file_server(DATA), file_server(DATA)
+    # The mirror answers the latency probe slower, so the primary is tried first
+    hedge.head_delay = 0.3
+    primary.delays = [primary_delay]
+    hedge.delays = [hedge_delay]
+    return primary, hedge, [f"{primary.url}/={hedge.url}/"]
+
+
+def _wait_for(condition: Callable[[], object], timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def closed_responses(monkeypatch: pytest.MonkeyPatch) -> list[httpx.Response]:
+    """The responses `_send_hedged` closes when they lose the race."""
+    closed: list[httpx.Response] = []
+    close_response = _download._close_response
+
+    def record(future: Future[httpx.Response]) -> None:
+        close_response(future)
+        if not future.cancelled() and future.exception() is None:
+            closed.append(future.result())
+
+    monkeypatch.setattr(_download, "_close_response", record)
+    return closed
+
+
+@pytest.mark.parametrize(
+    "primary_delay, hedge_delay, winner",
+    [(1.0, 0.0, "hedge"), (0.5, 1.0, "primary")],
+    ids=["hedge-wins", "primary-wins"],
+)
+def test_hedged_download(
+    file_server: Callable[[bytes], FileServer],
+    closed_responses: list[httpx.Response],
+    tmp_path: Path,
+    primary_delay: float,
+    hedge_delay: float,
+    winner: str,
+) -> None:
+    primary, hedge, mirrors = _servers(file_server, primary_delay, hedge_delay)
+    urls = {"primary": f"{primary.url}/{FILENAME}", "hedge": f"{hedge.url}/{FILENAME}"}
+    destination = tmp_path / FILENAME
+    with httpx.Client() as client:
+        result = download(
+            (urls["primary"], CHECKSUM),
+            destination,
+            client,
+            cache_dir="",
+            mirrors=mirrors,
+            hedge_after=HEDGE_AFTER,
+        )
+        assert result == FILENAME
+        assert result.url == urls[winner]
+        assert destination.read_bytes() == DATA
+        assert len(primary.gets()) == len(hedge.gets()) == 1
+        # A blocking request can't be interrupted, the loser is closed when it responds
+        _wait_for(lambda: closed_responses)
+    loser = "primary" if winner == "hedge" else "hedge"
+    assert [str(resp.url) for resp in closed_responses] == [urls[loser]]
+    assert closed_responses[0].is_closed
+
+
+@pytest.mark.parametrize(
+    "primary_delay, hedge_delay, winner",
+    [(1.0, 0.0, "hedge"), (0.5, 1.0, "primary")],
+    ids=["hedge-wins", "primary-wins"],
+)
+def test_async_hedged_download(
+    file_server: Callable[[bytes], FileServer],
+    tmp_path: Path,
+    primary_delay: float,
+    hedge_delay: float,
+    winner: str,
+) -> None:
+    primary, hedge, mirrors = _servers(file_server, primary_delay, hedge_delay)
+    servers = {"primary": primary, "hedge": hedge}
+    urls = {name: f"{server.url}/{FILENAME}" for name, server in servers.items()}
+    destination = tmp_path / FILENAME
+    loser = servers["primary" if winner == "hedge" else "hedge"]
+
+    async def main() -> str:
+        async with httpx.AsyncClient() as client:
+            result = await adownload(
+                (urls["primary"], CHECKSUM),
+                destination,
+                client,
+                cache_dir="",
+                mirrors=mirrors,
+                hedge_after=HEDGE_AFTER,
+            )
+            # The request that lost is cancelled, so its server finds the connection
+            # closed while the client is still open
+            deadline = time.monotonic() + 10
+            while not loser.abandoned and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+        assert result == FILENAME
+        return result.url
+
+    assert asyncio.run(main()) == urls[winner]
+    assert destination.read_bytes() == DATA
+    assert loser.abandoned == [f"/{FILENAME}"]
+    assert servers[winner].abandoned == []
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pbs_installer
+
+
+def test_index_from_zip(tmp_path: Path) -> None:
+    package = os.path.dirname(pbs_installer.__file__)
+    archive = tmp_path / "pbs_installer.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for root, dirs, files in os.walk(package):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            for name in files:
+                path = os.path.join(root, name)
+                zf.write(path, os.path.relpath(path, os.path.dirname(package)))
+    code = (
+        "import pbs_installer, sys;"
+        "assert '.zip' in pbs_installer.__file__, pbs_installer.__file__;"
+        "print(pbs_installer.get_download_link('3.12', 'x86_64', 'linux')[0].minor)"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], env={**os.environ, "PYTHONPATH": str(archive)}, text=True
+    )
+    assert output.strip() == "12"
+
+
+def test_to_dict_legacy_order() -> None:
+    from pbs_installer._index import get_index
+
+    versions = list(get_index().to_dict())
+    # The head of the table the generator used to write to _versions.py
+    assert [str(v) for v in versions[:11]] == [
+        "cpython@3.14.7t",
+        "cpython@3.14.6t",
+        "cpython@3.14.5t",
+        "cpython@3.14.4t",
+        "cpython@3.14.3t",
+        "cpython@3.14.2t",
+        "cpython@3.14.2",
+        "cpython@3.14.1t",
+        "cpython@3.14.1",
+        "cpython@3.14.0t",
+        "cpython@3.14.0",
+    ]
+    assert versions == sorted(
+        versions,
+        key=lambda v: (v.implementation, (-v.major, -v.minor, -v.micro), not v.freethreaded),
+    )
+    assert versions[-1].implementation == "pypy"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pbs_installer import RetryPolicy, download
+from pbs_installer._mirrors import candidate_urls, parse_mirrors, rank
+
+from .conftest import FileServer
+
+DATA = os.urandom(256 * 1024)
+CHECKSUM = hashlib.sha256(DATA).hexdigest()
+FILENAME = "cpython-3.12.0-x86_64-unknown-linux-gnu-install_only.tar.gz"
+PATH = f"/releases/download/20240107/{FILENAME}"
+
+
+@pytest.mark.parametrize("failure", ["404", "503", "checksum"])
+def test_failover_to_next_url(
+    file_server: Callable[[bytes], FileServer], tmp_path: Path, failure: str
+) -> None:
+    origin = file_server(DATA)
+    mirror = file_server(os.urandom(len(DATA)) if failure == "checksum" else DATA)
+    if failure != "checksum":
+        mirror.statuses = [int(failure)] * 2
+    # The origin answers the latency probe slower, so the mirror is tried first
+    origin.head_delay = 0.3
+    destination = tmp_path / FILENAME
+    with httpx.Client() as client:
+        result = download(
+            (f"{origin.url}{PATH}", CHECKSUM),
+            destination,
+            client,
+            cache_dir="",
+            mirrors=[f"{origin.url}/={mirror.url}/"],
+            retry=RetryPolicy(max_attempts=2, backoff=0.01),
+        )
+    assert result.url == f"{origin.url}{PATH}"
+    assert destination.read_bytes() == DATA
+    # Temporary failures are retried before moving on
+    mirror_attempts = 2 if failure == "503" else 1
+    assert len(mirror.gets()) == mirror_attempts
+    assert result.attempts == mirror_attempts + 1
+    assert [url for url, _ in result.errors] == [f"{mirror.url}{PATH}"] * mirror_attempts
+    if failure == "checksum":
+        assert "Checksum mismatch" in result.errors[0][1]
+
+
+def test_fastest_url_first(file_server: Callable[[bytes], FileServer], tmp_path: Path) -> None:
+    slow, fastest, fast = file_server(DATA), file_server(DATA), file_server(DATA)
+    slow.head_delay, fastest.head_delay, fast.head_delay = 0.4, 0.0, 0.2
+    urls = [f"{server.url}{PATH}" for server in (slow, fastest, fast)]
+    with httpx.Client() as client:
+        assert rank(client, urls) == [urls[1], urls[2], urls[0]]
+        result = download(
+            (urls[0], CHECKSUM),
+            tmp_path / FILENAME,
+            client,
+            cache_dir="",
+            mirrors=[f"{slow.url}={fast.url}", f"{slow.url}={fastest.url}"],
+        )
+    assert result.url == urls[1]
+    assert result.attempts == 1
+    assert [len(server.gets()) for server in (slow, fastest, fast)] == [0, 1, 0]
+
+
+@pytest.mark.parametrize("status, reachable", [(404, True), (405, True), (503, False)])
+def test_probe_status(
+    file_server: Callable[[bytes], FileServer], status: int, reachable: bool
+) -> None:
+    answering, slow = file_server(DATA), file_server(DATA)
+    answering.head_status = status
+    slow.head_delay = 0.2
+    urls = [f"{slow.url}{PATH}", f"{answering.url}{PATH}"]
+    with httpx.Client() as client:
+        assert rank(client, urls) == (urls[::-1] if reachable else urls)
+        # The measurement of the host is reused for its other urls
+        other = [f"{slow.url}/other", f"{answering.url}/other"]
+        assert rank(client, other) == (other[::-1] if reachable else other)
+    assert len([r for r in answering.requests if r[0] == "HEAD"]) == 1
+
+
+def test_rewrite_prefix(file_server: Callable[[bytes], FileServer], tmp_path: Path) -> None:
+    mirror = file_server(DATA)
+    # Nothing listens on the origin, so only the mirror can deliver
+    origin = "http://127.0.0.1:9/releases/download/"
+    url = f"{origin}20240107/{FILENAME}"
+    mirrors = ["http://example.com/=http://127.0.0.1:9/other/", f"{origin}={mirror.url}/pbs/"]
+    assert candidate_urls(url, parse_mirrors(mirrors)) == [
+        f"{mirror.url}/pbs/20240107/{FILENAME}",
+        url,
+    ]
+    with httpx.Client() as client:
+        result = download(
+            (url, CHECKSUM),
+            tmp_path / FILENAME,
+            client,
+            cache_dir="",
+            mirrors=mirrors,
+        )
+    assert result == FILENAME
+    assert result.url == f"{mirror.url}/pbs/20240107/{FILENAME}"
+    assert [path for method, path, _ in mirror.requests if method == "GET"] == [
+        f"/pbs/20240107/{FILENAME}"
+    ]
+
+
+@pytest.mark.parametrize(
+    "entry", ["https://github.com/", "=https://mirror/", "https://github.com/="]
+)
+def test_invalid_mirror(entry: str) -> None:
+    with pytest.raises(ValueError, match="PREFIX=REPLACEMENT"):
+        parse_mirrors([entry])
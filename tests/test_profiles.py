@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import io
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from pbs_installer import install_file
+from pbs_installer._profiles import PROFILE_FILE, ExtractFilter
+
+FULL_ARCHIVE = "cpython-3.12.0+20240107-x86_64-unknown-linux-gnu-pgo+lto-full.tar.gz"
+FULL_MEMBERS = [
+    "python/PYTHON.json",
+    "python/build/lib/libpython3.12.a",
+    "python/build/Lib/test/test_os.py",
+    "python/install/bin/python3.12",
+    "python/install/lib/libpython3.12.a",
+    "python/install/lib/python3.12/os.py",
+    "python/install/lib/python3.12/test/test_os.py",
+]
+
+
+@pytest.fixture
+def full_archive(tmp_path: Path) -> Path:
+    path = tmp_path / FULL_ARCHIVE
+    with tarfile.open(path, "w:gz") as tf:
+        for name in FULL_MEMBERS:
+            info = tarfile.TarInfo(name)
+            info.size = len(name)
+            tf.addfile(info, io.BytesIO(name.encode()))
+    return path
+
+
+def _installed(destination: Path) -> set[str]:
+    return {p.relative_to(destination).as_posix() for p in destination.rglob("*") if p.is_file()}
+
+
+def test_runtime_profile_full_archive(full_archive: Path, tmp_path: Path) -> None:
+    destination = tmp_path / "python"
+    install_file(full_archive, destination, profile="runtime")
+    assert _installed(destination) == {
+        "PBS_INSTALLER_PROFILE.json",
+        "bin/python3.12",
+        "lib/python3.12/os.py",
+    }
+
+
+def test_runtime_profile_full_archive_with_build_dir(full_archive: Path, tmp_path: Path) -> None:
+    destination = tmp_path / "python"
+    install_file(full_archive, destination, build_dir=True, profile="runtime")
+    # Only the installed tree is filtered, the build tree is kept as is
+    assert _installed(destination) == {
+        "PBS_INSTALLER_PROFILE.json",
+        "PYTHON.json",
+        "build/lib/libpython3.12.a",
+        "build/Lib/test/test_os.py",
+        "install/bin/python3.12",
+        "install/lib/python3.12/os.py",
+    }
+
+
+def test_full_profile_not_recorded(full_archive: Path, tmp_path: Path) -> None:
+    destination = tmp_path / "python"
+    install_file(full_archive, destination, profile="runtime")
+    assert (destination / PROFILE_FILE).exists()
+    # Installing everything over it leaves no stale record behind
+    install_file(full_archive, destination)
+    assert PROFILE_FILE not in _installed(destination)
+    assert "lib/python3.12/test/test_os.py" in _installed(destination)
+
+
+def test_hardlink_to_skipped_file(tmp_path: Path) -> None:
+    archive = tmp_path / "cpython-3.12.0+20240107-x86_64-unknown-linux-gnu-install_only.tar.gz"
+    with tarfile.open(archive, "w:gz") as tf:
+        target = tarfile.TarInfo("python/lib/python3.12/test/data.bin")
+        target.size = 4
+        tf.addfile(target, io.BytesIO(b"data"))
+        link = tarfile.TarInfo("python/lib/python3.12/data.bin")
+        link.type = tarfile.LNKTYPE
+        link.linkname = target.name
+        tf.addfile(link)
+    destination = tmp_path / "python"
+    install_file(archive, destination, profile="runtime")
+    assert _installed(destination) == {PROFILE_FILE, "lib/python3.12/data.bin"}
+    assert (destination / "lib/python3.12/data.bin").read_bytes() == b"data"
+
+
+@pytest.mark.parametrize(
+    "glob, name, skipped",
+    [
+        ("lib/*.a", "lib/libpython3.12.a", True),
+        ("lib/*.a", "lib/python3.12/config-3.12/libpython3.12.a", False),
+        ("lib/python3.?", "lib/python3.9/os.py", True),
+        ("lib/python3.?", "lib/python3/9", False),
+        ("share/[!m]*", "share/doc/index.html", True),
+        ("share/[!m]*", "share/man/man1/python3.1", False),
+    ],
+)
+def test_glob_matches_single_segment(glob: str, name: str, skipped: bool) -> None:
+    assert ExtractFilter.create(exclude=[glob]).skips(name) is skipped
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "lib/pypy3.10/test/test_os.py",
+        "lib/pypy3.10/unittest/test/test_case.py",
+        "lib/pypy3.10/tkinter/__init__.py",
+        "lib/pypy3.10/ensurepip/_bundled/pip-23.0.1-py3-none-any.whl",
+        "lib-python/3/test/test_os.py",
+        "lib-python/3/idlelib/idle.py",
+        "lib_pypy/_tkinter/app.py",
+    ],
+)
+def test_minimal_profile_pypy_skips(name: str) -> None:
+    assert ExtractFilter.create("minimal").skips(name)
+
+
+@pytest.mark.parametrize("name", ["bin/pypy3.10", "lib/pypy3.10/os.py", "lib-python/3/os.py"])
+def test_minimal_profile_pypy_keeps(name: str) -> None:
+    assert not ExtractFilter.create("minimal").skips(name)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import io
+import itertools
+import os
+import tarfile
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pbs_installer import ProgressEvent, RetryPolicy, _install, adownload, download, install
+from pbs_installer._download import PART_SUFFIX
+from pbs_installer._utils import PythonVersion
+
+from .conftest import FileServer
+
+DATA = os.urandom(3 * 1024 * 1024)
+CHECKSUM = hashlib.sha256(DATA).hexdigest()
+FILENAME = "cpython-3.12.0+20240107-x86_64-unknown-linux-gnu-install_only.tar.gz"
+
+
+class Abort(Exception):
+    pass
+
+
+def _phases(events: list[ProgressEvent]) -> list[str]:
+    return [phase for phase, _ in itertools.groupby(event.phase for event in events)]
+
+
+def _runs(events: list[ProgressEvent]) -> list[list[ProgressEvent]]:
+    """The download events of each request, split where a request is sent."""
+    runs: list[list[ProgressEvent]] = []
+    for event in events:
+        if event.phase == "connect":
+            runs.append([])
+        elif event.phase == "download":
+            runs[-1].append(event)
+    return runs
+
+
+def _download(url: str, destination: Path, callback: Callable[[ProgressEvent], object]) -> None:
+    with httpx.Client() as client:
+        download(
+            (url, CHECKSUM),
+            destination,
+            client,
+            cache_dir="",
+            retry=RetryPolicy(backoff=0.01),
+            progress=callback,
+        )
+
+
+def test_download_progress(file_server: Callable[[bytes], FileServer], tmp_path: Path) -> None:
+    server = file_server(DATA)
+    server.rate = 8 * 1024 * 1024
+    events: list[ProgressEvent] = []
+    _download(f"{server.url}/{FILENAME}", tmp_path / FILENAME, events.append)
+    assert _phases(events) == ["connect", "download", "verify"]
+    (run,) = _runs(events)
+    assert len(run) > 2
+    assert all(event.total == len(DATA) for event in run)
+    assert all(event.url == f"{server.url}/{FILENAME}" for event in run)
+    assert all(event.ttfb is not None and event.ttfb >= 0 for event in run)
+    received = [event.received for event in run]
+    assert received == sorted(received)
+    assert (received[0], received[-1]) == (0, len(DATA))
+
+
+def test_resumed_download_progress(
+    file_server: Callable[[bytes], FileServer], tmp_path: Path
+) -> None:
+    server = file_server(DATA)
+    server.drops = [1024 * 1024 + 12345]
+    events: list[ProgressEvent] = []
+    _download(f"{server.url}/{FILENAME}", tmp_path / FILENAME, events.append)
+    assert _phases(events) == ["connect", "download", "connect", "download", "verify"]
+    first, resumed = _runs(events)
+    offset = int(server.gets()[-1]["range"].partition("=")[2].rstrip("-"))
+    assert offset > 0
+    # The total comes from the Content-Range of the 206, not its Content-Length
+    assert all(event.total == len(DATA) for event in first + resumed)
+    for run in (first, resumed):
+        received = [event.received for event in run]
+        assert received == sorted(received)
+    assert (resumed[0].received, resumed[-1].received) == (offset, len(DATA))
+
+
+def test_install_phases(
+    file_server: Callable[[bytes], FileServer], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tf:
+        info = tarfile.TarInfo("python/bin/python3")
+        tf.addfile(info, io.BytesIO())
+    archive = buffer.getvalue()
+    server = file_server(archive)
+    version = PythonVersion("cpython", 3, 12, 0)
+    python_file = (f"{server.url}/{FILENAME}", hashlib.sha256(archive).hexdigest())
+    monkeypatch.setattr(
+        _install, "get_download_link", lambda *args, **kwargs: (version, python_file)
+    )
+    events: list[ProgressEvent] = []
+    with httpx.Client() as client:
+        install("3.12", tmp_path / "python", client=client, cache_dir="", progress=events.append)
+    assert _phases(events) == ["resolve", "connect", "download", "verify", "extract"]
+    assert (tmp_path / "python" / "bin" / "python3").exists()
+
+
+def _adownload(url: str, destination: Path, callback: Callable[[ProgressEvent], object]) -> None:
+    async def main() -> None:
+        async with httpx.AsyncClient() as client:
+            await adownload(
+                (url, CHECKSUM),
+                destination,
+                client,
+                cache_dir="",
+                retry=RetryPolicy(backoff=0.01),
+                progress=callback,
+            )
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("downloader", [_download, _adownload], ids=["sync", "async"])
+def test_callback_error_aborts(
+    file_server: Callable[[bytes], FileServer],
+    tmp_path: Path,
+    downloader: Callable[[str, Path, Callable[[ProgressEvent], object]], None],
+) -> None:
+    server = file_server(DATA)
+    server.rate = 8 * 1024 * 1024
+    destination = tmp_path / FILENAME
+
+    def callback(event: ProgressEvent) -> None:
+        if event.phase == "download" and event.received > 2 * 1024 * 1024:
+            raise Abort
+
+    with pytest.raises(Abort):
+        downloader(f"{server.url}/{FILENAME}", destination, callback)
+    # Not retried, and what was received is kept for the next call to continue from
+    assert len(server.gets()) == 1
+    assert not destination.exists()
+    assert Path(f"{destination}{PART_SUFFIX}").exists()
+    downloader(f"{server.url}/{FILENAME}", destination, lambda event: None)
+    assert destination.read_bytes() == DATA
+    assert server.gets()[-1]["range"] != "bytes=0-"
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pbs_installer._download import (
+    PART_SUFFIX,
+    STATE_SUFFIX,
+    ChecksumMismatch,
+    PartialDownload,
+    _Sink,
+    afetch,
+    fetch,
+)
+
+from .conftest import FileServer
+
+DATA = os.urandom(3 * 1024 * 1024)
+DROP_AFTER = 1024 * 1024 + 12345
+
+Fetch = Callable[[str, str, Path], str]
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _fetch(url: str, checksum: str, destination: Path) -> str:
+    with httpx.Client() as client:
+        return fetch(client, url, checksum, destination)
+
+
+def _afetch(url: str, checksum: str, destination: Path) -> str:
+    async def main() -> str:
+        async with httpx.AsyncClient() as client:
+            return await afetch(client, url, checksum, destination)
+
+    return asyncio.run(main())
+
+
+@pytest.fixture(params=[_fetch, _afetch], ids=["sync", "async"])
+def fetcher(request: pytest.FixtureRequest) -> Fetch:
+    result: Fetch = request.param
+    return result
+
+
+def _interrupted(
+    file_server: Callable[[bytes], FileServer], fetcher: Fetch, destination: Path, etag: bool = True
+) -> tuple[FileServer, int]:
+    """Drop the connection in the middle of a download and return the bytes kept."""
+    server = file_server(DATA)
+    server.replace(DATA, etag)
+    server.drops = [DROP_AFTER]
+    with pytest.raises(httpx.HTTPError):
+        fetcher(f"{server.url}/python.tar.gz", _sha256(DATA), destination)
+    assert not destination.exists()
+    state = json.loads(Path(f"{destination}{STATE_SUFFIX}").read_text())
+    received: int = state["received"]
+    assert 0 < received <= DROP_AFTER
+    assert state["sha256"] == _sha256(DATA[:received])
+    assert Path(f"{destination}{PART_SUFFIX}").read_bytes()[:received] == DATA[:received]
+    return server, received
+
+
+def test_resume(file_server: Callable[[bytes], FileServer], fetcher: Fetch, tmp_path: Path) -> None:
+    destination = tmp_path / "python.tar.gz"
+    server, received = _interrupted(file_server, fetcher, destination)
+
+    fetcher(f"{server.url}/python.tar.gz", _sha256(DATA), destination)
+    assert destination.read_bytes() == DATA
+    assert not Path(f"{destination}{PART_SUFFIX}").exists()
+    assert not Path(f"{destination}{STATE_SUFFIX}").exists()
+    resumed = server.gets()[-1]
+    assert resumed["range"] == f"bytes={received}-"
+    assert resumed["if-range"] == server.etag
+
+
+def test_resume_unknown_total(
+    file_server: Callable[[bytes], FileServer], fetcher: Fetch, tmp_path: Path
+) -> None:
+    destination = tmp_path / "python.tar.gz"
+    server, received = _interrupted(file_server, fetcher, destination)
+    server.unknown_total = True
+
+    fetcher(f"{server.url}/python.tar.gz", _sha256(DATA), destination)
+    assert destination.read_bytes() == DATA
+    assert server.gets()[-1]["range"] == f"bytes={received}-"
+
+
+def test_if_range_mismatch_restarts(
+    file_server: Callable[[bytes], FileServer], fetcher: Fetch, tmp_path: Path
+) -> None:
+    destination = tmp_path / "python.tar.gz"
+    server, _ = _interrupted(file_server, fetcher, destination)
+    old_etag = server.etag
+    # The file changed, so the server ignores the range and sends all of it
+    new_data = os.urandom(len(DATA))
+    server.replace(new_data)
+
+    fetcher(f"{server.url}/python.tar.gz", _sha256(new_data), destination)
+    assert destination.read_bytes() == new_data
+    assert server.gets()[-1]["if-range"] == old_etag
+
+
+def test_range_not_satisfiable_restarts(
+    file_server: Callable[[bytes], FileServer], fetcher: Fetch, tmp_path: Path
+) -> None:
+    destination = tmp_path / "python.tar.gz"
+    # Without a validator, the range is sent without If-Range
+    server, received = _interrupted(file_server, fetcher, destination, etag=False)
+    new_data = os.urandom(received // 2)
+    server.replace(new_data, etag=False)
+
+    fetcher(f"{server.url}/python.tar.gz", _sha256(new_data), destination)
+    assert destination.read_bytes() == new_data
+    resumed, restarted = server.gets()[-2:]
+    assert resumed["range"] == f"bytes={received}-"
+    assert "if-range" not in resumed
+    assert "range" not in restarted
+
+
+def test_checksum_mismatch_after_resume(
+    file_server: Callable[[bytes], FileServer], fetcher: Fetch, tmp_path: Path
+) -> None:
+    destination = tmp_path / "python.tar.gz"
+    server, _ = _interrupted(file_server, fetcher, destination)
+    # The server changes the file but keeps the ETag, so the resumed tail doesn't fit
+    etag = server.etag
+    server.replace(os.urandom(len(DATA)))
+    server.etag = etag
+
+    with pytest.raises(ChecksumMismatch):
+        fetcher(f"{server.url}/python.tar.gz", _sha256(DATA), destination)
+    assert not destination.exists()
+    assert not Path(f"{destination}{PART_SUFFIX}").exists()
+    assert not Path(f"{destination}{STATE_SUFFIX}").exists()
+
+
+def test_async_file_access_off_the_event_loop(
+    file_server: Callable[[bytes], FileServer], monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    destination = tmp_path / "python.tar.gz"
+    server, received = _interrupted(file_server, _afetch, destination, etag=False)
+    # A 416 discards the partial file, then the sink checkpoints the new one
+    new_data = os.urandom(received // 2)
+    server.replace(new_data, etag=False)
+    calls: list[tuple[str, threading.Thread]] = []
+
+    def record(func: Callable[..., None]) -> Callable[..., None]:
+        def wrapper(*args: object) -> None:
+            calls.append((func.__name__, threading.current_thread()))
+            func(*args)
+
+        return wrapper
+
+    monkeypatch.setattr(PartialDownload, "checkpoint", record(PartialDownload.checkpoint))
+    monkeypatch.setattr(PartialDownload, "discard", record(PartialDownload.discard))
+    monkeypatch.setattr(_Sink, "write", record(_Sink.write))
+
+    _afetch(f"{server.url}/python.tar.gz", _sha256(new_data), destination)
+    assert destination.read_bytes() == new_data
+    assert {name for name, _ in calls} == {"checkpoint", "discard", "write"}
+    assert all(thread is not threading.main_thread() for _, thread in calls)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import email.utils
+import time
+
+import httpx
+import pytest
+
+from pbs_installer import RetryPolicy
+from pbs_installer._download import ChecksumMismatch
+
+URL = "https://example.com/python.tar.gz"
+
+
+def _status_error(status: int, retry_after: str | None = None) -> httpx.HTTPStatusError:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    request = httpx.Request("GET", URL)
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError(f"{status}", request=request, response=response)
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (_status_error(503), True),
+        (_status_error(429), True),
+        (_status_error(404), False),
+        (_status_error(403), False),
+        (httpx.ConnectError("refused"), True),
+        (httpx.ReadTimeout("timed out"), True),
+        (httpx.RemoteProtocolError("peer closed connection"), True),
+        (ChecksumMismatch("Checksum mismatch"), False),
+    ],
+)
+def test_retryable(error: BaseException, retryable: bool) -> None:
+    policy = RetryPolicy()
+    assert policy.retryable(error) is retryable
+    if not retryable:
+        assert policy.delay(1, error) is None
+
+
+def test_backoff_doubles_up_to_max_backoff() -> None:
+    policy = RetryPolicy(max_attempts=10, backoff=1.0, max_backoff=5.0, jitter=0.0)
+    error = httpx.ConnectError("refused")
+    assert [policy.delay(attempt, error) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_jitter_shortens_delay() -> None:
+    policy = RetryPolicy(backoff=2.0, jitter=0.5)
+    delays = [policy.delay(1, httpx.ConnectError("refused")) for _ in range(50)]
+    assert all(delay is not None and 1.0 <= delay <= 2.0 for delay in delays)
+
+
+def test_give_up_after_max_attempts() -> None:
+    policy = RetryPolicy(max_attempts=3, jitter=0.0)
+    error = _status_error(503)
+    assert policy.delay(2, error) == 2.0
+    assert policy.delay(3, error) is None
+    assert RetryPolicy(max_attempts=1).delay(1, error) is None
+
+
+def test_retry_after_seconds() -> None:
+    policy = RetryPolicy(max_backoff=30.0)
+    assert policy.delay(1, _status_error(429, "12")) == 12.0
+    assert policy.delay(1, _status_error(503, "0")) == 0.0
+    # Longer than the policy is willing to wait
+    assert policy.delay(1, _status_error(503, "31")) is None
+
+
+def test_retry_after_http_date() -> None:
+    policy = RetryPolicy(max_backoff=30.0)
+    soon = email.utils.formatdate(time.time() + 10, usegmt=True)
+    delay = policy.delay(1, _status_error(503, soon))
+    assert delay is not None and 8.0 <= delay <= 10.0
+    late = email.utils.formatdate(time.time() + 3600, usegmt=True)
+    assert policy.delay(1, _status_error(503, late)) is None
+    # A date in the past means right away
+    past = email.utils.formatdate(time.time() - 60, usegmt=True)
+    assert policy.delay(1, _status_error(503, past)) == 0.0
+
+
+def test_invalid_retry_after_uses_backoff() -> None:
+    policy = RetryPolicy(backoff=1.0, jitter=0.0)
+    assert policy.delay(1, _status_error(503, "soon")) == 1.0
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pbs_installer import RetryPolicy, _download, download
+
+from .conftest import FileServer
+
+DATA = os.urandom(4 * 1024 * 1024)
+CHECKSUM = hashlib.sha256(DATA).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def _fast_sampling(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Open the next connection before the first one is done
+    monkeypatch.setattr(_download, "SAMPLE_INTERVAL", 0.05)
+
+
+def test_segmented_download(file_server: Callable[[bytes], FileServer], tmp_path: Path) -> None:
+    server = file_server(DATA)
+    server.rate = 8 * 1024 * 1024
+    destination = tmp_path / "python.tar.gz"
+    with httpx.Client() as client:
+        result = download(
+            (f"{server.url}/python.tar.gz", CHECKSUM), destination, client, segments=4, cache_dir=""
+        )
+    assert result.attempts == 1
+    assert destination.read_bytes() == DATA
+    assert len(server.gets()) > 1
+    assert all(headers["range"].startswith("bytes=") for headers in server.gets())
+
+
+def test_stolen_range_without_partial_response(
+    file_server: Callable[[bytes], FileServer], tmp_path: Path
+) -> None:
+    server = file_server(DATA)
+    server.rate = 8 * 1024 * 1024
+    # The first request is honored, the range of the next connection is answered with 200
+    server.range_requests = 1
+    destination = tmp_path / "python.tar.gz"
+    with httpx.Client() as client:
+        result = download(
+            (f"{server.url}/python.tar.gz", CHECKSUM),
+            destination,
+            client,
+            segments=4,
+            cache_dir="",
+            retry=RetryPolicy(max_attempts=2, backoff=0.01),
+        )
+    # The retry continues over a single stream
+    assert destination.read_bytes() == DATA
+    assert result.attempts == 2
+    assert "stopped honoring range requests" in result.errors[0][1]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from pbs_installer import Session
+from pbs_installer._session import get_session
+
+
+def test_client_created_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    created: list[httpx.Client] = []
+    client_class = httpx.Client
+
+    def slow_client(**options: Any) -> httpx.Client:
+        # Leave the other threads time to race for the client
+        time.sleep(0.05)
+        client = client_class(**options)
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(httpx, "Client", slow_client)
+    with Session() as session, ThreadPoolExecutor(8) as executor:
+        clients = list(executor.map(lambda _: session.client, range(8)))
+        assert len(created) == 1
+        assert all(client is created[0] for client in clients)
+    assert created[0].is_closed
+
+
+def test_get_session_shared() -> None:
+    with ThreadPoolExecutor(8) as executor:
+        sessions = list(executor.map(lambda _: get_session(), range(8)))
+    assert all(session is sessions[0] for session in sessions)
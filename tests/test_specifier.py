@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import sys
+from typing import Literal
+
+import pytest
+
+from pbs_installer import PythonVersion, VersionSpecifier, iter_download_links
+from pbs_installer._index import get_index
+
+
+def _version(version: str) -> PythonVersion:
+    implementation, _, release = version.rpartition("@")
+    major, minor, micro = (int(part) for part in release.rstrip("t").split("."))
+    return PythonVersion(implementation or "cpython", major, minor, micro, release.endswith("t"))
+
+
+@pytest.mark.parametrize(
+    "request_, clauses",
+    [
+        (">=3.10", ((">=", (3, 10), False),)),
+        ("<3.13", (("<", (3, 13), False),)),
+        ("==3.12.*", (("==", (3, 12), True),)),
+        ("~=3.12.2", (("~=", (3, 12, 2), False),)),
+        (
+            ">=3.10, <3.13,!=3.11.*",
+            ((">=", (3, 10), False), ("<", (3, 13), False), ("!=", (3, 11), True)),
+        ),
+    ],
+)
+def test_parse(request_: str, clauses: tuple[tuple[str, tuple[int, ...], bool], ...]) -> None:
+    assert VersionSpecifier.parse(request_) == VersionSpecifier("cpython", clauses)
+
+
+def test_parse_implementation_and_freethreaded() -> None:
+    specifier = VersionSpecifier.parse("pypy@>=3.10")
+    assert (specifier.implementation, specifier.freethreaded) == ("pypy", False)
+    specifier = VersionSpecifier.parse(">=3.13t")
+    assert (specifier.implementation, specifier.freethreaded) == ("cpython", True)
+    assert str(specifier) == "cpython@>=3.13t"
+
+
+@pytest.mark.parametrize("request_", [">=3.10.*", "~=3", "=>3.10", ">=3.10,", "3.10"])
+def test_parse_invalid(request_: str) -> None:
+    with pytest.raises(ValueError, match="Invalid version specifier"):
+        VersionSpecifier.parse(request_)
+
+
+@pytest.mark.parametrize(
+    "request_, version, contained",
+    [
+        (">=3.10", "3.10.0", True),
+        (">=3.10", "3.9.18", False),
+        ("<3.13", "3.12.9", True),
+        ("<3.13", "3.13.0", False),
+        ("==3.12.*", "3.12.4", True),
+        ("==3.12.*", "3.13.0", False),
+        ("==3.12", "3.12.0", True),
+        ("==3.12", "3.12.1", False),
+        ("~=3.12.2", "3.12.9", True),
+        ("~=3.12.2", "3.12.1", False),
+        ("~=3.12.2", "3.13.0", False),
+        ("~=3.12", "3.14.0", True),
+        (">=3.10,<3.13,!=3.11.*", "3.12.1", True),
+        (">=3.10,<3.13,!=3.11.*", "3.11.8", False),
+        (">=3.10,<3.13,!=3.11.*", "3.13.1", False),
+        (">=3.13", "3.13.1t", False),
+        (">=3.13t", "3.13.1t", True),
+        (">=3.10", "pypy@3.10.14", False),
+        ("pypy@>=3.10", "pypy@3.10.14", True),
+    ],
+)
+def test_contains(request_: str, version: str, contained: bool) -> None:
+    assert VersionSpecifier.parse(request_).contains(_version(version)) is contained
+
+
+@pytest.mark.parametrize(
+    "request_, bounds",
+    [
+        (">=3.10,<3.13", ((3, 10, 0), (3, 13, 0))),
+        ("==3.12.*", ((3, 12, 0), (3, 13, 0))),
+        ("==3.11.4", ((3, 11, 4), (3, 11, 5))),
+        ("~=3.12.2", ((3, 12, 2), (3, 13, 0))),
+        ("~=3.12", ((3, 12, 0), (4, 0, 0))),
+        (">3.12.1", ((3, 12, 2), (sys.maxsize, 0, 0))),
+        ("<=3.11", ((0, 0, 0), (3, 11, 1))),
+        (">=3.10,!=3.11.*,<3.12", ((3, 10, 0), (3, 12, 0))),
+    ],
+)
+def test_bounds(request_: str, bounds: tuple[tuple[int, int, int], tuple[int, int, int]]) -> None:
+    assert VersionSpecifier.parse(request_).bounds() == bounds
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [">=3.10,<3.13", "==3.12.*", "~=3.11.2", "!=3.12.*,>3.9", ">=3.13t", "pypy@>=3.9", "<3.6"],
+)
+@pytest.mark.parametrize("order", ["newest", "oldest"])
+@pytest.mark.parametrize("platform, arch", [("linux", "x86_64"), ("windows", "x86")])
+def test_iter_download_links_brute_force(
+    request_: str, order: Literal["newest", "oldest"], platform: str, arch: str
+) -> None:
+    specifier = VersionSpecifier.parse(request_)
+    # Every release in the table with a build for the target, in the requested order,
+    # with its install-only build if there is one
+    expected = sorted(
+        (
+            (version, files.get((platform, arch, True)) or files[platform, arch, False])
+            for version, files in get_index().to_dict().items()
+            if specifier.contains(version)
+            and ((platform, arch, True) in files or (platform, arch, False) in files)
+        ),
+        key=lambda item: item[0],
+        reverse=order == "newest",
+    )
+    assert list(iter_download_links(specifier, arch, platform, order=order)) == expected
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import tarfile
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import httpx
+import pytest
+
+from pbs_installer import RetryPolicy, _install, install
+from pbs_installer._stream import STAGING_PREFIX, StreamingExtractor, _merge_tree
+from pbs_installer._utils import PythonVersion
+
+from .conftest import FileServer
+
+FILENAME = "cpython-3.12.0+20240107-x86_64-unknown-linux-gnu-install_only.tar.gz"
+PATH = f"/releases/download/20240107/{FILENAME}"
+
+
+def _archive(contents: bytes) -> bytes:
+    """An uncompressed archive, so that different contents of one size give the same size."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tf:
+        for name in ("python/bin/python3", "python/lib/python3.12/os.py"):
+            info = tarfile.TarInfo(name)
+            info.size = len(contents)
+            tf.addfile(info, io.BytesIO(contents))
+    return buffer.getvalue()
+
+
+DATA = _archive(b"good" * 64 * 1024)
+
+
+@pytest.fixture
+def extracted_files(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """The archives extracted after the download, instead of while downloading."""
+    extracted: list[str] = []
+    install_file = _install.install_file
+
+    def record(filename: str, *args: object) -> None:
+        extracted.append(filename)
+        install_file(filename, *args)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(_install, "install_file", record)
+    return extracted
+
+
+def _stream_install(
+    monkeypatch: pytest.MonkeyPatch, url: str, destination: Path, mirrors: Sequence[str] = ()
+) -> None:
+    version = PythonVersion("cpython", 3, 12, 0)
+    python_file = (url, hashlib.sha256(DATA).hexdigest())
+    monkeypatch.setattr(
+        _install, "get_download_link", lambda *args, **kwargs: (version, python_file)
+    )
+    with httpx.Client() as client:
+        install(
+            "3.12",
+            destination,
+            client=client,
+            cache_dir="",
+            mirrors=mirrors,
+            retry=RetryPolicy(max_attempts=1),
+            stream=True,
+        )
+
+
+def _installed(destination: Path) -> dict[str, bytes]:
+    return {
+        p.relative_to(destination).as_posix(): p.read_bytes()
+        for p in destination.rglob("*")
+        if p.is_file()
+    }
+
+
+def test_stream_install(
+    file_server: Callable[[bytes], FileServer],
+    monkeypatch: pytest.MonkeyPatch,
+    extracted_files: list[str],
+    tmp_path: Path,
+) -> None:
+    server = file_server(DATA)
+    destination = tmp_path / "python"
+    # Left behind by an interrupted install
+    (destination / f"{STAGING_PREFIX}stale" / "bin").mkdir(parents=True)
+    _stream_install(monkeypatch, f"{server.url}{PATH}", destination)
+    assert _installed(destination) == {
+        "bin/python3": b"good" * 64 * 1024,
+        "lib/python3.12/os.py": b"good" * 64 * 1024,
+    }
+    assert sorted(os.listdir(destination)) == ["bin", "lib"]
+    assert extracted_files == []
+    assert len(server.gets()) == 1
+
+
+def test_stream_install_checksum_mismatch(
+    file_server: Callable[[bytes], FileServer],
+    monkeypatch: pytest.MonkeyPatch,
+    extracted_files: list[str],
+    tmp_path: Path,
+) -> None:
+    origin = file_server(DATA)
+    mirror = file_server(_archive(b"evil" * 64 * 1024))
+    # The origin answers the latency probe slower, so the bad mirror is streamed first
+    origin.head_delay = 0.3
+    destination = tmp_path / "python"
+    _stream_install(
+        monkeypatch, f"{origin.url}{PATH}", destination, mirrors=[f"{origin.url}/={mirror.url}/"]
+    )
+    # The tree extracted from the mirror is discarded, the origin's download is extracted
+    assert _installed(destination) == {
+        "bin/python3": b"good" * 64 * 1024,
+        "lib/python3.12/os.py": b"good" * 64 * 1024,
+    }
+    assert sorted(os.listdir(destination)) == ["bin", "lib"]
+    assert len(extracted_files) == 1
+    assert len(mirror.gets()) == len(origin.gets()) == 1
+
+
+def test_stream_hardlink_to_skipped_file_falls_back(tmp_path: Path) -> None:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tf:
+        target = tarfile.TarInfo("python/lib/python3.12/test/data.bin")
+        target.size = 4
+        tf.addfile(target, io.BytesIO(b"data"))
+        link = tarfile.TarInfo("python/lib/python3.12/data.bin")
+        link.type = tarfile.LNKTYPE
+        link.linkname = target.name
+        tf.addfile(link)
+    data = buffer.getvalue()
+    extractor = StreamingExtractor(
+        str(tmp_path), hashlib.sha256(data).hexdigest(), skip=lambda name: "/test/" in name
+    )
+    extractor.feed(0, data)
+    # The stream can't go back to the data of the target, the download is extracted instead
+    assert not extractor.finish()
+    assert type(extractor.error).__name__ == "StreamError"
+    extractor.discard()
+    assert os.listdir(tmp_path) == []
+
+
+def test_merge_tree_replaces_conflicting_entries(tmp_path: Path) -> None:
+    source, destination = tmp_path / "source", tmp_path / "destination"
+    (source / "was_file").mkdir(parents=True)
+    (source / "was_file" / "child").write_text("new")
+    (source / "was_dir").write_text("new")
+    (source / "kept").mkdir()
+    (source / "kept" / "file").write_text("new")
+    (destination / "was_dir" / "nested").mkdir(parents=True)
+    (destination / "was_file").write_text("old")
+    (destination / "kept").mkdir()
+    (destination / "kept" / "other").write_text("old")
+    _merge_tree(str(source), str(destination))
+    assert not source.exists()
+    assert _installed(destination) == {
+        "was_file/child": b"new",
+        "was_dir": b"new",
+        "kept/file": b"new",
+        "kept/other": b"old",
+    }